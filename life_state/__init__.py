@@ -15,11 +15,11 @@ from .world import initialize_world, create_sample_actor
 from .tick_engine import advance_world, get_world_summary
 
 # Prompt 2 additions
-from .actions import Action, get_available_actions, apply_action
+from .actions import Action, Presence, get_available_actions, get_available_actions_batch, apply_action
 from .probability import choose_action, mood_factor, hunger_factor, fatigue_factor
 from .time_jump import WorldManager, gateway_open, fork_world
 from .calendar_scheduler import override_state
-from .simulator import run, run_parallel_simulation, SimulationMetrics, SimulationLogger
+from .simulator import run, run_parallel_simulation, run_independent_worlds, SimulationMetrics, SimulationLogger
 
 __all__ = [
     # Core models and states
@@ -39,7 +39,9 @@ __all__ = [
     
     # Actions and probability (Prompt 2)
     "Action",
+    "Presence",
     "get_available_actions",
+    "get_available_actions_batch",
     "apply_action",
     "choose_action",
     "mood_factor",
@@ -57,6 +59,7 @@ __all__ = [
     # Simulation (Prompt 2)
     "run",
     "run_parallel_simulation",
+    "run_independent_worlds",
     "SimulationMetrics",
     "SimulationLogger",
 ]
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Numeric kernels for the simulation hot loops.
+
+Kernels are compiled with numba when it is installed. numba is optional:
+without it the decorators below are no-ops and callers should prefer their
+NumPy paths, since the kernels then run as plain Python loops.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels then run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True)
+def tick_update(hunger, fatigue, mood, hunger_delta, fatigue_delta, mood_delta):
+    """
+    Apply scalar resource deltas in place, clamping like Actor.update_resources.
+    
+    Args:
+        hunger: Hunger column (float64, modified in place)
+        fatigue: Fatigue column (float64, modified in place)
+        mood: Mood column (float64, modified in place)
+        hunger_delta: Hunger change for every actor
+        fatigue_delta: Fatigue change for every actor
+        mood_delta: Mood change for every actor
+    """
+    for i in prange(hunger.shape[0]):
+        hunger[i] = max(0.0, min(100.0, hunger[i] + hunger_delta))
+        fatigue[i] = max(0.0, min(100.0, fatigue[i] + fatigue_delta))
+        mood[i] = max(-2.0, min(2.0, mood[i] + mood_delta))
+
+
+@njit(parallel=True, cache=True)
+def add_clamped(column, delta, low, high):
+    """
+    Add a scalar delta to a column in place, clamping to [low, high].
+    
+    Args:
+        column: Resource column (float64, modified in place)
+        delta: Change for every row
+        low: Lower bound
+        high: Upper bound
+    """
+    for i in prange(column.shape[0]):
+        column[i] = max(low, min(high, column[i] + delta))
+
+
+@njit(parallel=True, cache=True)
+def compute_force_idle(fatigue, hunger, mood, cash, required_ids,
+                       hunger_exempt, low_mood_blocked, no_cash_blocked, out):
+    """
+    Evaluate the calendar emergency overrides for each scheduled actor.
+    
+    Args:
+        fatigue: Fatigue column (float64)
+        hunger: Hunger column (float64)
+        mood: Mood column (float64)
+        cash: Cash column (float64)
+        required_ids: Required State value per actor (intp)
+        hunger_exempt: Bool per State value, states kept despite extreme hunger
+        low_mood_blocked: Bool per State value, states dropped at very low mood
+        no_cash_blocked: Bool per State value, states dropped without cash
+        out: Bool column set to whether each actor is forced idle
+    """
+    for i in prange(fatigue.shape[0]):
+        state = required_ids[i]
+        out[i] = (
+            fatigue[i] >= 95
+            or (hunger[i] >= 90 and not hunger_exempt[state])
+            or (mood[i] <= -1.8 and low_mood_blocked[state])
+            or (cash[i] <= 0 and no_cash_blocked[state])
+        )
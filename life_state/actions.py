@@ -5,27 +5,104 @@ Defines all possible actor actions with their requirements, effects, and probabi
 Integrates with the state transition system and probability engine.
 """
 
-from typing import Dict, Any, List, Optional, Literal
-from pydantic import BaseModel, Field
-from enum import Enum, auto
+import logging
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from enum import IntEnum
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 
-from .states import State
+import numpy as np
 
+from ._kernels import NUMBA_AVAILABLE, njit
+from .states import State, is_core_state
+from .models import LOCATION_IDS, LOCATION_INDEX, UNKNOWN_LOCATION_INDEX, location_index
 
-class Action(BaseModel):
-    """Complete action data structure with all requirements and effects."""
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Bitmask admitting every location handle, including the unknown slot
+_ANY_LOCATION_MASK = (1 << (UNKNOWN_LOCATION_INDEX + 1)) - 1
+
+# Shared location requirement sets; many actions repeat the same locations
+_LOC_REQ_INTERN: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+
+class Presence(IntEnum):
+    """Who must be present for an action to take place."""
+    Self = 0       # The actor alone
+    Any = 1        # Any other actor
+    Specific = 2   # A particular other actor
+
+
+@dataclass(frozen=True, slots=True)
+class Action:
+    """
+    Complete action data structure with all requirements and effects.
+    
+    Actions are immutable module-level constants that are only read on the
+    hot path, so they are plain frozen dataclasses rather than Pydantic
+    models. The catalogue is validated once at import (see bottom of module).
+    """
+    
+    name: str                                          # Human-readable name of the action
+    resulting_state: State                             # State the actor will be in after this action
+    duration_ticks: int = 1                            # How many ticks this action takes
+    location_req: Optional[List[str]] = None           # Allowed current locations (None = any)
+    next_location: Optional[str] = None                # Where actor ends up (None = unchanged)
+    hunger_delta: int = 0                              # Change in hunger level
+    fatigue_delta: int = 0                             # Change in fatigue level
+    cash_delta: float = 0.0                            # Change in cash amount
+    allowed_moods: tuple[int, int] = (-2, 2)           # Mood range required for this action
+    requires_presence: Presence = Presence.Self        # Presence requirement
+    weight: float = 1.0                                # Base probability weight
+    
+    # Substate recorded on actors performing this action
+    substate_tag: str = field(init=False, repr=False, compare=False)
+    
+    # Derived at construction for O(1) location checks
+    _loc_req_set: Optional[FrozenSet[str]] = field(init=False, repr=False, compare=False)
+    _loc_mask: int = field(init=False, repr=False, compare=False)
+    
+    # Resource bounds under which the deltas keep hunger/fatigue in [0, 100]
+    # and cash non-negative, so checks are plain compares with no addition
+    _min_hunger: float = field(init=False, repr=False, compare=False)
+    _max_hunger: float = field(init=False, repr=False, compare=False)
+    _min_fatigue: float = field(init=False, repr=False, compare=False)
+    _max_fatigue: float = field(init=False, repr=False, compare=False)
+    _min_cash: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        action_name_clean = self.name.lower().replace(' ', '_').replace('-', '_')
+        object.__setattr__(self, "substate_tag", f"action_{action_name_clean}")
+        
+        if self.location_req is None:
+            loc_req_set, loc_mask = None, _ANY_LOCATION_MASK
+        else:
+            loc_req_set = frozenset(self.location_req)
+            loc_req_set = _LOC_REQ_INTERN.setdefault(loc_req_set, loc_req_set)
+            loc_mask = 0
+            for loc_id in loc_req_set:
+                if loc_id in LOCATION_INDEX:
+                    loc_mask |= 1 << LOCATION_INDEX[loc_id]
+        object.__setattr__(self, "_loc_req_set", loc_req_set)
+        object.__setattr__(self, "_loc_mask", loc_mask)
+        object.__setattr__(self, "_min_hunger", -self.hunger_delta)
+        object.__setattr__(self, "_max_hunger", 100 - self.hunger_delta)
+        object.__setattr__(self, "_min_fatigue", -self.fatigue_delta)
+        object.__setattr__(self, "_max_fatigue", 100 - self.fatigue_delta)
+        object.__setattr__(self, "_min_cash", -self.cash_delta)
     
-    name: str = Field(description="Human-readable name of the action")
-    resulting_state: State = Field(description="State the actor will be in after this action")
-    duration_ticks: int = Field(default=1, description="How many ticks this action takes")
-    location_req: Optional[List[str]] = Field(default=None, description="Allowed current locations (None = any)")
-    next_location: Optional[str] = Field(default=None, description="Where actor ends up (None = unchanged)")
-    hunger_delta: int = Field(default=0, description="Change in hunger level")
-    fatigue_delta: int = Field(default=0, description="Change in fatigue level")
-    cash_delta: float = Field(default=0.0, description="Change in cash amount")
-    allowed_moods: tuple[int, int] = Field(default=(-2, 2), description="Mood range required for this action")
-    requires_presence: Literal["Self", "Any", "Specific"] = Field(default="Self", description="Presence requirement")
-    weight: float = Field(default=1.0, description="Base probability weight")
+    def resources_allow(self, hunger: float, fatigue: float, cash: float) -> bool:
+        """Check that applying this action keeps the given resources in bounds."""
+        return (self._min_hunger <= hunger <= self._max_hunger
+                and self._min_fatigue <= fatigue <= self._max_fatigue
+                and cash >= self._min_cash)
+    
+    def allowed_at(self, location_id: str) -> bool:
+        """Check whether this action may be taken at the given location."""
+        return (self._loc_mask >> location_index(location_id)) & 1 == 1
 
 
 # ============================================================================
@@ -199,7 +276,7 @@ MEET_COLLEAGUE = Action(
     location_req=["public_office", "public_coffee_shop"],
     fatigue_delta=3,
     hunger_delta=2,
-    requires_presence="Any",
+    requires_presence=Presence.Any,
     allowed_moods=(-1, 2),
     weight=1.5
 )
@@ -210,7 +287,7 @@ CHAT_WITH_FRIEND = Action(
     duration_ticks=2,
     location_req=["public_coffee_shop", "public_bar", "public_park"],
     fatigue_delta=1,
-    requires_presence="Any",
+    requires_presence=Presence.Any,
     allowed_moods=(0, 2),
     weight=1.8
 )
@@ -223,7 +300,7 @@ ATTEND_SOCIAL_EVENT = Action(
     fatigue_delta=6,
     hunger_delta=3,
     cash_delta=-20.0,
-    requires_presence="Any",
+    requires_presence=Presence.Any,
     allowed_moods=(0, 2),
     weight=1.2
 )
@@ -236,7 +313,7 @@ NETWORK_EVENT = Action(
     fatigue_delta=5,
     hunger_delta=2,
     cash_delta=-10.0,
-    requires_presence="Any",
+    requires_presence=Presence.Any,
     allowed_moods=(-1, 2),
     weight=1.0
 )
@@ -407,7 +484,7 @@ FORMAL_MEETING = Action(
     location_req=["public_office"],
     fatigue_delta=4,
     hunger_delta=3,
-    requires_presence="Any",
+    requires_presence=Presence.Any,
     allowed_moods=(-1, 2),
     weight=1.8
 )
@@ -419,7 +496,7 @@ TEAM_MEETING = Action(
     location_req=["public_office"],
     fatigue_delta=3,
     hunger_delta=2,
-    requires_presence="Any",
+    requires_presence=Presence.Any,
     weight=1.6
 )
 
@@ -431,7 +508,7 @@ CLIENT_MEETING = Action(
     fatigue_delta=6,
     hunger_delta=4,
     cash_delta=-30.0,
-    requires_presence="Specific",
+    requires_presence=Presence.Specific,
     allowed_moods=(0, 2),
     weight=1.4
 )
@@ -574,41 +651,290 @@ ALL_ACTIONS: List[Action] = CORE_ACTIONS + EXTENDED_ACTIONS
 
 # Create lookup dictionaries for efficient access
 ACTIONS_BY_NAME: Dict[str, Action] = {action.name: action for action in ALL_ACTIONS}
-ACTIONS_BY_STATE: Dict[State, List[Action]] = {}
+_actions_by_state: Dict[State, List[Action]] = {}
 
 # Populate state lookup
 for action in ALL_ACTIONS:
-    if action.resulting_state not in ACTIONS_BY_STATE:
-        ACTIONS_BY_STATE[action.resulting_state] = []
-    ACTIONS_BY_STATE[action.resulting_state].append(action)
+    if action.resulting_state not in _actions_by_state:
+        _actions_by_state[action.resulting_state] = []
+    _actions_by_state[action.resulting_state].append(action)
 
 # Create core actions registry (only actions for implemented states)
-CORE_ACTIONS_BY_STATE: Dict[State, List[Action]] = {}
+_core_actions_by_state: Dict[State, List[Action]] = {}
 for action in CORE_ACTIONS:
-    if action.resulting_state not in CORE_ACTIONS_BY_STATE:
-        CORE_ACTIONS_BY_STATE[action.resulting_state] = []
-    CORE_ACTIONS_BY_STATE[action.resulting_state].append(action)
+    if action.resulting_state not in _core_actions_by_state:
+        _core_actions_by_state[action.resulting_state] = []
+    _core_actions_by_state[action.resulting_state].append(action)
+
+# Freeze the per-state lists; they are only read after import
+ACTIONS_BY_STATE: Dict[State, Tuple[Action, ...]] = {
+    state: tuple(state_actions) for state, state_actions in _actions_by_state.items()
+}
+CORE_ACTIONS_BY_STATE: Dict[State, Tuple[Action, ...]] = {
+    state: tuple(state_actions) for state, state_actions in _core_actions_by_state.items()
+}
+del _actions_by_state, _core_actions_by_state
+
+# Category registry, built once (see get_action_registry)
+_ACTION_REGISTRY: Dict[str, List[Action]] = {
+    'core': CORE_ACTIONS,
+    'commuting': [COMMUTE_BY_CAR, COMMUTE_WALKING, TAKE_BUS, RETURN_HOME_CAR],
+    'social': [MEET_COLLEAGUE, CHAT_WITH_FRIEND, ATTEND_SOCIAL_EVENT, NETWORK_EVENT],
+    'exercise': [GYM_WORKOUT, JOG_IN_PARK, HOME_EXERCISE, WALK_FOR_EXERCISE],
+    'leisure': [WATCH_MOVIE, READ_BOOK, BROWSE_LIBRARY, RELAX_AT_HOME, ENJOY_PARK],
+    'shopping': [GROCERY_SHOPPING, MALL_SHOPPING, QUICK_SHOPPING, WINDOW_SHOPPING],
+    'meetings': [FORMAL_MEETING, TEAM_MEETING, CLIENT_MEETING, VIRTUAL_MEETING],
+    'movement': [GO_TO_COFFEE_SHOP, GO_TO_RESTAURANT, GO_TO_MALL, GO_TO_GYM,
+                GO_TO_LIBRARY, GO_TO_CLINIC, GO_TO_GATEWAY],
+    'special': [TIME_JUMP]
+}
+
+# ============================================================================
+# STRUCTURE-OF-ARRAYS VIEW
+# ============================================================================
+
+# Parallel per-action attribute arrays, indexed like ALL_ACTIONS, so that the
+# admissibility filter is a handful of vectorized comparisons instead of a
+# Python loop over every action.
+_hunger_delta = np.array([a.hunger_delta for a in ALL_ACTIONS], dtype=np.int16)
+_fatigue_delta = np.array([a.fatigue_delta for a in ALL_ACTIONS], dtype=np.int16)
+_cash_delta = np.array([a.cash_delta for a in ALL_ACTIONS], dtype=np.float64)
+_min_hunger_arr = np.array([a._min_hunger for a in ALL_ACTIONS], dtype=np.float64)
+_max_hunger_arr = np.array([a._max_hunger for a in ALL_ACTIONS], dtype=np.float64)
+_min_fatigue_arr = np.array([a._min_fatigue for a in ALL_ACTIONS], dtype=np.float64)
+_max_fatigue_arr = np.array([a._max_fatigue for a in ALL_ACTIONS], dtype=np.float64)
+_min_cash_arr = np.array([a._min_cash for a in ALL_ACTIONS], dtype=np.float64)
+_mood_lo = np.array([a.allowed_moods[0] for a in ALL_ACTIONS], dtype=np.int8)
+_mood_hi = np.array([a.allowed_moods[1] for a in ALL_ACTIONS], dtype=np.int8)
+_weight = np.array([a.weight for a in ALL_ACTIONS], dtype=np.float64)
+_duration = np.array([a.duration_ticks for a in ALL_ACTIONS], dtype=np.int16)
+_resulting_state_idx = np.array([a.resulting_state.value for a in ALL_ACTIONS], dtype=np.int8)
+
+# Registry statistics, built once (see get_action_statistics)
+_ACTION_STATISTICS: Dict[str, Any] = {
+    'total_actions': len(ALL_ACTIONS),
+    'core_actions': len(CORE_ACTIONS),
+    'extended_actions': len(EXTENDED_ACTIONS),
+    'actions_by_category': {cat: len(actions) for cat, actions in _ACTION_REGISTRY.items()},
+    'actions_by_state': {state.name: len(actions) for state, actions in ACTIONS_BY_STATE.items()},
+    'average_duration': float(_duration.mean()),
+    'average_weight': float(_weight.mean())
+}
+
+# Core-only pool: the CORE_ACTIONS prefix of ALL_ACTIONS restricted to implemented states
+_core_only_mask = np.array(
+    [i < len(CORE_ACTIONS) and is_core_state(a.resulting_state) for i, a in enumerate(ALL_ACTIONS)],
+    dtype=bool
+)
+
+# (n_actions, n_locations + 1) allowed-location matrix; the extra trailing
+# column stands for any unregistered location, where only unrestricted
+# actions are allowed.
+_allowed_loc_mask = np.array(
+    [[(a._loc_mask >> loc) & 1 for loc in range(len(LOCATION_IDS) + 1)] for a in ALL_ACTIONS],
+    dtype=bool
+)
+
+
+@njit(cache=True)
+def _filter_actions(mood, hunger, fatigue, cash, loc_id, mood_lo, mood_hi,
+                    min_hunger, max_hunger, min_fatigue, max_fatigue, min_cash, loc_mask):
+    """
+    Indices of admissible actions over the full structure-of-arrays view.
+    
+    Compiled with numba when available; get_available_actions only routes
+    through it in that case, since the interpreted loop is slower than the
+    precomputed-table path.
+    """
+    n = min_hunger.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    count = 0
+    for i in range(n):
+        if not loc_mask[i, loc_id]:
+            continue
+        if not (mood_lo[i] <= mood and mood <= mood_hi[i]):
+            continue
+        if not (min_hunger[i] <= hunger and hunger <= max_hunger[i]):
+            continue
+        if not (min_fatigue[i] <= fatigue and fatigue <= max_fatigue[i]):
+            continue
+        if not (cash >= min_cash[i]):
+            continue
+        out[count] = i
+        count += 1
+    return out[:count]
+
+
+# ============================================================================
+# PRECOMPUTED CANDIDATE TABLES
+# ============================================================================
+
+# Mood bounds on actions are integers, so the mood range [-2, 2] splits into
+# nine classes that every action treats uniformly: each integer mood and each
+# open interval between consecutive integers.
+_N_MOOD_BUCKETS = 9
+
+
+def _mood_bucket(mood: float) -> Optional[int]:
+    """Map a mood to its bucket (None if outside [-2, 2])."""
+    if not (-2 <= mood <= 2):
+        return None
+    floor = math.floor(mood)
+    return 2 * floor + 4 if mood == floor else 2 * floor + 5
+
+
+def _bucket_mood(bucket: int) -> float:
+    """Representative mood for a bucket."""
+    return bucket / 2 - 2
+
+
+def _static_candidates(loc: int, bucket: int, pool_mask: np.ndarray) -> np.ndarray:
+    """Indices of actions admitted by location, mood and pool alone."""
+    mood = _bucket_mood(bucket)
+    return np.flatnonzero(
+        _allowed_loc_mask[:, loc] & (_mood_lo <= mood) & (mood <= _mood_hi) & pool_mask
+    )
+
+
+# (core_only, location index, mood bucket) -> (actions, resource bound arrays
+# restricted to those actions); only the resource bounds remain to be checked
+# per call.
+_AVAILABLE_CANDIDATES: Dict[Tuple[bool, int, int], Tuple[Any, ...]] = {}
+
+# (core_only, target state, location index, mood bucket) -> candidate actions in registry order
+_FORCED_CANDIDATES: Dict[Tuple[bool, State, int, int], Tuple[Action, ...]] = {}
+
+for _core_only, _pool_mask in ((True, _core_only_mask), (False, np.ones(len(ALL_ACTIONS), dtype=bool))):
+    _by_state = CORE_ACTIONS_BY_STATE if _core_only else ACTIONS_BY_STATE
+    for _loc in range(len(LOCATION_IDS) + 1):
+        for _bucket in range(_N_MOOD_BUCKETS):
+            _idx = _static_candidates(_loc, _bucket, _pool_mask)
+            _AVAILABLE_CANDIDATES[(_core_only, _loc, _bucket)] = (
+                tuple(ALL_ACTIONS[i] for i in _idx),
+                _min_hunger_arr[_idx], _max_hunger_arr[_idx],
+                _min_fatigue_arr[_idx], _max_fatigue_arr[_idx], _min_cash_arr[_idx]
+            )
+            _mood = _bucket_mood(_bucket)
+            _loc_bit = 1 << _loc
+            for _state, _actions in _by_state.items():
+                _FORCED_CANDIDATES[(_core_only, _state, _loc, _bucket)] = tuple(
+                    a for a in _actions
+                    if a._loc_mask & _loc_bit and a.allowed_moods[0] <= _mood <= a.allowed_moods[1]
+                )
+del _core_only, _pool_mask, _by_state, _loc, _bucket, _idx, _mood, _loc_bit, _state, _actions
+
+
+# Resource checks compare each value against fixed per-action bounds, so the real line splits into classes on which
+# every check agrees: each threshold itself and each open interval between
+# consecutive thresholds. Keying the availability cache on these classes is
+# exact, unlike rounding resources into coarse buckets.
+_HUNGER_BREAKS: Tuple[float, ...] = tuple(sorted(
+    set(_min_hunger_arr.tolist()) | set(_max_hunger_arr.tolist())
+))
+_FATIGUE_BREAKS: Tuple[float, ...] = tuple(sorted(
+    set(_min_fatigue_arr.tolist()) | set(_max_fatigue_arr.tolist())
+))
+_CASH_BREAKS: Tuple[float, ...] = tuple(sorted(set(_min_cash_arr.tolist())))
+
+
+def _value_class(breaks: Tuple[float, ...], value: float) -> int:
+    """Map a resource value to its threshold class (odd = on a threshold)."""
+    i = bisect_left(breaks, value)
+    if i < len(breaks) and breaks[i] == value:
+        return 2 * i + 1
+    return 2 * i
+
+
+def _class_value(breaks: Tuple[float, ...], cls: int) -> float:
+    """Representative resource value for a threshold class."""
+    i = cls // 2
+    if cls % 2:
+        return breaks[i]
+    if i == 0:
+        return breaks[0] - 1
+    if i == len(breaks):
+        return breaks[-1] + 1
+    return (breaks[i - 1] + breaks[i]) / 2
+
+
+def _generate_core_filter() -> str:
+    """
+    Generate source for an unrolled core-pool filter.
+    
+    The core pool is fixed at import, so each action becomes one straight-line
+    test with its bounds inlined as constants; location checks are emitted
+    only for actions that have a location requirement.
+    """
+    lines = [
+        "def _core_filter(mood, hunger, fatigue, cash, loc):",
+        "    out = []",
+    ]
+    for i, action in enumerate(CORE_ACTIONS):
+        if not is_core_state(action.resulting_state):
+            continue
+        tests = [
+            f"{action.allowed_moods[0]!r} <= mood <= {action.allowed_moods[1]!r}",
+            f"{float(action._min_hunger)!r} <= hunger <= {float(action._max_hunger)!r}",
+            f"{float(action._min_fatigue)!r} <= fatigue <= {float(action._max_fatigue)!r}",
+            f"cash >= {float(action._min_cash)!r}",
+        ]
+        if action.location_req is not None:
+            tests.append(f"({action._loc_mask} >> loc) & 1")
+        lines.append(f"    if {' and '.join(tests)}:")
+        lines.append(f"        out.append(_CORE[{i}])")
+    lines.append("    return tuple(out)")
+    return "\n".join(lines) + "\n"
+
+
+_core_namespace: Dict[str, Any] = {"_CORE": tuple(CORE_ACTIONS)}
+exec(compile(_generate_core_filter(), "<life_state.actions core filter>", "exec"), _core_namespace)
+_core_filter = _core_namespace["_core_filter"]
+del _core_namespace
+
+
+@lru_cache(maxsize=16384)
+def _cached_available(core_only: bool, loc: int, mood_bucket: int,
+                      hunger_cls: int, fatigue_cls: int, cash_cls: int) -> Tuple[Action, ...]:
+    """Available actions for one (location, mood, resource class) combination."""
+    hunger = _class_value(_HUNGER_BREAKS, hunger_cls)
+    fatigue = _class_value(_FATIGUE_BREAKS, fatigue_cls)
+    cash = _class_value(_CASH_BREAKS, cash_cls)
+    
+    if core_only:
+        return _core_filter(_bucket_mood(mood_bucket), hunger, fatigue, cash, loc)
+    
+    if NUMBA_AVAILABLE:
+        indices = _filter_actions(
+            _bucket_mood(mood_bucket), hunger, fatigue, cash, loc, _mood_lo, _mood_hi,
+            _min_hunger_arr, _max_hunger_arr, _min_fatigue_arr, _max_fatigue_arr, _min_cash_arr,
+            _allowed_loc_mask
+        )
+        return tuple(ALL_ACTIONS[i] for i in indices)
+    
+    # Location, mood and pool filtering is precomputed; check resource bounds only
+    actions, min_hunger, max_hunger, min_fatigue, max_fatigue, min_cash = \
+        _AVAILABLE_CANDIDATES[(core_only, loc, mood_bucket)]
+    
+    mask = (
+        (min_hunger <= hunger) & (hunger <= max_hunger)
+        & (min_fatigue <= fatigue) & (fatigue <= max_fatigue)
+        & (cash >= min_cash)
+    )
+    
+    return tuple(actions[i] for i in np.flatnonzero(mask))
 
 
 def get_action_registry() -> Dict[str, List[Action]]:
     """
     Get organized action registry by category.
     
+    The registry is built once at import; callers get the shared dict and
+    must not mutate it.
+    
     Returns:
         Dict mapping category names to action lists
     """
-    return {
-        'core': CORE_ACTIONS,
-        'commuting': [COMMUTE_BY_CAR, COMMUTE_WALKING, TAKE_BUS, RETURN_HOME_CAR],
-        'social': [MEET_COLLEAGUE, CHAT_WITH_FRIEND, ATTEND_SOCIAL_EVENT, NETWORK_EVENT],
-        'exercise': [GYM_WORKOUT, JOG_IN_PARK, HOME_EXERCISE, WALK_FOR_EXERCISE],
-        'leisure': [WATCH_MOVIE, READ_BOOK, BROWSE_LIBRARY, RELAX_AT_HOME, ENJOY_PARK],
-        'shopping': [GROCERY_SHOPPING, MALL_SHOPPING, QUICK_SHOPPING, WINDOW_SHOPPING],
-        'meetings': [FORMAL_MEETING, TEAM_MEETING, CLIENT_MEETING, VIRTUAL_MEETING],
-        'movement': [GO_TO_COFFEE_SHOP, GO_TO_RESTAURANT, GO_TO_MALL, GO_TO_GYM,
-                    GO_TO_LIBRARY, GO_TO_CLINIC, GO_TO_GATEWAY],
-        'special': [TIME_JUMP]
-    }
+    return _ACTION_REGISTRY
 
 
 def get_available_actions(actor, world_state, core_only: bool = True) -> List[Action]:
@@ -623,39 +949,60 @@ def get_available_actions(actor, world_state, core_only: bool = True) -> List[Ac
     Returns:
         List of actions the actor can perform
     """
-    available = []
-    action_pool = CORE_ACTIONS if core_only else ALL_ACTIONS
+    bucket = _mood_bucket(actor.mood)
+    if bucket is None:
+        return []
     
-    for action in action_pool:
-        # Check location requirements
-        if action.location_req is not None:
-            if actor.location_id not in action.location_req:
-                continue
-        
-        # Check mood requirements
-        if not (action.allowed_moods[0] <= actor.mood <= action.allowed_moods[1]):
-            continue
-        
-        # Check if resource deltas would push values out of bounds
-        new_hunger = actor.hunger + action.hunger_delta
-        new_fatigue = actor.fatigue + action.fatigue_delta
-        
-        if not (0 <= new_hunger <= 100) or not (0 <= new_fatigue <= 100):
-            continue
-        
-        # Check cash requirements
-        if actor.cash + action.cash_delta < 0:
-            continue
-        
-        # For core_only mode, skip actions that lead to unimplemented states
-        if core_only:
-            from .states import is_core_state
-            if not is_core_state(action.resulting_state):
-                continue
+    return list(_cached_available(
+        core_only,
+        location_index(actor.location_id),
+        bucket,
+        _value_class(_HUNGER_BREAKS, actor.hunger),
+        _value_class(_FATIGUE_BREAKS, actor.fatigue),
+        _value_class(_CASH_BREAKS, actor.cash),
+    ))
+
+
+def get_available_actions_batch(actors: List, core_only: bool = True) -> Dict[str, List[Action]]:
+    """
+    Get the available actions for many actors at once.
+    
+    Availability depends only on each actor's own mood, resources and
+    location, so the whole batch is evaluated as one (n_actors, n_actions)
+    boolean matrix. Results match get_available_actions for each actor.
+    
+    Args:
+        actors: The actors to get actions for
+        core_only: If True, only return core actions (Prompt 1 states)
         
-        available.append(action)
+    Returns:
+        Dict mapping actor id to the list of actions that actor can perform
+    """
+    if not actors:
+        return {}
+    
+    mood = np.array([actor.mood for actor in actors], dtype=np.float64)[:, None]
+    hunger = np.array([actor.hunger for actor in actors], dtype=np.float64)[:, None]
+    fatigue = np.array([actor.fatigue for actor in actors], dtype=np.float64)[:, None]
+    cash = np.array([actor.cash for actor in actors], dtype=np.float64)[:, None]
+    locations = np.array([location_index(actor.location_id) for actor in actors], dtype=np.intp)
+    
+    mask = (
+        _allowed_loc_mask[:, locations].T
+        & (_mood_lo <= mood) & (mood <= _mood_hi)
+        & (_min_hunger_arr <= hunger) & (hunger <= _max_hunger_arr)
+        & (_min_fatigue_arr <= fatigue) & (fatigue <= _max_fatigue_arr)
+        & (cash >= _min_cash_arr)
+    )
     
-    return available
+    # For core_only mode, restrict to core actions leading to implemented states
+    if core_only:
+        mask &= _core_only_mask
+    
+    return {
+        actor.id: [ALL_ACTIONS[i] for i in np.flatnonzero(row)]
+        for actor, row in zip(actors, mask)
+    }
 
 
 def lookup_forced(target_state: State, actor, core_only: bool = True) -> Optional[Action]:
@@ -670,31 +1017,21 @@ def lookup_forced(target_state: State, actor, core_only: bool = True) -> Optiona
     Returns:
         Action that leads to the target state, or None if not possible
     """
-    action_pool = CORE_ACTIONS_BY_STATE if core_only else ACTIONS_BY_STATE
-    possible_actions = action_pool.get(target_state, [])
+    bucket = _mood_bucket(actor.mood)
+    if bucket is None:
+        return None
+    
+    # Location and mood requirements are already applied to the candidates
+    possible_actions = _FORCED_CANDIDATES.get(
+        (core_only, target_state, location_index(actor.location_id), bucket), ()
+    )
+    
+    hunger, fatigue, cash = actor.hunger, actor.fatigue, actor.cash
     
     for action in possible_actions:
-        # Check basic requirements
-        if action.location_req is not None:
-            if actor.location_id not in action.location_req:
-                continue
-        
-        # Check mood requirements
-        if not (action.allowed_moods[0] <= actor.mood <= action.allowed_moods[1]):
-            continue
-        
-        # Check resource bounds
-        new_hunger = actor.hunger + action.hunger_delta
-        new_fatigue = actor.fatigue + action.fatigue_delta
-        
-        if not (0 <= new_hunger <= 100) or not (0 <= new_fatigue <= 100):
-            continue
-        
-        # Check cash
-        if actor.cash + action.cash_delta < 0:
-            continue
-        
-        return action
+        # Check resource and cash bounds
+        if action.resources_allow(hunger, fatigue, cash):
+            return action
     
     return None
 
@@ -703,6 +1040,10 @@ def apply_action(action: Action, actor, world_state) -> bool:
     """
     Apply an action's effects to an actor.
     
+    Callers must only apply actions admitted for the actor by
+    get_available_actions or lookup_forced; resource and cash bounds are not
+    re-checked here.
+    
     Args:
         action: The action to apply
         actor: The actor performing the action
@@ -711,51 +1052,34 @@ def apply_action(action: Action, actor, world_state) -> bool:
     Returns:
         bool: True if action was successfully applied
     """
-    try:
-        # Update actor state
-        old_state = actor.state
-        actor.state = action.resulting_state
-        
-        # Set descriptive substate
-        action_name_clean = action.name.lower().replace(' ', '_').replace('-', '_')
-        actor.substate = f"action_{action_name_clean}"
-        
-        # Update location if specified
-        if action.next_location is not None:
-            old_location = actor.location_id
-            actor.location_id = action.next_location
-            if old_location != action.next_location:
-                # Log location change for debugging
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.debug(f"Actor {actor.name} moved from {old_location} to {action.next_location}")
-        
-        # Apply resource changes with bounds checking
-        actor.update_resources(
-            hunger_delta=action.hunger_delta,
-            fatigue_delta=action.fatigue_delta,
-            mood_delta=0  # Mood changes handled separately for now
-        )
-        
-        # Update cash with bounds checking
-        new_cash = actor.cash + action.cash_delta
-        if new_cash < 0:
-            # This should have been caught earlier, but safety check
-            actor.cash = 0.0
-        else:
-            actor.cash = new_cash
-        
-        # Set action duration (subtract 1 because current tick counts)
-        actor.current_ticks_left = max(0, action.duration_ticks - 1)
-        
-        return True
-        
-    except Exception as e:
-        # Action failed - log error and don't change actor state
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to apply action {action.name} to actor {actor.name}: {e}")
-        return False
+    # Update actor state
+    actor.state = action.resulting_state
+    
+    # Set descriptive substate
+    actor.substate = action.substate_tag
+    
+    # Update location if specified
+    if action.next_location is not None:
+        old_location = actor.location_id
+        actor.location_id = action.next_location
+        if old_location != action.next_location and logger.isEnabledFor(logging.DEBUG):
+            # Log location change for debugging
+            logger.debug(f"Actor {actor.name} moved from {old_location} to {action.next_location}")
+    
+    # Apply resource changes with bounds checking
+    actor.update_resources(
+        hunger_delta=action.hunger_delta,
+        fatigue_delta=action.fatigue_delta,
+        mood_delta=0  # Mood changes handled separately for now
+    )
+    
+    # Admissible actions never overdraw cash
+    actor.cash += action.cash_delta
+    
+    # Set action duration (subtract 1 because current tick counts)
+    actor.current_ticks_left = max(0, action.duration_ticks - 1)
+    
+    return True
 
 
 def validate_action(action: Action) -> List[str]:
@@ -784,6 +1108,12 @@ def validate_action(action: Action) -> List[str]:
     if not (-2 <= action.allowed_moods[0] <= action.allowed_moods[1] <= 2):
         errors.append(f"Invalid mood range: {action.allowed_moods}")
     
+    # Location requirements must name registered locations
+    if action.location_req is not None:
+        unknown = [loc_id for loc_id in action.location_req if loc_id not in LOCATION_INDEX]
+        if unknown:
+            errors.append(f"Unknown required locations: {unknown}")
+    
     # Check resource deltas are reasonable
     if abs(action.hunger_delta) > 50:
         errors.append(f"Hunger delta seems excessive: {action.hunger_delta}")
@@ -798,19 +1128,18 @@ def get_action_statistics() -> Dict[str, Any]:
     """
     Get statistics about the action registry.
     
+    The catalogue is static, so the statistics are computed once at import;
+    callers get the shared dict and must not mutate it.
+    
     Returns:
         Dict containing action statistics
     """
-    registry = get_action_registry()
-    
-    stats = {
-        'total_actions': len(ALL_ACTIONS),
-        'core_actions': len(CORE_ACTIONS),
-        'extended_actions': len(EXTENDED_ACTIONS),
-        'actions_by_category': {cat: len(actions) for cat, actions in registry.items()},
-        'actions_by_state': {state.name: len(actions) for state, actions in ACTIONS_BY_STATE.items()},
-        'average_duration': sum(action.duration_ticks for action in ALL_ACTIONS) / len(ALL_ACTIONS),
-        'average_weight': sum(action.weight for action in ALL_ACTIONS) / len(ALL_ACTIONS)
-    }
-    
-    return stats
\ No newline at end of file
+    return _ACTION_STATISTICS
+
+
+# Validate the static catalogue once at import instead of per instance
+for _action in ALL_ACTIONS:
+    _errors = validate_action(_action)
+    if _errors:
+        raise ValueError(f"Invalid action definition {_action.name!r}: {'; '.join(_errors)}")
+del _action, _errors
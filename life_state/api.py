@@ -4,20 +4,25 @@ FastAPI backend for life_state simulation.
 Provides REST API endpoints and WebSocket connections for real-time simulation monitoring.
 """
 
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from datetime import datetime, timedelta
 import asyncio
 import json
+from collections import defaultdict
+import multiprocessing
+import queue
 from pathlib import Path
 
-from fastapi import FastAPI, WebSocket, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, WebSocket, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
 from .models import WorldState, Actor, Location, WorldClock
+from .columns import ActorColumns
 from .simulator import run, create_simulation_config, SimulationLogger, SimulationMetrics
 from .time_jump import WorldManager
 from . import initialize_world, create_sample_actor
@@ -49,6 +54,266 @@ class TickResponse(BaseModel):
     clock: str
     actors: List[ActorResponse]
     world_stats: WorldStatsResponse
+    full: bool = True           # False for WebSocket deltas carrying only changed actors
+    removed: List[str] = []     # Actor ids dropped since the previous message (deltas only)
+
+
+def diff_tick_data(data: Dict[str, Any],
+                   previous: Optional[Dict[str, tuple]]) -> Tuple[Dict[str, Any], Dict[str, tuple]]:
+    """
+    Reduce a full tick payload to the actors that changed since a snapshot.
+    
+    Args:
+        data: Full tick payload (build_tick_dict())
+        previous: Actor snapshot returned by the previous call, or None to
+            send the full payload
+    
+    Returns:
+        Tuple of (message to send, snapshot to pass to the next call)
+    """
+    snapshot = {actor["id"]: tuple(actor.values()) for actor in data["actors"]}
+    if previous is None:
+        return {**data, "full": True, "removed": []}, snapshot
+    
+    changed = [actor for actor in data["actors"] if previous.get(actor["id"]) != snapshot[actor["id"]]]
+    removed = [actor_id for actor_id in previous if actor_id not in snapshot]
+    message = {**data, "actors": changed, "full": False, "removed": removed}
+    return message, snapshot
+
+
+def encode_message(data: Dict[str, Any]) -> str:
+    """Encode a WebSocket message with orjson (sent as a text frame for the UI)."""
+    return orjson.dumps(data).decode()
+
+
+def compact_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a tick message to the compact WebSocket schema.
+    
+    Keys are shortened and each actor becomes a row
+    [id, name, state, location, hunger, fatigue, mood] whose state and
+    location are indexes into the message's own name tables, so repeated
+    strings are sent once per message.
+    
+    Args:
+        message: Tick message from diff_tick_data()
+    
+    Returns:
+        Dict with t (clock), a (actor rows), s (avg_hunger, avg_fatigue,
+        avg_mood, sleeping_cnt, worlds_alive), k (state names),
+        l (location names), f (full) and r (removed ids)
+    """
+    state_codes: Dict[str, int] = {}
+    location_codes: Dict[str, int] = {}
+    rows = []
+    for actor in message['actors']:
+        rows.append([
+            actor['id'],
+            actor['name'],
+            state_codes.setdefault(actor['state'], len(state_codes)),
+            location_codes.setdefault(actor['location'], len(location_codes)),
+            actor['hunger'],
+            actor['fatigue'],
+            actor['mood']
+        ])
+    
+    stats = message['world_stats']
+    return {
+        't': message['clock'],
+        'a': rows,
+        's': [stats['avg_hunger'], stats['avg_fatigue'], stats['avg_mood'],
+              stats['sleeping_cnt'], stats['worlds_alive']],
+        'k': list(state_codes),
+        'l': list(location_codes),
+        'f': message['full'],
+        'r': message['removed']
+    }
+
+
+def encode_for(websocket: WebSocket, message: Dict[str, Any]) -> str:
+    """Encode a tick message in the schema the subscriber asked for."""
+    if websocket in sim_manager.compact_connections:
+        return encode_message(compact_message(message))
+    return encode_message(message)
+
+
+# Number of WebSocket sends awaited concurrently during a broadcast
+BROADCAST_BATCH_SIZE = 50
+
+# Minimum seconds between broadcasts to a world (~10 Hz)
+BROADCAST_INTERVAL = 0.1
+
+
+# Location name reported for actors whose location_id is not in the world
+UNKNOWN_LOCATION_NAME = "Unknown"
+
+# Seconds between ticks of a running world
+TICK_INTERVAL = 0.1
+
+# Seconds the API process waits on a worker's queue before checking it is alive
+WORKER_POLL_TIMEOUT = 0.5
+
+
+def build_world_stats(world: WorldState, worlds_alive: int) -> Dict[str, Any]:
+    """Build the WorldStatsResponse fields for a world as plain data."""
+    totals = world.get_resource_totals()
+    n_actors = totals['n_actors']
+    if not n_actors:
+        return {
+            'avg_hunger': 0.0, 'avg_fatigue': 0.0, 'avg_mood': 0.0,
+            'sleeping_cnt': 0, 'worlds_alive': worlds_alive
+        }
+    
+    return {
+        'avg_hunger': totals['hunger'] / n_actors,
+        'avg_fatigue': totals['fatigue'] / n_actors,
+        'avg_mood': totals['mood'] / n_actors,
+        'sleeping_cnt': totals['sleeping'],
+        'worlds_alive': worlds_alive
+    }
+
+
+def build_tick_dict(world: WorldState, worlds_alive: int) -> Dict[str, Any]:
+    """
+    Build a full tick payload as plain data, without Pydantic models.
+    
+    Used on the WebSocket paths, which send every tick; the shape matches
+    TickResponse.model_dump() so REST and WebSocket clients see the same
+    fields.
+    
+    Args:
+        world: World to describe
+        worlds_alive: Value for world_stats.worlds_alive
+    
+    Returns:
+        Dict with clock, actors, world_stats, full and removed
+    """
+    # Resolve each location's name once rather than per actor
+    location_names = {location_id: location.name for location_id, location in world.locations.items()}
+    
+    # Convert actors to response format
+    actor_rows = []
+    for actor in world.actors.values():
+        actor_rows.append({
+            'id': actor.id,
+            'name': actor.name,
+            'state': actor.state.name,
+            'location': location_names.get(actor.location_id, UNKNOWN_LOCATION_NAME),
+            'hunger': actor.hunger,
+            'fatigue': actor.fatigue,
+            'mood': actor.mood
+        })
+    
+    return {
+        'clock': world.clock.current_time.isoformat() + "Z",
+        'actors': actor_rows,
+        'world_stats': build_world_stats(world, worlds_alive),
+        'full': True,
+        'removed': []
+    }
+
+
+def step_world(world: WorldState, columns: ActorColumns) -> ActorColumns:
+    """
+    Advance a world by one tick of the simplified API simulation.
+    
+    Args:
+        world: World to advance
+        columns: Resource columns from the previous tick
+    
+    Returns:
+        The columns to pass to the next call (regathered if actors changed)
+    """
+    world.clock.advance_tick()
+    
+    # Regather if actors were added or removed
+    if not columns.matches(world):
+        columns = ActorColumns.from_world(world)
+    
+    # Update actors (simplified for now) as one vectorized step
+    columns.apply_deltas(
+        hunger_delta=1.0,  # Hunger increases
+        fatigue_delta=0.5,  # Fatigue increases slowly
+        mood_delta=0.0     # Mood stays stable
+    )
+    columns.write_back()
+    return columns
+
+
+def _world_worker_main(world_id: str, world: WorldState, commands, updates, tick_interval: float) -> None:
+    """Run one world's tick loop in a worker process until stopped."""
+    # Run for 24 hours, measured in the clock's own timezone
+    end_time = datetime.now(world.clock.current_time.tzinfo) + timedelta(hours=24)
+    columns = ActorColumns.from_world(world)
+    
+    try:
+        while world.clock.current_time < end_time:
+            columns = step_world(world, columns)
+            updates.put((world_id, "tick", orjson.dumps(build_tick_dict(world, 0))))
+            
+            # Waiting for a command doubles as the delay between ticks
+            try:
+                if commands.get(timeout=tick_interval) == "stop":
+                    break
+            except queue.Empty:
+                pass
+    
+    except Exception as e:
+        print(f"Simulation error: {e}")
+    finally:
+        updates.put((world_id, "stopped", world))
+
+
+class WorldWorker:
+    """
+    Runs one world's simulation loop in its own process.
+    
+    The worker owns the world while it runs, so each world ticks on its own
+    interpreter instead of sharing the API process's GIL. It sends
+    (world_id, "tick", orjson bytes) for every tick and finally
+    (world_id, "stopped", world) so the API process can adopt the final
+    state. Workers may share one updates queue.
+    """
+    
+    def __init__(self, world_id: str, world: WorldState, updates=None,
+                 tick_interval: float = TICK_INTERVAL):
+        context = multiprocessing.get_context("spawn")
+        self.world_id = world_id
+        self.commands = context.Queue()
+        self.updates = updates if updates is not None else context.Queue()
+        self.process = context.Process(
+            target=_world_worker_main,
+            args=(world_id, world, self.commands, self.updates, tick_interval),
+            name=f"world-{world_id}",
+            daemon=True
+        )
+    
+    def start(self) -> None:
+        self.process.start()
+    
+    def stop(self) -> None:
+        """Ask the worker to finish its current tick and hand the world back."""
+        if self.process.is_alive():
+            self.commands.put("stop")
+    
+    def poll(self, timeout: float) -> Optional[Tuple[str, str, Any]]:
+        """
+        Wait for the next message on the worker's updates queue.
+        
+        Args:
+            timeout: Seconds to wait
+        
+        Returns:
+            (world_id, kind, body) tuple, or None if nothing arrived in time
+        """
+        return _poll_queue(self.updates, timeout)
+
+
+def _poll_queue(updates, timeout: float) -> Optional[Tuple[str, str, Any]]:
+    try:
+        return updates.get(timeout=timeout)
+    except queue.Empty:
+        return None
 
 
 # Global state management
@@ -56,75 +321,197 @@ class SimulationManager:
     def __init__(self):
         self.worlds: Dict[str, WorldState] = {}
         self.world_manager = WorldManager()
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-        self.simulation_running = False
+        self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
+        # Subscribers that asked for the compact schema (?compact=1)
+        self.compact_connections: Set[WebSocket] = set()
         self.tick_data: Dict[str, TickResponse] = {}
+        # Simulation worker process per running world and the newest tick each
+        # reported; all workers share one updates queue drained by one task
+        self.workers: Dict[str, WorldWorker] = {}
+        self.latest_tick: Dict[str, Dict[str, Any]] = {}
+        self._worker_updates = None
+        self._worker_pump: Optional[asyncio.Task] = None
+        # Latest unsent tick per world; the simulation overwrites it and the
+        # world's broadcaster task sends whatever is newest
+        self.pending_tick: Dict[str, Dict[str, Any]] = {}
+        self.broadcasters: Dict[str, asyncio.Task] = {}
+        # Actor snapshot of the last broadcast per world (None = next one is full)
+        self.last_snapshot: Dict[str, Dict[str, tuple]] = {}
+        # Locally built tick payload per world: (world, (tick_count, worlds), payload)
+        self._tick_cache: Dict[str, Tuple[WorldState, Tuple[int, int], Dict[str, Any]]] = {}
+        # Encoded GET /api/worlds body and the world count it was built for;
+        # rebuilt only after a world is added or removed
+        self._worlds_payload: Optional[bytes] = None
+        self._worlds_payload_count = 0
         
     def get_world(self, world_id: str) -> WorldState:
         if world_id not in self.worlds:
             # Initialize a new world
             world = initialize_world(world_id)
             self.worlds[world_id] = world
+            self._worlds_payload = None
         return self.worlds[world_id]
     
-    def get_world_stats(self, world: WorldState) -> WorldStatsResponse:
-        actors = list(world.actors.values())
-        if not actors:
-            return WorldStatsResponse(
-                avg_hunger=0, avg_fatigue=0, avg_mood=0,
-                sleeping_cnt=0, worlds_alive=len(self.worlds)
-            )
+    def get_worlds_payload(self) -> bytes:
+        """
+        Get the encoded world list, creating the default world if none exist.
         
-        avg_hunger = sum(a.hunger for a in actors) / len(actors)
-        avg_fatigue = sum(a.fatigue for a in actors) / len(actors)
-        avg_mood = sum(a.mood for a in actors) / len(actors)
-        sleeping_cnt = sum(1 for a in actors if a.state == State.Sleeping)
+        Returns:
+            JSON array of WorldResponse objects as bytes
+        """
+        if not self.worlds:
+            self.get_world("main")
         
-        return WorldStatsResponse(
-            avg_hunger=avg_hunger,
-            avg_fatigue=avg_fatigue,
-            avg_mood=avg_mood,
-            sleeping_cnt=sleeping_cnt,
-            worlds_alive=len(self.worlds)
-        )
+        if self._worlds_payload is None or self._worlds_payload_count != len(self.worlds):
+            # For now, all worlds have equal probability mass
+            self._worlds_payload = orjson.dumps([
+                {'world_id': world_id, 'prob_mass': 1.0} for world_id in self.worlds
+            ])
+            self._worlds_payload_count = len(self.worlds)
+        return self._worlds_payload
+    
+    def get_world_stats(self, world: WorldState) -> WorldStatsResponse:
+        return WorldStatsResponse(**build_world_stats(world, len(self.worlds)))
     
     def get_tick_data(self, world_id: str, tick_n: int) -> TickResponse:
+        return TickResponse.model_validate(self.get_tick_dict(world_id))
+    
+    def get_tick_dict(self, world_id: str) -> Dict[str, Any]:
+        """
+        Get the current full tick payload for a world as plain data.
+        
+        While a world's worker is running the world lives in the worker
+        process, so the newest tick it reported is returned instead.
+        """
+        latest = self.latest_tick.get(world_id)
+        if latest is not None:
+            return latest
+        return build_tick_dict(self.get_world(world_id), len(self.worlds))
+    
+    def get_tick_snapshot(self, world_id: str) -> Dict[str, Any]:
+        """
+        Get the full tick payload, rebuilt only when the world has moved on.
+        
+        All WebSocket subscribers share the returned dict, so a tick is
+        built once however many connections poll it; treat it as read-only.
+        The same object is returned until the world ticks, which lets
+        callers skip unchanged ticks with an identity check.
+        """
+        latest = self.latest_tick.get(world_id)
+        if latest is not None:
+            return latest
+        
         world = self.get_world(world_id)
+        key = (world.clock.tick_count, len(self.worlds))
+        cached = self._tick_cache.get(world_id)
+        if cached is not None and cached[0] is world and cached[1] == key:
+            return cached[2]
         
-        # Convert actors to response format
-        actor_responses = []
-        for actor in world.actors.values():
-            location_name = world.locations.get(actor.location_id, Location(id="unknown", name="Unknown", category="unknown")).name
-            actor_responses.append(ActorResponse(
-                id=actor.id,
-                name=actor.name,
-                state=actor.state.name,
-                location=location_name,
-                hunger=actor.hunger,
-                fatigue=actor.fatigue,
-                mood=actor.mood
-            ))
+        data = build_tick_dict(world, len(self.worlds))
+        self._tick_cache[world_id] = (world, key, data)
+        return data
         
-        world_stats = self.get_world_stats(world)
+    @property
+    def simulation_running(self) -> bool:
+        """Whether any world's simulation worker is running."""
+        return bool(self.workers)
         
-        return TickResponse(
-            clock=world.clock.current_time.isoformat() + "Z",
-            actors=actor_responses,
-            world_stats=world_stats
-        )
+    def is_running(self, world_id: str) -> bool:
+        return world_id in self.workers
+    
+    def start_worker(self, world_id: str) -> None:
+        """Start a world's simulation in its own process and forward its ticks."""
+        if self._worker_updates is None:
+            self._worker_updates = multiprocessing.get_context("spawn").Queue()
+        
+        worker = WorldWorker(world_id, self.get_world(world_id), self._worker_updates)
+        worker.start()
+        self.workers[world_id] = worker
+        self.ensure_broadcaster(world_id)
+        
+        if self._worker_pump is None or self._worker_pump.done():
+            self._worker_pump = asyncio.create_task(self._pump_workers())
+    
+    def stop_worker(self, world_id: str) -> None:
+        worker = self.workers.get(world_id)
+        if worker is not None:
+            worker.stop()
+    
+    async def _pump_workers(self) -> None:
+        """
+        Forward ticks from every worker until none are left.
+        
+        One task drains the shared updates queue for all worlds, so running
+        more worlds does not add tasks or executor threads in this process.
+        """
+        while self.workers:
+            message = await asyncio.to_thread(_poll_queue, self._worker_updates, WORKER_POLL_TIMEOUT)
+            if message is None:
+                # Retire workers that exited without handing their world back
+                for world_id, worker in list(self.workers.items()):
+                    if not worker.process.is_alive():
+                        self._retire_worker(world_id)
+                continue
+            
+            world_id, kind, body = message
+            if kind == "tick" and world_id in self.workers:
+                data = orjson.loads(body)
+                data['world_stats']['worlds_alive'] = len(self.worlds)
+                self.latest_tick[world_id] = data
+                self.pending_tick[world_id] = data
+            elif kind == "stopped":
+                self.worlds[world_id] = body
+                self._retire_worker(world_id)
+    
+    def _retire_worker(self, world_id: str) -> None:
+        self.workers.pop(world_id, None)
+        self.latest_tick.pop(world_id, None)
+    
+    def ensure_broadcaster(self, world_id: str) -> None:
+        """Start the throttled broadcaster for a world if it is not running."""
+        task = self.broadcasters.get(world_id)
+        if task is None or task.done():
+            self.broadcasters[world_id] = asyncio.create_task(self._broadcaster(world_id))
+    
+    async def _broadcaster(self, world_id: str) -> None:
+        """Send the latest pending tick at most every BROADCAST_INTERVAL seconds."""
+        try:
+            while self.is_running(world_id) or world_id in self.pending_tick:
+                await asyncio.sleep(BROADCAST_INTERVAL)
+                data = self.pending_tick.pop(world_id, None)
+                if data is not None:
+                    message, self.last_snapshot[world_id] = diff_tick_data(
+                        data, self.last_snapshot.get(world_id)
+                    )
+                    await self.broadcast_to_world(world_id, message)
+        finally:
+            self.broadcasters.pop(world_id, None)
     
     async def broadcast_to_world(self, world_id: str, data: Dict[str, Any]):
-        if world_id in self.active_connections:
-            disconnected = []
-            for websocket in self.active_connections[world_id]:
-                try:
-                    await websocket.send_json(data)
-                except:
-                    disconnected.append(websocket)
+        connections = self.active_connections.get(world_id)
+        if not connections:
+            return
             
-            # Remove disconnected websockets
-            for ws in disconnected:
-                self.active_connections[world_id].remove(ws)
+        # Encode once per schema in use, not once per subscriber
+        payload = encode_message(data)
+        compact_payload = None
+        if not connections.isdisjoint(self.compact_connections):
+            compact_payload = encode_message(compact_message(data))
+        
+        disconnected = set()
+        snapshot = list(connections)
+        for i in range(0, len(snapshot), BROADCAST_BATCH_SIZE):
+            batch = snapshot[i:i + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(websocket.send_text(compact_payload if websocket in self.compact_connections else payload)
+                  for websocket in batch),
+                return_exceptions=True
+            )
+            disconnected.update(ws for ws, result in zip(batch, results) if isinstance(result, Exception))
+        
+        # Remove disconnected websockets
+        connections -= disconnected
+        self.compact_connections -= disconnected
 
 
 # Global simulation manager instance
@@ -152,17 +539,7 @@ app.add_middleware(
 @app.get("/api/worlds", response_model=List[WorldResponse])
 async def get_worlds():
     """Get all available worlds with their probability masses."""
-    worlds = []
-    for world_id, world in sim_manager.worlds.items():
-        # For now, all worlds have equal probability mass
-        worlds.append(WorldResponse(world_id=world_id, prob_mass=1.0))
-    
-    # If no worlds exist, create a default one
-    if not worlds:
-        default_world = sim_manager.get_world("main")
-        worlds.append(WorldResponse(world_id="main", prob_mass=1.0))
-    
-    return worlds
+    return Response(sim_manager.get_worlds_payload(), media_type="application/json")
 
 
 @app.get("/api/worlds/{world_id}/tick/{tick_n}", response_model=TickResponse)
@@ -176,28 +553,47 @@ async def get_world_tick(world_id: str, tick_n: int):
         raise HTTPException(status_code=404, detail=f"World {world_id} not found: {str(e)}")
 
 
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Consume client frames until the client disconnects."""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
 @app.websocket("/ws/worlds/{world_id}")
 async def websocket_world_updates(websocket: WebSocket, world_id: str):
     """WebSocket endpoint for real-time world updates."""
     await websocket.accept()
     
     # Add to active connections
-    if world_id not in sim_manager.active_connections:
-        sim_manager.active_connections[world_id] = []
-    sim_manager.active_connections[world_id].append(websocket)
+    sim_manager.active_connections[world_id].add(websocket)
+    if websocket.query_params.get("compact") == "1":
+        sim_manager.compact_connections.add(websocket)
+    
+    # The next broadcast goes out in full so it cannot miss changes the new
+    # subscriber's initial state did not include
+    sim_manager.last_snapshot.pop(world_id, None)
+    
+    # Resolves when the client goes away, so an idle loop still notices
+    closed = asyncio.create_task(_wait_for_disconnect(websocket))
     
     try:
         # Send initial world state
-        world = sim_manager.get_world(world_id)
-        initial_data = sim_manager.get_tick_data(world_id, world.clock.tick_count)
-        await websocket.send_json(initial_data.model_dump())
+        data = sim_manager.get_tick_snapshot(world_id)
+        message, snapshot = diff_tick_data(data, None)
+        await websocket.send_text(encode_for(websocket, message))
         
-        # Keep connection alive and send periodic updates
-        while True:
-            await asyncio.sleep(1.0)  # Send updates every second
+        # Keep connection alive and send periodic updates (changed actors only)
+        while not closed.done():
+            await asyncio.wait({closed}, timeout=1.0)  # Send updates every second
+            if closed.done():
+                break
             try:
-                current_data = sim_manager.get_tick_data(world_id, world.clock.tick_count)
-                await websocket.send_json(current_data.model_dump())
+                latest = sim_manager.get_tick_snapshot(world_id)
+                if latest is data:
+                    continue  # No tick since the last update
+                data = latest
+                message, snapshot = diff_tick_data(data, snapshot)
+                await websocket.send_text(encode_for(websocket, message))
             except Exception as e:
                 print(f"Error sending WebSocket update: {e}")
                 break
@@ -205,62 +601,31 @@ async def websocket_world_updates(websocket: WebSocket, world_id: str):
     except Exception as e:
         print(f"WebSocket error: {e}")
     finally:
+        closed.cancel()
         # Remove from active connections
         if world_id in sim_manager.active_connections:
-            sim_manager.active_connections[world_id].remove(websocket)
+            sim_manager.active_connections[world_id].discard(websocket)
+        sim_manager.compact_connections.discard(websocket)
 
 
 @app.post("/api/worlds/{world_id}/start")
-async def start_simulation(world_id: str, background_tasks: BackgroundTasks):
+async def start_simulation(world_id: str):
     """Start simulation for a world."""
     world = sim_manager.get_world(world_id)
     
-    if sim_manager.simulation_running:
+    if sim_manager.is_running(world_id):
         raise HTTPException(status_code=400, detail="Simulation already running")
     
-    # Start simulation in background
-    def run_simulation():
-        from datetime import datetime, timedelta
-        import time
-        
-        sim_manager.simulation_running = True
-        end_time = datetime.now() + timedelta(hours=24)  # Run for 24 hours
-        
-        try:
-            while world.clock.current_time < end_time and sim_manager.simulation_running:
-                # Advance world by one tick
-                world.clock.advance_tick()
-                
-                # Update actors (simplified for now)
-                for actor in world.actors.values():
-                    # Simple resource updates
-                    actor.update_resources(
-                        hunger_delta=1.0,  # Hunger increases
-                        fatigue_delta=0.5,  # Fatigue increases slowly
-                        mood_delta=0.0     # Mood stays stable
-                    )
-                
-                # Broadcast updates to WebSocket clients
-                asyncio.create_task(sim_manager.broadcast_to_world(
-                    world_id, 
-                    sim_manager.get_tick_data(world_id, world.clock.tick_count).model_dump()
-                ))
-                
-                time.sleep(0.1)  # Small delay between ticks
-                
-        except Exception as e:
-            print(f"Simulation error: {e}")
-        finally:
-            sim_manager.simulation_running = False
-    
-    background_tasks.add_task(run_simulation)
+    # The world ticks in its own process; its ticks are forwarded to the
+    # world's broadcaster from this event loop
+    sim_manager.start_worker(world_id)
     return {"message": f"Simulation started for world {world_id}"}
 
 
 @app.post("/api/worlds/{world_id}/stop")
 async def stop_simulation(world_id: str):
     """Stop simulation for a world."""
-    sim_manager.simulation_running = False
+    sim_manager.stop_worker(world_id)
     return {"message": f"Simulation stopped for world {world_id}"}
 
 
@@ -281,4 +646,4 @@ except:
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True, ws_per_message_deflate=True)
\ No newline at end of file
@@ -5,16 +5,112 @@ Implements hard scheduling constraints that override probability-based decisions
 when actors have calendar commitments that must be honored.
 """
 
-from typing import Optional
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
+import numpy as np
+
+from ._kernels import NUMBA_AVAILABLE, compute_force_idle
 from .states import State
-from .models import Actor, WorldClock
+from .models import Actor, WorldClock, LOCATION_IDS, LOCATION_INDEX, UNKNOWN_LOCATION_INDEX, location_index
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Locations where scheduled activities can take place (work is also allowed
+# from any home_* location)
+HOME_LOCS = frozenset(f"home_{letter}" for letter in "abcdefghijkl")
+WORK_LOCS = frozenset(["public_office"])
+MEETING_LOCS = frozenset(["public_office", "public_restaurant"])
+EXERCISE_LOCS = frozenset(["public_gym", "public_park", "public_walking_path"]) | HOME_LOCS
+SHOP_LOCS = frozenset(["public_mall", "public_grocery_store"])
+SOCIAL_LOCS = frozenset(["public_coffee_shop", "public_restaurant", "public_bar",
+                         "public_park", "public_office"])
+
+# required state -> (allowed locations, any home_* also allowed, activity label for logs)
+_LOC_RULES: Dict[State, Tuple[FrozenSet[str], bool, str]] = {
+    State.Focused_Work: (WORK_LOCS, True, "work"),
+    State.In_Meeting: (MEETING_LOCS, False, "meeting"),
+    State.Exercising: (EXERCISE_LOCS, False, "exercise"),
+    State.Shopping: (SHOP_LOCS, False, "shopping"),
+    State.Socialising: (SOCIAL_LOCS, False, "social activity"),
+}
+
+# Required states that survive each emergency override in override_state
+_HUNGER_EXEMPT_STATES = frozenset([State.Eating, State.Sleeping])
+_LOW_MOOD_BLOCKED_STATES = frozenset([State.Socialising, State.In_Meeting])
+_NO_CASH_BLOCKED_STATES = frozenset([State.Shopping, State.Leisure])
+
+
+def _state_flags(states: FrozenSet[State]) -> np.ndarray:
+    """Bool array indexed by State value, True for the given states."""
+    flags = np.zeros(max(state.value for state in State) + 1, dtype=bool)
+    flags[[state.value for state in states]] = True
+    return flags
+
+
+# The same groups indexed by State value, for batch_override_states
+_HUNGER_EXEMPT = _state_flags(_HUNGER_EXEMPT_STATES)
+_LOW_MOOD_BLOCKED = _state_flags(_LOW_MOOD_BLOCKED_STATES)
+_NO_CASH_BLOCKED = _state_flags(_NO_CASH_BLOCKED_STATES)
+
+
+# Rough area each required state takes place in, for schedule suggestions
+_ACTIVITY_AREAS: Dict[State, str] = {
+    State.Focused_Work: "office",
+    State.Shopping: "shopping",
+    State.Exercising: "gym",
+}
+
+
+def _location_mask(location_ids) -> int:
+    """Bitmask over location handles (models.LOCATION_INDEX) for the given ids."""
+    mask = 0
+    for location_id in location_ids:
+        mask |= 1 << LOCATION_INDEX[location_id]
+    return mask
+
+
+_HOME_MASK = _location_mask(HOME_LOCS & frozenset(LOCATION_IDS))
+
+# The same rules as location bitmasks, so a check is one shift-and-test:
+# required state -> (allowed mask, any home_* also allowed, activity label)
+_LOC_MASK_RULES: Dict[State, Tuple[int, bool, str]] = {
+    state: (_location_mask(allowed) | (_HOME_MASK if home_ok else 0), home_ok, activity)
+    for state, (allowed, home_ok, activity) in _LOC_RULES.items()
+}
+
+
+def _location_table() -> np.ndarray:
+    """Build the location rules as a (State value, location handle) bool table."""
+    # States without a rule allow everywhere; the unknown-location column is
+    # never read (those ids go through _needs_travel)
+    table = np.ones((max(state.value for state in State) + 1, UNKNOWN_LOCATION_INDEX + 1), dtype=bool)
+    for state, (mask, _, _) in _LOC_MASK_RULES.items():
+        table[state.value, :UNKNOWN_LOCATION_INDEX] = [
+            bool((mask >> index) & 1) for index in range(UNKNOWN_LOCATION_INDEX)
+        ]
+    return table
+
+
+_LOC_ALLOWED = _location_table()
+
+
+def _needs_travel(required_state: State, location_id: str) -> Optional[str]:
+    """Return the activity label if the location does not suit the required state."""
+    rule = _LOC_MASK_RULES.get(required_state)
+    if rule is None:
+        return None
+    mask, home_ok, activity = rule
+    
+    index = location_index(location_id)
+    if index != UNKNOWN_LOCATION_INDEX:
+        return None if (mask >> index) & 1 else activity
+    
+    # Ids outside the default set can only qualify as a home
+    return None if home_ok and location_id.startswith("home_") else activity
+
 
 def override_state(actor: Actor, clock: WorldClock) -> Optional[State]:
     """
@@ -37,93 +133,173 @@ def override_state(actor: Actor, clock: WorldClock) -> Optional[State]:
     if not current_block:
         return None
     
-    required_state = current_block.required_state
-    
-    # Apply emergency overrides - certain conditions can break calendar constraints
-    
-    # Critical fatigue override - if actor is extremely tired, they must rest
-    if actor.fatigue >= 95:
-        logger.debug(f"Actor {actor.name} calling in sick due to extreme fatigue ({actor.fatigue:.1f})")
-        # TODO: Prompt 2 - implement proper "CallInSick" action
-        return State.Idle  # Allow them to choose sleep instead of scheduled activity
-    
-    # Critical hunger override - if actor is starving, they must eat
-    if actor.hunger >= 90 and required_state not in [State.Eating, State.Sleeping]:
-        logger.debug(f"Actor {actor.name} breaking schedule due to extreme hunger ({actor.hunger:.1f})")
-        return State.Idle  # Allow them to choose eating instead of scheduled activity
-    
-    # Health emergency override - very low mood might prevent certain activities
-    if actor.mood <= -1.8 and required_state in [State.Socialising, State.In_Meeting]:
-        logger.debug(f"Actor {actor.name} too depressed for social activities (mood: {actor.mood:.2f})")
-        return State.Idle  # Too depressed for social activities
-    
-    # Cash constraint override - can't do activities that cost money if broke
-    if actor.cash <= 0 and required_state in [State.Shopping, State.Leisure]:
-        logger.debug(f"Actor {actor.name} can't afford scheduled activities (cash: ${actor.cash:.2f})")
-        return State.Idle  # Can't afford scheduled activities
-    
-    # Location constraint - if actor can't reach required location, idle instead
-    # This is a simplified check - in reality we'd need pathfinding
-    if required_state == State.Focused_Work:
-        # Work can be done from home or office
-        if actor.location_id not in ["public_office"] and not actor.location_id.startswith("home_"):
-            logger.debug(f"Actor {actor.name} needs to travel to work location")
-            return State.Transitioning  # Need to go somewhere to work
-    
-    elif required_state == State.In_Meeting:
-        # Meetings typically require office or specific locations
-        if actor.location_id not in ["public_office", "public_restaurant"]:
-            logger.debug(f"Actor {actor.name} needs to travel to meeting location")
-            return State.Transitioning  # Need to go to meeting location
-    
-    elif required_state == State.Exercising:
-        # Exercise requires gym, park, or home
-        valid_exercise_locations = ["public_gym", "public_park", "public_walking_path"]
-        valid_exercise_locations.extend([f"home_{letter}" for letter in "abcdefghijkl"])
-        if actor.location_id not in valid_exercise_locations:
-            logger.debug(f"Actor {actor.name} needs to travel to exercise location")
-            return State.Transitioning  # Need to go to exercise location
-    
-    elif required_state == State.Shopping:
-        # Shopping requires mall or grocery store
-        if actor.location_id not in ["public_mall", "public_grocery_store"]:
-            logger.debug(f"Actor {actor.name} needs to travel to shopping location")
-            return State.Transitioning  # Need to go to shopping location
-    
-    elif required_state == State.Socialising:
-        # Social activities can happen in various public places
-        social_locations = ["public_coffee_shop", "public_restaurant", "public_bar", 
-                          "public_park", "public_office"]
-        if actor.location_id not in social_locations:
-            logger.debug(f"Actor {actor.name} needs to travel to social location")
-            return State.Transitioning  # Need to go to social location
-    
-    # If all constraints are satisfied, return the required state
-    logger.debug(f"Actor {actor.name} following calendar: {required_state.name}")
-    return required_state
+    # The checks that apply depend only on the required state, so each state
+    # has its own prebuilt check function
+    return _OVERRIDE_BY_STATE[current_block.required_state](actor)
 
 
-def is_weekend(clock: WorldClock) -> bool:
+def _make_override(required_state: State) -> Callable[[Actor], State]:
+    """Build override_state's checks for one required state, resolved up front."""
+    check_hunger = required_state not in _HUNGER_EXEMPT_STATES
+    check_mood = required_state in _LOW_MOOD_BLOCKED_STATES
+    check_cash = required_state in _NO_CASH_BLOCKED_STATES
+    check_location = required_state in _LOC_MASK_RULES
+    
+    def override(actor: Actor) -> State:
+        # Apply emergency overrides - certain conditions can break calendar constraints
+        
+        # Critical fatigue override - if actor is extremely tired, they must rest
+        if actor.fatigue >= 95:
+            logger.debug("Actor %s calling in sick due to extreme fatigue (%.1f)", actor.name, actor.fatigue)
+            # TODO: Prompt 2 - implement proper "CallInSick" action
+            return State.Idle  # Allow them to choose sleep instead of scheduled activity
+        
+        # Critical hunger override - if actor is starving, they must eat
+        if check_hunger and actor.hunger >= 90:
+            logger.debug("Actor %s breaking schedule due to extreme hunger (%.1f)", actor.name, actor.hunger)
+            return State.Idle  # Allow them to choose eating instead of scheduled activity
+        
+        # Health emergency override - very low mood might prevent certain activities
+        if check_mood and actor.mood <= -1.8:
+            logger.debug("Actor %s too depressed for social activities (mood: %.2f)", actor.name, actor.mood)
+            return State.Idle  # Too depressed for social activities
+        
+        # Cash constraint override - can't do activities that cost money if broke
+        if check_cash and actor.cash <= 0:
+            logger.debug("Actor %s can't afford scheduled activities (cash: $%.2f)", actor.name, actor.cash)
+            return State.Idle  # Can't afford scheduled activities
+        
+        # Location constraint - if actor can't reach required location, idle instead
+        # This is a simplified check - in reality we'd need pathfinding
+        if check_location:
+            activity = _needs_travel(required_state, actor.location_id)
+            if activity is not None:
+                logger.debug("Actor %s needs to travel to %s location", actor.name, activity)
+                return State.Transitioning  # Need to go somewhere for the activity
+        
+        # If all constraints are satisfied, return the required state
+        logger.debug("Actor %s following calendar: %s", actor.name, required_state.name)
+        return required_state
+    
+    return override
+
+
+_OVERRIDE_BY_STATE: Dict[State, Callable[[Actor], State]] = {state: _make_override(state) for state in State}
+
+
+# (time, weekend, business hours) for the last time looked up; the flags
+# depend only on the wall-clock time, so every clock showing that time in the
+# same tzinfo shares them
+_last_day_flags: Optional[Tuple[datetime, bool, bool]] = None
+
+
+def _day_flags(clock: WorldClock) -> Tuple[datetime, bool, bool]:
+    """Get (current_time, weekend, business hours), computed once per clock time."""
+    global _last_day_flags
+    
+    # Use the clock's current time (assumed to be in correct timezone)
+    current_time = clock.current_time
+    flags = _last_day_flags
+    # Aware datetimes compare equal across timezones, so the tzinfo must match too
+    if flags is not None and flags[0] == current_time and flags[0].tzinfo is current_time.tzinfo:
+        return flags
+    
+    # Weekend is Saturday (5) and Sunday (6); business hours are 9 AM to 5 PM
+    weekend = current_time.weekday() >= 5
+    business_hours = not weekend and 9 <= current_time.hour < 17
+    
+    if logger.isEnabledFor(logging.DEBUG):  # strftime is too costly to run eagerly
+        logger.debug("Time: %s, Weekend: %s", current_time.strftime('%A %Y-%m-%d %H:%M'), weekend)
+    
+    flags = _last_day_flags = (current_time, weekend, business_hours)
+    return flags
+
+
+def batch_override_states(actors: List[Actor], clock: WorldClock) -> Dict[str, State]:
     """
-    Check if current time is weekend using WorldClock timezone.
+    Run override_state for many actors at once.
+    
+    Only actors with an active time block are gathered, and their emergency
+    overrides and location checks are evaluated as vectorized passes over
+    resource and location-handle columns.
     
     Args:
+        actors: The actors to check for calendar commitments
         clock: The world clock with current time
-        
+    
     Returns:
-        bool: True if weekend (Saturday or Sunday)
+        Dict mapping actor id to the required state, for actors whose
+        override_state result is not None
     """
-    # Use the clock's current time (assumed to be in correct timezone)
     current_time = clock.current_time
+    scheduled = []
+    required = []
+    for actor in actors:
+        block = actor.get_current_time_block(current_time)
+        if block:
+            scheduled.append(actor)
+            required.append(block.required_state)
+    
+    if not scheduled:
+        return {}
+    
+    fatigue = np.array([actor.fatigue for actor in scheduled], dtype=np.float64)
+    hunger = np.array([actor.hunger for actor in scheduled], dtype=np.float64)
+    mood = np.array([actor.mood for actor in scheduled], dtype=np.float64)
+    cash = np.array([actor.cash for actor in scheduled], dtype=np.float64)
+    required_ids = np.array([state.value for state in required], dtype=np.intp)
+    locations = np.array([location_index(actor.location_id) for actor in scheduled], dtype=np.intp)
+    
+    # Same emergency overrides as override_state, all resolving to Idle
+    if NUMBA_AVAILABLE:
+        force_idle = np.empty(len(scheduled), dtype=bool)
+        compute_force_idle(fatigue, hunger, mood, cash, required_ids,
+                           _HUNGER_EXEMPT, _LOW_MOOD_BLOCKED, _NO_CASH_BLOCKED, force_idle)
+    else:
+        force_idle = (
+            (fatigue >= 95)
+            | ((hunger >= 90) & ~_HUNGER_EXEMPT[required_ids])
+            | ((mood <= -1.8) & _LOW_MOOD_BLOCKED[required_ids])
+            | ((cash <= 0) & _NO_CASH_BLOCKED[required_ids])
+        )
     
-    # Get weekday (0=Monday, 6=Sunday)
-    weekday = current_time.weekday()
+    unknown = locations == UNKNOWN_LOCATION_INDEX
+    at_location = _LOC_ALLOWED[required_ids, locations]
     
-    # Weekend is Saturday (5) and Sunday (6)
-    is_weekend_day = weekday in [5, 6]
+    forced = {}
+    for actor, required_state, idle, suited, unregistered in zip(
+        scheduled, required, force_idle.tolist(), at_location.tolist(), unknown.tolist()
+    ):
+        if idle:
+            forced[actor.id] = State.Idle
+            continue
+        
+        if unregistered:
+            suited = _needs_travel(required_state, actor.location_id) is None
+        if not suited:
+            forced[actor.id] = State.Transitioning
+        else:
+            forced[actor.id] = required_state
+    
+    # override_state's checks log the reason for each result; rerun them only
+    # when those messages will be seen
+    if logger.isEnabledFor(logging.DEBUG):
+        for actor, required_state in zip(scheduled, required):
+            _OVERRIDE_BY_STATE[required_state](actor)
+    return forced
+
+
+def is_weekend(clock: WorldClock) -> bool:
+    """
+    Check if current time is weekend using WorldClock timezone.
     
-    logger.debug(f"Time: {current_time.strftime('%A %Y-%m-%d %H:%M')}, Weekend: {is_weekend_day}")
-    return is_weekend_day
+    Args:
+        clock: The world clock with current time
+        
+    Returns:
+        bool: True if weekend (Saturday or Sunday)
+    """
+    return _day_flags(clock)[1]
 
 
 def is_business_hours(clock: WorldClock) -> bool:
@@ -136,16 +312,7 @@ def is_business_hours(clock: WorldClock) -> bool:
     Returns:
         bool: True if during business hours (9 AM - 5 PM, weekdays)
     """
-    current_time = clock.current_time
-    hour = current_time.hour
-    
-    # Business hours: 9 AM to 5 PM
-    in_business_hours = 9 <= hour < 17
-    
-    # Must also be a weekday
-    is_weekday = not is_weekend(clock)
-    
-    return in_business_hours and is_weekday
+    return _day_flags(clock)[2]
 
 
 def get_upcoming_commitments(actor: Actor, clock: WorldClock, hours_ahead: int = 2) -> list:
@@ -163,18 +330,9 @@ def get_upcoming_commitments(actor: Actor, clock: WorldClock, hours_ahead: int =
     current_time = clock.current_time
     end_time = current_time + timedelta(hours=hours_ahead)
     
-    upcoming = []
-    for block in actor.calendar:
-        # Check if block starts within our time window
-        if current_time <= block.start_dt <= end_time:
-            upcoming.append(block)
-        # Check if block is already active and extends into our window
-        elif block.start_dt <= current_time < block.end_dt:
-            upcoming.append(block)
-    
-    # Sort by start time
-    upcoming.sort(key=lambda b: b.start_dt)
-    return upcoming
+    # Blocks that start within our time window, plus blocks already active
+    # that extend into it, found through the calendar's interval tree
+    return actor.get_upcoming_time_blocks(current_time, end_time)
 
 
 def should_prepare_for_commitment(actor: Actor, clock: WorldClock) -> Optional[State]:
@@ -204,44 +362,10 @@ def should_prepare_for_commitment(actor: Actor, clock: WorldClock) -> Optional[S
         required_state = next_commitment.required_state
         
         # Suggest transitioning if actor needs to move for the commitment
-        if required_state in [State.Focused_Work, State.In_Meeting, State.Exercising, 
-                            State.Shopping, State.Socialising]:
-            # Check if actor is already in a suitable location
-            current_location = actor.location_id
-            
-            # Work locations
-            if required_state == State.Focused_Work:
-                if current_location not in ["public_office"] and not current_location.startswith("home_"):
-                    logger.debug(f"Actor {actor.name} should prepare to travel for work")
-                    return State.Transitioning
-            
-            # Meeting locations  
-            elif required_state == State.In_Meeting:
-                if current_location not in ["public_office", "public_restaurant"]:
-                    logger.debug(f"Actor {actor.name} should prepare to travel for meeting")
-                    return State.Transitioning
-            
-            # Exercise locations
-            elif required_state == State.Exercising:
-                exercise_locations = ["public_gym", "public_park", "public_walking_path"]
-                exercise_locations.extend([f"home_{letter}" for letter in "abcdefghijkl"])
-                if current_location not in exercise_locations:
-                    logger.debug(f"Actor {actor.name} should prepare to travel for exercise")
-                    return State.Transitioning
-            
-            # Shopping locations
-            elif required_state == State.Shopping:
-                if current_location not in ["public_mall", "public_grocery_store"]:
-                    logger.debug(f"Actor {actor.name} should prepare to travel for shopping")
-                    return State.Transitioning
-            
-            # Social locations
-            elif required_state == State.Socialising:
-                social_locations = ["public_coffee_shop", "public_restaurant", "public_bar",
-                                  "public_park", "public_office"]
-                if current_location not in social_locations:
-                    logger.debug(f"Actor {actor.name} should prepare to travel for social activity")
-                    return State.Transitioning
+        activity = _needs_travel(required_state, actor.location_id)
+        if activity is not None:
+            logger.debug("Actor %s should prepare to travel for %s", actor.name, activity)
+            return State.Transitioning
     
     return None
 
@@ -256,16 +380,17 @@ def get_schedule_conflicts(actor: Actor) -> list:
     Returns:
         List of tuples containing conflicting TimeBlock pairs
     """
-    conflicts = []
+    # Sweep over the calendar's cached start order; pairs come back in
+    # calendar order, as a pairwise scan would report them
+    pairs = actor.get_overlapping_block_pairs()
     calendar = actor.calendar
-    
-    for i, block1 in enumerate(calendar):
-        for block2 in calendar[i+1:]:
-            if block1.overlaps_with(block2):
-                conflicts.append((block1, block2))
-                logger.warning(f"Schedule conflict for actor {actor.name}: "
-                             f"{block1.description or block1.required_state.name} overlaps with "
-                             f"{block2.description or block2.required_state.name}")
+    conflicts = []
+    for i, j in pairs:
+        block1, block2 = calendar[i], calendar[j]
+        conflicts.append((block1, block2))
+        logger.warning("Schedule conflict for actor %s: %s overlaps with %s", actor.name,
+                       block1.description or block1.required_state.name,
+                       block2.description or block2.required_state.name)
     
     return conflicts
 
@@ -297,53 +422,46 @@ def suggest_schedule_optimization(actor: Actor, clock: WorldClock) -> dict:
             "overlap_end": min(conflict[0].end_dt, conflict[1].end_dt)
         })
     
-    # Find large gaps (more than 3 hours with no scheduled activities)
-    sorted_blocks = sorted(actor.calendar, key=lambda b: b.start_dt)
-    for i in range(len(sorted_blocks) - 1):
-        gap_start = sorted_blocks[i].end_dt
-        gap_end = sorted_blocks[i + 1].start_dt
-        gap_duration = (gap_end - gap_start).total_seconds() / 3600  # hours
-        
-        if gap_duration > 3:
-            suggestions["gaps"].append({
-                "start": gap_start,
-                "end": gap_end,
-                "duration_hours": gap_duration
-            })
-    
-    # Efficiency tips based on location clustering
+    # One pass over the blocks in start order for gaps, location changes and
+    # the weekend/weekday balance
+    sorted_blocks = actor.sorted_calendar
     location_changes = 0
+    weekend_blocks = 0
+    prev_block = None
     prev_location = None
     for block in sorted_blocks:
-        # Estimate location for activity type
-        if block.required_state == State.Focused_Work:
-            location = "office"
-        elif block.required_state == State.Shopping:
-            location = "shopping"
-        elif block.required_state == State.Exercising:
-            location = "gym"
-        else:
-            location = "general"
+        # Find large gaps (more than 3 hours with no scheduled activities)
+        if prev_block is not None:
+            gap_start = prev_block.end_dt
+            gap_end = block.start_dt
+            gap_duration = (gap_end - gap_start).total_seconds() / 3600  # hours
+            
+            if gap_duration > 3:
+                suggestions["gaps"].append({
+                    "start": gap_start,
+                    "end": gap_end,
+                    "duration_hours": gap_duration
+                })
         
-        if prev_location and prev_location != location:
+        # Estimate location for activity type, for clustering tips
+        location = _ACTIVITY_AREAS.get(block.required_state, "general")
+        if prev_location is not None and prev_location != location:
             location_changes += 1
+        
+        if block.start_dt.weekday() >= 5:  # Saturday, Sunday
+            weekend_blocks += 1
+        
+        prev_block = block
         prev_location = location
     
+    weekday_blocks = len(sorted_blocks) - weekend_blocks
+    
     if location_changes > 5:  # Arbitrary threshold
         suggestions["efficiency_tips"].append(
             "Consider grouping activities by location to reduce travel time"
         )
     
     # Weekend vs weekday balance
-    weekend_blocks = 0
-    weekday_blocks = 0
-    
-    for block in sorted_blocks:
-        if block.start_dt.weekday() in [5, 6]:  # Saturday, Sunday
-            weekend_blocks += 1
-        else:
-            weekday_blocks += 1
-    
     if weekend_blocks == 0 and weekday_blocks > 5:
         suggestions["efficiency_tips"].append(
             "Consider scheduling some leisure activities on weekends"
@@ -366,7 +484,12 @@ def is_valid_schedule_time(actor: Actor, start_time: datetime, duration_minutes:
     """
     end_time = start_time + timedelta(minutes=duration_minutes)
     
-    # Check against existing calendar entries
+    # Check against existing calendar entries through the calendar's
+    # interval tree, so only overlapping commitments are visited
+    if end_time > start_time:
+        return actor.is_available_at(start_time, end_time)
+    
+    # Empty or inverted slots are compared against every entry directly
     for block in actor.calendar:
         if (start_time < block.end_dt) and (end_time > block.start_dt):
             return False  # Overlaps with existing commitment
@@ -388,7 +511,7 @@ def add_emergency_override(actor: Actor, clock: WorldClock, reason: str) -> bool
     """
     current_block = actor.get_current_time_block(clock.current_time)
     if current_block:
-        logger.warning(f"Emergency override for actor {actor.name}: {reason}")
+        logger.warning("Emergency override for actor %s: %s", actor.name, reason)
         # In a full implementation, this might modify the calendar
         # For now, just log the override
         return True
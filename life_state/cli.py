@@ -10,7 +10,7 @@ Example usage:
 
 import argparse
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from . import initialize_world, create_sample_actor
@@ -19,6 +19,31 @@ from .time_jump import WorldManager
 from .io_utils import create_run_directory
 
 
+HOME_LETTERS = "ABCDEFGHIJKL"
+
+
+def _actor_specs(count: int, actor_names: list) -> list:
+    """
+    Assign names and home letters for count actors.
+    
+    Names cycle through actor_names with a numeric suffix from the second
+    round on; home letters cycle through HOME_LETTERS.
+    
+    Args:
+        count: Number of actors
+        actor_names: Base names to cycle through
+    
+    Returns:
+        List of (name, home_letter) tuples
+    """
+    n_names = len(actor_names)
+    return [
+        (actor_names[i % n_names] + (f"{i // n_names + 1}" if i >= n_names else ""),
+         HOME_LETTERS[i % len(HOME_LETTERS)])
+        for i in range(count)
+    ]
+
+
 def main():
     """Main CLI entry point."""
     parser = create_parser()
@@ -135,7 +160,7 @@ def run_simulation(args):
             print("Use ISO format like: 2024-01-01T09:00:00")
             return
     else:
-        start_time = datetime.utcnow()
+        start_time = datetime.now(timezone.utc)
     
     # Calculate end time
     if args.ticks:
@@ -165,18 +190,13 @@ def run_simulation(args):
     # Create actors
     print(f"👥 Creating {args.actors} actors...")
     actor_names = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry"]
-    home_letters = "ABCDEFGHIJKL"
+    location_names = {location_id: location.name for location_id, location in world.locations.items()}
     
-    for i in range(args.actors):
-        name = actor_names[i % len(actor_names)]
-        if i >= len(actor_names):
-            name = f"{name}{i // len(actor_names) + 1}"
-        
-        home_letter = home_letters[i % len(home_letters)]
+    for name, home_letter in _actor_specs(args.actors, actor_names):
         actor = create_sample_actor(world, name, home_letter)
         
         if args.verbose:
-            print(f"  Created {actor.name} at {world.get_location(actor.location_id).name}")
+            print(f"  Created {actor.name} at {location_names.get(actor.location_id, actor.location_id)}")
     
     print(f"Created {len(world.actors)} actors in world with {len(world.locations)} locations")
     
@@ -203,7 +223,7 @@ def run_simulation(args):
         # Show final actor states
         print(f"\n📊 Final Actor States:")
         for actor in world.actors.values():
-            location_name = world.get_location(actor.location_id).name
+            location_name = location_names.get(actor.location_id, actor.location_id)
             print(f"  {actor.name}: {actor.state.name} at {location_name}")
             print(f"    Resources: H={actor.hunger:.1f} F={actor.fatigue:.1f} M={actor.mood:.1f}")
         
@@ -221,20 +241,14 @@ def run_parallel_simulation_cli(args):
     world_manager = WorldManager()
     
     # Create initial world
-    start_time = datetime.utcnow()
+    start_time = datetime.now(timezone.utc)
     world = initialize_world(start_time=start_time, world_id="main")
     
     # Create actors
     print(f"👥 Creating {args.actors} actors...")
     actor_names = ["Alice", "Bob", "Charlie", "Diana", "Eve"]
-    home_letters = "ABCDEFGHIJKL"
     
-    for i in range(args.actors):
-        name = actor_names[i % len(actor_names)]
-        if i >= len(actor_names):
-            name = f"{name}{i // len(actor_names) + 1}"
-        
-        home_letter = home_letters[i % len(home_letters)]
+    for name, home_letter in _actor_specs(args.actors, actor_names):
         create_sample_actor(world, name, home_letter)
     
     # Add to world manager
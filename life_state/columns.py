@@ -0,0 +1,164 @@
+"""
+Structure-of-arrays view over a world's actors.
+
+Actors remain the source of truth. ActorColumns gathers their numeric
+resources into parallel NumPy columns so bulk resource updates and
+aggregates run as vectorized operations, then writes the results back.
+"""
+
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from ._kernels import NUMBA_AVAILABLE, add_clamped, tick_update
+from .models import Actor, WorldState
+from .states import State
+
+
+Delta = Union[float, np.ndarray]
+
+
+class ActorColumns:
+    """
+    Parallel resource columns for a fixed list of actors.
+    
+    Row i of every column belongs to actors[i]. Columns are float64 so that
+    clamped updates match Actor.update_resources exactly. State and location
+    are gathered as integer columns (State values and indices into
+    location_names) for vectorized row selection.
+    """
+    
+    def __init__(self, actors: List[Actor]):
+        """
+        Gather resource columns from actors.
+        
+        Args:
+            actors: Actors to gather, in row order
+        """
+        self.actors = list(actors)
+        self.actor_ids = [actor.id for actor in self.actors]
+        self.hunger = np.array([actor.hunger for actor in self.actors], dtype=np.float64)
+        self.fatigue = np.array([actor.fatigue for actor in self.actors], dtype=np.float64)
+        self.mood = np.array([actor.mood for actor in self.actors], dtype=np.float64)
+        self.cash = np.array([actor.cash for actor in self.actors], dtype=np.float64)
+        self.energy = np.array([actor.energy for actor in self.actors], dtype=np.float64)
+        self.battery = np.array([actor.battery for actor in self.actors], dtype=np.float64)
+        self.state = np.array([actor.state.value for actor in self.actors], dtype=np.int16)
+        
+        # Location handles in first-seen order: row i is at location_names[location[i]]
+        location_index: Dict[str, int] = {}
+        self.location = np.array(
+            [location_index.setdefault(actor.location_id, len(location_index)) for actor in self.actors],
+            dtype=np.int32
+        )
+        self.location_names = list(location_index)
+        self._location_index = location_index
+    
+    @classmethod
+    def from_world(cls, world: WorldState) -> "ActorColumns":
+        """Gather columns for all actors in a world."""
+        return cls(list(world.actors.values()))
+    
+    def __len__(self) -> int:
+        return len(self.actors)
+    
+    def matches(self, world: WorldState) -> bool:
+        """Check whether the columns still cover exactly the world's actors, in order."""
+        return self.actor_ids == list(world.actors)
+    
+    def apply_deltas(self, hunger_delta: Delta, fatigue_delta: Delta, mood_delta: Delta,
+                     rows: Optional[np.ndarray] = None,
+                     energy_delta: Delta = 0.0, battery_delta: Delta = 0.0) -> None:
+        """
+        Apply resource deltas, clamping like Actor.update_resources.
+        
+        Args:
+            hunger_delta: Scalar or per-row hunger change
+            fatigue_delta: Scalar or per-row fatigue change
+            mood_delta: Scalar or per-row mood change
+            rows: Distinct row indices to update (default: every row); per-row
+                deltas are then aligned with rows
+            energy_delta: Scalar or per-row energy change (clamped to 0-100)
+            battery_delta: Scalar or per-row battery change (clamped to 0-100)
+        """
+        if rows is None and NUMBA_AVAILABLE and np.ndim(hunger_delta) == np.ndim(fatigue_delta) == np.ndim(mood_delta) == 0:
+            tick_update(self.hunger, self.fatigue, self.mood,
+                        float(hunger_delta), float(fatigue_delta), float(mood_delta))
+        else:
+            self._add_clamped(self.hunger, hunger_delta, 0.0, 100.0, rows)
+            self._add_clamped(self.fatigue, fatigue_delta, 0.0, 100.0, rows)
+            self._add_clamped(self.mood, mood_delta, -2.0, 2.0, rows)
+        
+        # Energy and battery rarely change in bulk; skip their columns when they don't
+        if np.ndim(energy_delta) or energy_delta:
+            self._add_clamped(self.energy, energy_delta, 0.0, 100.0, rows)
+        if np.ndim(battery_delta) or battery_delta:
+            self._add_clamped(self.battery, battery_delta, 0.0, 100.0, rows)
+    
+    @staticmethod
+    def _add_clamped(column: np.ndarray, delta: Delta, low: float, high: float,
+                     rows: Optional[np.ndarray]) -> None:
+        if rows is not None:
+            column[rows] = np.clip(column[rows] + delta, low, high)
+        elif NUMBA_AVAILABLE and np.ndim(delta) == 0:
+            add_clamped(column, float(delta), low, high)
+        else:
+            np.clip(column + delta, low, high, out=column)
+    
+    def write_back(self) -> None:
+        """Copy the resource columns back onto the actors."""
+        for actor, hunger, fatigue, mood, cash, energy, battery in zip(
+            self.actors, self.hunger.tolist(), self.fatigue.tolist(),
+            self.mood.tolist(), self.cash.tolist(), self.energy.tolist(), self.battery.tolist()
+        ):
+            actor.hunger = hunger
+            actor.fatigue = fatigue
+            actor.mood = mood
+            actor.cash = cash
+            actor.energy = energy
+            actor.battery = battery
+    
+    def means(self) -> Dict[str, float]:
+        """
+        Get mean resources across rows.
+        
+        Returns:
+            Dict of hunger, fatigue, mood, cash, energy and battery means
+            (0.0 when empty)
+        """
+        if not self.actors:
+            return {'hunger': 0.0, 'fatigue': 0.0, 'mood': 0.0, 'cash': 0.0, 'energy': 0.0, 'battery': 0.0}
+        
+        return {
+            'hunger': float(self.hunger.mean()),
+            'fatigue': float(self.fatigue.mean()),
+            'mood': float(self.mood.mean()),
+            'cash': float(self.cash.mean()),
+            'energy': float(self.energy.mean()),
+            'battery': float(self.battery.mean()),
+        }
+    
+    def state_counts(self) -> Dict[str, int]:
+        """Count rows per state name (as gathered), omitting empty states."""
+        counts = np.bincount(self.state, minlength=max(State) + 1)
+        return {State(value).name: int(count) for value, count in enumerate(counts.tolist()) if count}
+    
+    def count_in_state(self, state: State) -> int:
+        """Count rows whose actor was in the given state when gathered."""
+        return int(np.count_nonzero(self.state == state.value))
+    
+    def rows_in_state(self, state: State) -> np.ndarray:
+        """Get ascending indices of rows whose actor was in the given state when gathered."""
+        return np.flatnonzero(self.state == state.value)
+    
+    def rows_at_location(self, location_id: str) -> np.ndarray:
+        """Get ascending indices of rows whose actor was at the given location when gathered."""
+        handle = self._location_index.get(location_id)
+        if handle is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.location == handle)
+    
+    def actors_at_rows(self, rows: np.ndarray) -> List[Actor]:
+        """Get the actors for the given row indices, in order."""
+        actors = self.actors
+        return [actors[i] for i in rows.tolist()]
@@ -0,0 +1,89 @@
+"""
+Static augmented interval tree for calendar lookups.
+
+Intervals are half-open [start, end) and must be supplied sorted by start.
+The tree is implicit: the node for the index range [lo, hi) is the middle
+index, and each node stores the largest end in its subtree so whole
+subtrees that finish too early are skipped. Queries report indices into the
+sorted input, in ascending order, in O(log n + k).
+"""
+
+from typing import Any, List, Sequence
+
+
+class IntervalTree:
+    """Stabbing and overlap queries over intervals sorted by start."""
+    
+    def __init__(self, starts: Sequence[Any], ends: Sequence[Any]):
+        """
+        Build the tree.
+        
+        Args:
+            starts: Interval starts in ascending order
+            ends: Interval ends, aligned with starts
+        """
+        self._starts = starts
+        self._ends = ends
+        self._max_end: List[Any] = list(ends)
+        if starts:
+            self._build(0, len(starts))
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def _build(self, lo: int, hi: int) -> Any:
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+    
+    def stab(self, point: Any) -> List[int]:
+        """
+        Find intervals containing a point.
+        
+        Args:
+            point: Point to look up
+        
+        Returns:
+            Ascending indices i with starts[i] <= point < ends[i]
+        """
+        found: List[int] = []
+        self._search(0, len(self._starts), point, point, True, found)
+        return found
+    
+    def overlapping(self, start: Any, end: Any) -> List[int]:
+        """
+        Find intervals overlapping the half-open range [start, end).
+        
+        Args:
+            start: Range start
+            end: Range end
+        
+        Returns:
+            Ascending indices i with starts[i] < end and ends[i] > start
+        """
+        found: List[int] = []
+        self._search(0, len(self._starts), start, end, False, found)
+        return found
+    
+    def _search(self, lo: int, hi: int, start: Any, end: Any,
+                end_inclusive: bool, found: List[int]) -> None:
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if max_end[mid] <= start:
+                return  # Everything in this subtree ends too early
+            
+            self._search(lo, mid, start, end, end_inclusive, found)
+            
+            # mid and everything right of it start no earlier than starts[mid]
+            node_start = starts[mid]
+            if node_start > end or (node_start == end and not end_inclusive):
+                return
+            if ends[mid] > start:
+                found.append(mid)
+            lo = mid + 1
@@ -4,101 +4,365 @@ I/O utilities for simulation logging and data persistence.
 Handles writing simulation snapshots, daily summaries, and other output formats.
 """
 
-import json
-from pathlib import Path
+import atexit
+import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePath
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 import logging
 
-from .models import WorldState
+import orjson
+
+try:
+    import msgspec
+    # Reused encoder; faster than orjson on the snapshot records, byte-identical output
+    _SNAPSHOT_ENCODER = msgspec.json.Encoder()
+except ImportError:  # msgspec is optional; snapshots then use orjson
+    _SNAPSHOT_ENCODER = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only binary snapshots need it
+    msgpack = None
+
+from .columns import ActorColumns
+from .models import SNAPSHOT_RESOURCES, SNAPSHOT_SCALE, WorldState
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Log directories created (or found) by ensure_log_dir; writers skip the
+# mkdir for these and drop a directory again if writing into it fails
+_ready_dirs: Set[Path] = set()
+
+
+def ensure_log_dir(log_dir: Path) -> bool:
+    """
+    Create a log directory, once per process.
+    
+    Args:
+        log_dir: Directory the writers will write into
+    
+    Returns:
+        True if the directory exists, False if it could not be created
+    """
+    if log_dir in _ready_dirs:
+        return True
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, PermissionError) as e:
+        logger.error(f"Cannot create log directory {log_dir}: {e}")
+        return False
+    _ready_dirs.add(log_dir)
+    return True
+
+
+# Snapshot files are only ever appended to; O_BINARY matters on Windows only
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+def _snapshot_record(world_id: str, world: WorldState, timestamp: str, binary: bool = False) -> bytes:
+    """
+    Serialize one world's snapshot as a JSON Lines or MessagePack record.
+    
+    Args:
+        world_id: World identifier
+        world: World to snapshot
+        timestamp: Wall-clock timestamp shared by every world in the tick
+        binary: Encode as a MessagePack object instead of a JSON line
+    
+    Returns:
+        UTF-8 JSON bytes ending in a newline, or MessagePack bytes
+    """
+    tick = world.clock.tick_count
+    snapshot = {
+        "timestamp": timestamp,
+        "world_id": world_id,
+        "tick": tick,
+        "simulation_time": world.clock.current_time.isoformat(),
+        "resource_scale": SNAPSHOT_SCALE,
+        "actors": [actor.to_snapshot_dict(tick) for actor in world.actors.values()]
+    }
+    
+    if binary:
+        return msgpack.packb(snapshot, use_bin_type=True)
+    if _SNAPSHOT_ENCODER is not None:
+        return _SNAPSHOT_ENCODER.encode(snapshot) + b"\n"
+    return orjson.dumps(snapshot, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _dequantize(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a loaded snapshot's fixed-point actor resources back to floats, in place.
+    
+    Snapshots written without a "resource_scale" already hold floats and
+    are returned unchanged.
+    """
+    scale = snapshot.pop("resource_scale", None)
+    if scale:
+        for actor in snapshot.get("actors", ()):
+            for name in SNAPSHOT_RESOURCES:
+                actor[name] = actor[name] / scale
+    return snapshot
+
 
 def write_snapshot(worlds: Dict[str, WorldState], log_dir: Path) -> None:
     """
     Write a snapshot of all worlds to JSON Lines format.
     
+    Opens and closes each file per call; use SnapshotWriter to snapshot
+    every tick of a run.
+    
     Args:
         worlds: Dictionary of world_id -> WorldState
         log_dir: Directory to write snapshot files
     """
-    timestamp = datetime.utcnow().isoformat()
+    with SnapshotWriter(log_dir, flush_every=1) as writer:
+        writer.write(worlds)
+
+
+def write_snapshot_binary(worlds: Dict[str, WorldState], log_dir: Path) -> None:
+    """
+    Write a snapshot of all worlds as MessagePack records.
     
-    # Ensure log directory is writable
-    try:
-        log_dir.mkdir(parents=True, exist_ok=True)
-    except (OSError, PermissionError) as e:
-        logger.error(f"Cannot create log directory {log_dir}: {e}")
-        return
+    Like write_snapshot, but appends to <world_id>_snapshots.msgpack; read
+    the files back with load_snapshot_binary. Requires msgpack.
     
-    for world_id, world in worlds.items():
-        snapshot_file = log_dir / f"{world_id}_snapshots.jsonl"
+    Args:
+        worlds: Dictionary of world_id -> WorldState
+        log_dir: Directory to write snapshot files
+    """
+    with SnapshotWriter(log_dir, flush_every=1, binary=True) as writer:
+        writer.write(worlds)
+
+
+class SnapshotWriter:
+    """
+    Appends per-tick world snapshots to <world_id>_snapshots.jsonl files.
+    
+    With binary=True the snapshots are MessagePack objects appended to
+    <world_id>_snapshots.msgpack instead, which are smaller and faster to
+    encode and load; JSON Lines stays the default since it is readable
+    without extra packages.
+    
+    Keeps one O_APPEND file descriptor per world open across ticks. Records
+    collect in a per-world byte buffer that goes out in a single os.write
+    every flush_every writes (or once it reaches buffer_size), instead of
+    reopening the files each tick. With several worlds, their buffers are
+    filled and written on a small thread pool. Call close() (or use it as a
+    context manager) to write the tail; an unclosed writer is closed at
+    exit.
+    
+    With background=True, snapshots are still encoded by the caller (actors
+    change on the next tick) but the file writes happen on a worker thread
+    fed through a bounded queue, so the simulation loop does not wait on
+    disk unless the queue is full.
+    """
+    
+    # Queue marker asking the worker to flush its files
+    _FLUSH = object()
+    
+    def __init__(self, log_dir: Path, flush_every: int = 64, buffer_size: int = 1 << 20,
+                 background: bool = False, queue_size: int = 256, binary: bool = False,
+                 max_threads: int = 8):
+        """
+        Create a writer.
         
-        # Create snapshot data
-        snapshot = {
-            "timestamp": timestamp,
-            "world_id": world_id,
-            "tick": world.clock.tick_count,
-            "simulation_time": world.clock.current_time.isoformat(),
-            "actors": []
-        }
+        Args:
+            log_dir: Directory to write snapshot files
+            flush_every: Number of write() calls between flushes
+            buffer_size: Bytes buffered per world before writing early
+            background: Whether to write files on a worker thread
+            queue_size: Maximum number of ticks waiting for the worker
+            binary: Whether to write MessagePack instead of JSON Lines
+            max_threads: Maximum number of worlds written or flushed at once
         
-        # Add actor data
-        for actor in world.actors.values():
-            # Determine current action from substate or state
-            current_action = "Idle"
-            if actor.substate:
-                if actor.substate.startswith("action_"):
-                    current_action = actor.substate[7:].replace("_", " ").title()
-                else:
-                    current_action = actor.substate.replace("_", " ").title()
-            else:
-                current_action = actor.state.name
-            
-            actor_data = {
-                "id": actor.id,
-                "name": actor.name,
-                "state": actor.state.name,
-                "substate": actor.substate,
-                "current_action": current_action,
-                "location_id": actor.location_id,
-                "hunger": round(actor.hunger, 2),
-                "fatigue": round(actor.fatigue, 2),
-                "mood": round(actor.mood, 2),
-                "cash": round(actor.cash, 2),
-                "energy": round(actor.energy, 2),
-                "battery": round(actor.battery, 2),
-                "current_ticks_left": actor.current_ticks_left,
-                "world_id": actor.world_id
-            }
-            snapshot["actors"].append(actor_data)
+        Raises:
+            ImportError: If binary is requested without msgpack installed
+        """
+        if binary and msgpack is None:
+            raise ImportError("Binary snapshots require the msgpack package")
+        self.log_dir = log_dir
+        self.flush_every = max(1, flush_every)
+        self.buffer_size = buffer_size
+        self.background = background
+        self.binary = binary
+        self._fds: Dict[str, int] = {}
+        self._pending: Dict[str, bytearray] = {}
+        self._exit_registered = False
+        self._writes_since_flush = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self.max_threads = max(1, max_threads)
+        self._pool: Optional[ThreadPoolExecutor] = None
+    
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _path_for(self, world_id: str) -> Path:
+        suffix = "msgpack" if self.binary else "jsonl"
+        return self.log_dir / f"{world_id}_snapshots.{suffix}"
+    
+    def _register_exit(self) -> None:
+        if not self._exit_registered:
+            atexit.register(self.close)
+            self._exit_registered = True
+    
+    def _fd_for(self, world_id: str) -> int:
+        fd = self._fds.get(world_id)
+        if fd is None:
+            fd = os.open(self._path_for(world_id), _APPEND_FLAGS, 0o644)
+            self._fds[world_id] = fd
+            self._register_exit()
+        return fd
+    
+    def write(self, worlds: Dict[str, WorldState]) -> None:
+        """
+        Append a snapshot of each world.
+        
+        Args:
+            worlds: Dictionary of world_id -> WorldState
+        """
+        if not ensure_log_dir(self.log_dir):
+            return
+        
+        timestamp = datetime.utcnow().isoformat()
+        records = []
+        for world_id, world in worlds.items():
+            try:
+                records.append((world_id, _snapshot_record(world_id, world, timestamp, self.binary)))
+            except (TypeError, ValueError) as e:
+                logger.error(f"Error serializing snapshot data: {e}")
         
-        # Write to file with error handling and flushing
+        if self.background:
+            self._start_worker()
+            self._queue.put(records)  # Blocks while the worker is queue_size ticks behind
+        else:
+            self._write_records(records)
+    
+    def _for_each_world(self, func, items) -> None:
+        # Each world has its own file, so worlds can be written and flushed
+        # concurrently; file I/O releases the GIL
+        if len(items) > 1:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="snapshot-io")
+            list(self._pool.map(func, items))
+        else:
+            for item in items:
+                func(item)
+    
+    def _write_one(self, item) -> None:
+        world_id, record = item
         try:
-            with open(snapshot_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(snapshot, ensure_ascii=False) + '\n')
-                f.flush()  # Ensure data is written immediately
+            self._fd_for(world_id)
         except (OSError, PermissionError) as e:
-            logger.error(f"Cannot write to snapshot file {snapshot_file}: {e}")
-        except (TypeError, ValueError) as e:
-            logger.error(f"Error serializing snapshot data: {e}")
+            logger.error(f"Cannot write to snapshot file {self._path_for(world_id)}: {e}")
+            _ready_dirs.discard(self.log_dir)
+            return
+        pending = self._pending.get(world_id)
+        if pending is None:
+            pending = self._pending[world_id] = bytearray()
+        pending += record
+        if len(pending) >= self.buffer_size:
+            self._flush_one(world_id)
+    
+    def _write_records(self, records) -> None:
+        self._for_each_world(self._write_one, records)
+        
+        self._writes_since_flush += 1
+        if self._writes_since_flush >= self.flush_every:
+            self._flush_files()
+    
+    def _start_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._writer_loop, name="snapshot-writer", daemon=True)
+            self._worker.start()
+            # Daemon threads are killed at exit; drain the queue first
+            self._register_exit()
+    
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if item is self._FLUSH:
+                    self._flush_files()
+                else:
+                    self._write_records(item)
+            except Exception:
+                logger.exception("Snapshot writer failed")
+            finally:
+                self._queue.task_done()
+    
+    def flush(self) -> None:
+        """Flush every open snapshot file, waiting for queued snapshots first."""
+        if self._worker is not None:
+            self._queue.put(self._FLUSH)
+            self._queue.join()
+        else:
+            self._flush_files()
+    
+    def _flush_one(self, world_id: str) -> None:
+        pending = self._pending.get(world_id)
+        if not pending:
+            return
+        fd = self._fds[world_id]
+        try:
+            with memoryview(pending) as view:
+                written = 0
+                while written < len(view):  # Regular files rarely take a short write
+                    written += os.write(fd, view[written:])
+        except (OSError, PermissionError) as e:
+            logger.error(f"Cannot flush snapshot file for world {world_id}: {e}")
+            _ready_dirs.discard(self.log_dir)
+        pending.clear()
+    
+    def _flush_files(self) -> None:
+        self._writes_since_flush = 0
+        self._for_each_world(self._flush_one, list(self._pending))
+    
+    def close(self) -> None:
+        """Flush and close every open snapshot file, stopping the worker if running."""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+        self._flush_files()
+        for world_id, fd in self._fds.items():
+            try:
+                os.close(fd)
+            except OSError as e:
+                logger.error(f"Cannot close snapshot file {self._path_for(world_id)}: {e}")
+        self._fds.clear()
+        self._pending.clear()
+        if self._exit_registered:
+            atexit.unregister(self.close)
+            self._exit_registered = False
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
 
-def write_daily_summary(world: WorldState, log_dir: Path) -> None:
+def write_daily_summary(world: WorldState, log_dir: Path, columns: Optional[ActorColumns] = None) -> None:
     """
     Write a daily summary for a world at midnight.
     
     Args:
         world: The world state to summarize
         log_dir: Directory to write summary files
+        columns: Up-to-date resource columns for the world, if the caller
+            keeps them; resource averages and state counts are then
+            vectorized reductions over the columns
     """
-    # Ensure log directory is writable
-    try:
-        log_dir.mkdir(parents=True, exist_ok=True)
-    except (OSError, PermissionError) as e:
-        logger.error(f"Cannot create log directory {log_dir}: {e}")
+    if not ensure_log_dir(log_dir):
         return
     
     date_str = world.clock.current_time.strftime("%Y-%m-%d")
@@ -107,27 +371,37 @@ def write_daily_summary(world: WorldState, log_dir: Path) -> None:
     # Calculate daily statistics
     total_actors = len(world.actors)
     
-    # State distribution
-    state_counts = {}
-    for actor in world.actors.values():
-        state_name = actor.state.name
-        state_counts[state_name] = state_counts.get(state_name, 0) + 1
-    
-    # Resource averages
-    if total_actors > 0:
-        avg_hunger = sum(actor.hunger for actor in world.actors.values()) / total_actors
-        avg_fatigue = sum(actor.fatigue for actor in world.actors.values()) / total_actors
-        avg_mood = sum(actor.mood for actor in world.actors.values()) / total_actors
-        avg_cash = sum(actor.cash for actor in world.actors.values()) / total_actors
-        avg_energy = sum(actor.energy for actor in world.actors.values()) / total_actors
-        avg_battery = sum(actor.battery for actor in world.actors.values()) / total_actors
-    else:
-        avg_hunger = avg_fatigue = avg_mood = avg_cash = avg_energy = avg_battery = 0.0
-    
-    # Location distribution
     location_counts = {}
-    for actor in world.actors.values():
-        location_counts[actor.location_id] = location_counts.get(actor.location_id, 0) + 1
+    if columns is not None and columns.matches(world):
+        state_counts = columns.state_counts()
+        averages = columns.means()
+        for actor in world.actors.values():
+            location_counts[actor.location_id] = location_counts.get(actor.location_id, 0) + 1
+    else:
+        # State and location distributions and resource sums, in one pass
+        state_counts = {}
+        sum_hunger = sum_fatigue = sum_mood = sum_cash = sum_energy = sum_battery = 0.0
+        for actor in world.actors.values():
+            state_name = actor.state.name
+            state_counts[state_name] = state_counts.get(state_name, 0) + 1
+            location_counts[actor.location_id] = location_counts.get(actor.location_id, 0) + 1
+            sum_hunger += actor.hunger
+            sum_fatigue += actor.fatigue
+            sum_mood += actor.mood
+            sum_cash += actor.cash
+            sum_energy += actor.energy
+            sum_battery += actor.battery
+    
+        # Resource averages
+        n = total_actors or 1
+        averages = {
+            "hunger": sum_hunger / n,
+            "fatigue": sum_fatigue / n,
+            "mood": sum_mood / n,
+            "cash": sum_cash / n,
+            "energy": sum_energy / n,
+            "battery": sum_battery / n,
+        }
     
     summary = {
         "date": date_str,
@@ -137,101 +411,102 @@ def write_daily_summary(world: WorldState, log_dir: Path) -> None:
         "state_distribution": state_counts,
         "location_distribution": location_counts,
         "average_resources": {
-            "hunger": round(avg_hunger, 2),
-            "fatigue": round(avg_fatigue, 2),
-            "mood": round(avg_mood, 2),
-            "cash": round(avg_cash, 2),
-            "energy": round(avg_energy, 2),
-            "battery": round(avg_battery, 2)
+            "hunger": round(averages["hunger"], 2),
+            "fatigue": round(averages["fatigue"], 2),
+            "mood": round(averages["mood"], 2),
+            "cash": round(averages["cash"], 2),
+            "energy": round(averages["energy"], 2),
+            "battery": round(averages["battery"], 2)
         },
         "probability_mass": getattr(world, 'prob_mass', 1.0)
     }
     
     try:
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(summary_file, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
             f.flush()
         logger.info(f"Wrote daily summary to {summary_file}")
     except (OSError, PermissionError) as e:
         logger.error(f"Cannot write daily summary to {summary_file}: {e}")
+        _ready_dirs.discard(log_dir)
     except (TypeError, ValueError) as e:
         logger.error(f"Error serializing daily summary: {e}")
 
 
+def _world_summary(world_id: str, world: WorldState) -> Dict[str, Any]:
+    """Build the final summary record for one world."""
+    world_summary = {
+        "world_id": world_id,
+        "final_tick": world.clock.tick_count,
+        "final_time": world.clock.current_time.isoformat(),
+        "total_actors": len(world.actors),
+        "probability_mass": getattr(world, 'prob_mass', 1.0)
+    }
+    
+    # Actor summaries, reusing the records already built for this tick's snapshot
+    tick = world.clock.tick_count
+    world_summary["actors"] = []
+    for actor in world.actors.values():
+        record = actor.to_snapshot_dict(tick)
+        actor_summary = {
+            "id": record["id"],
+            "name": record["name"],
+            "final_state": record["state"],
+            "final_action": record["current_action"],
+            "final_location": record["location_id"],
+            "final_resources": {
+                name: record[name] / SNAPSHOT_SCALE for name in SNAPSHOT_RESOURCES
+            }
+        }
+        world_summary["actors"].append(actor_summary)
+    
+    return world_summary
+
+
 def write_simulation_summary(worlds: Dict[str, WorldState], metrics, log_dir: Path) -> None:
     """
     Write final simulation summary with metrics.
     
+    The "worlds" object is streamed one world at a time, so only a single
+    world's actor summaries are held in memory. The file is identical to
+    dumping the whole summary at once with two-space indentation.
+    
     Args:
         worlds: Dictionary of all worlds
         metrics: SimulationMetrics instance
         log_dir: Directory to write summary
     """
-    # Ensure log directory is writable
-    try:
-        log_dir.mkdir(parents=True, exist_ok=True)
-    except (OSError, PermissionError) as e:
-        logger.error(f"Cannot create log directory {log_dir}: {e}")
+    if not ensure_log_dir(log_dir):
         return
     
     summary_file = log_dir / "simulation_summary.json"
     
-    summary = {
+    header = orjson.dumps({
         "timestamp": datetime.utcnow().isoformat(),
         "total_worlds": len(worlds),
         "metrics": metrics.get_summary(),
         "worlds": {}
-    }
-    
-    # Add per-world summaries
-    for world_id, world in worlds.items():
-        world_summary = {
-            "world_id": world_id,
-            "final_tick": world.clock.tick_count,
-            "final_time": world.clock.current_time.isoformat(),
-            "total_actors": len(world.actors),
-            "probability_mass": getattr(world, 'prob_mass', 1.0)
-        }
-        
-        # Actor summaries
-        world_summary["actors"] = []
-        for actor in world.actors.values():
-            # Determine final action
-            final_action = "Idle"
-            if actor.substate:
-                if actor.substate.startswith("action_"):
-                    final_action = actor.substate[7:].replace("_", " ").title()
-                else:
-                    final_action = actor.substate.replace("_", " ").title()
-            else:
-                final_action = actor.state.name
-            
-            actor_summary = {
-                "id": actor.id,
-                "name": actor.name,
-                "final_state": actor.state.name,
-                "final_action": final_action,
-                "final_location": actor.location_id,
-                "final_resources": {
-                    "hunger": round(actor.hunger, 2),
-                    "fatigue": round(actor.fatigue, 2),
-                    "mood": round(actor.mood, 2),
-                    "cash": round(actor.cash, 2),
-                    "energy": round(actor.energy, 2),
-                    "battery": round(actor.battery, 2)
-                }
-            }
-            world_summary["actors"].append(actor_summary)
-        
-        summary["worlds"][world_id] = world_summary
+    }, option=orjson.OPT_INDENT_2)
     
     try:
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(summary_file, 'wb') as f:
+            if not worlds:
+                f.write(header)
+            else:
+                # Everything up to the empty "worlds" object, which is filled in below
+                f.write(header[:-len(b'{}\n}')] + b'{')
+                separator = b'\n    '
+                for world_id, world in worlds.items():
+                    world_json = orjson.dumps(_world_summary(world_id, world), option=orjson.OPT_INDENT_2)
+                    # Nest two levels deep; JSON strings never contain raw newlines
+                    f.write(separator + orjson.dumps(world_id) + b': ' + world_json.replace(b'\n', b'\n    '))
+                    separator = b',\n    '
+                f.write(b'\n  }\n}')
             f.flush()
         logger.info(f"Wrote simulation summary to {summary_file}")
     except (OSError, PermissionError) as e:
         logger.error(f"Cannot write simulation summary to {summary_file}: {e}")
+        _ready_dirs.discard(log_dir)
     except (TypeError, ValueError) as e:
         logger.error(f"Error serializing simulation summary: {e}")
 
@@ -240,6 +515,8 @@ def load_snapshot(snapshot_file: Path) -> list:
     """
     Load snapshots from a JSON Lines file.
     
+    Fixed-point actor resources are converted back to floats.
+    
     Args:
         snapshot_file: Path to the snapshot file
         
@@ -253,13 +530,15 @@ def load_snapshot(snapshot_file: Path) -> list:
         return snapshots
     
     try:
-        with open(snapshot_file, 'r', encoding='utf-8') as f:
+        # Read bytes so orjson parses each line without a decode step; it
+        # accepts the surrounding whitespace, so only blank lines are skipped
+        append = snapshots.append
+        with open(snapshot_file, 'rb') as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line:
+                if not line.isspace():
                     try:
-                        snapshots.append(json.loads(line))
-                    except json.JSONDecodeError as e:
+                        append(_dequantize(orjson.loads(line)))
+                    except orjson.JSONDecodeError as e:
                         logger.error(f"Error parsing JSON on line {line_num} of {snapshot_file}: {e}")
         logger.debug(f"Loaded {len(snapshots)} snapshots from {snapshot_file}")
     except (OSError, PermissionError) as e:
@@ -268,60 +547,105 @@ def load_snapshot(snapshot_file: Path) -> list:
     return snapshots
 
 
-def export_csv(worlds: Dict[str, WorldState], log_dir: Path) -> None:
+def load_snapshot_binary(snapshot_file: Path) -> list:
     """
-    Export world data to CSV format for analysis.
+    Load snapshots from a MessagePack file written with binary=True.
     
     Args:
-        worlds: Dictionary of worlds to export
-        log_dir: Directory to write CSV files
+        snapshot_file: Path to the snapshot file
+    
+    Returns:
+        List of snapshot dictionaries
+    
+    Raises:
+        ImportError: If msgpack is not installed
     """
-    import csv
+    if msgpack is None:
+        raise ImportError("Binary snapshots require the msgpack package")
+    
+    snapshots = []
+    
+    if not snapshot_file.exists():
+        logger.warning(f"Snapshot file does not exist: {snapshot_file}")
+        return snapshots
     
-    # Ensure log directory is writable
     try:
-        log_dir.mkdir(parents=True, exist_ok=True)
+        with open(snapshot_file, 'rb') as f:
+            # Records are self-delimiting, so the unpacker streams them back to
+            # back; a truncated final record is dropped
+            snapshots.extend(map(_dequantize, msgpack.Unpacker(f, raw=False)))
+        logger.debug(f"Loaded {len(snapshots)} snapshots from {snapshot_file}")
     except (OSError, PermissionError) as e:
-        logger.error(f"Cannot create log directory {log_dir}: {e}")
+        logger.error(f"Cannot read snapshot file {snapshot_file}: {e}")
+    except ValueError as e:
+        logger.error(f"Error parsing MessagePack after {len(snapshots)} snapshots in {snapshot_file}: {e}")
+    
+    return snapshots
+
+
+# Characters that make csv.writer (QUOTE_MINIMAL, excel dialect) quote a field
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+CSV_HEADER = (
+    'actor_id', 'name', 'state', 'substate', 'current_action', 'location_id',
+    'hunger', 'fatigue', 'mood', 'cash', 'energy', 'battery',
+    'current_ticks_left', 'world_id'
+)
+
+
+def _csv_field(value: Optional[str]) -> str:
+    """Format a text field exactly as csv.writer would."""
+    if value is None:
+        return ''
+    if _CSV_SPECIAL.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def export_csv(worlds: Dict[str, WorldState], log_dir: Path, batch_size: int = 1000) -> None:
+    """
+    Export world data to CSV format for analysis.
+    
+    Rows are formatted directly rather than through the csv module: numeric
+    cells never need quoting, so only text cells are checked. The output is
+    identical to csv.writer's.
+    
+    Args:
+        worlds: Dictionary of worlds to export
+        log_dir: Directory to write CSV files
+        batch_size: Number of rows joined per write
+    """
+    if not ensure_log_dir(log_dir):
         return
     
     for world_id, world in worlds.items():
         csv_file = log_dir / f"{world_id}_actors.csv"
         
         try:
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
+            with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 # Header
-                writer.writerow([
-                    'actor_id', 'name', 'state', 'substate', 'current_action', 'location_id',
-                    'hunger', 'fatigue', 'mood', 'cash', 'energy', 'battery',
-                    'current_ticks_left', 'world_id'
-                ])
+                f.write(','.join(CSV_HEADER) + '\r\n')
                 
                 # Actor data
+                rows = []
                 for actor in world.actors.values():
-                    # Determine current action
-                    current_action = "Idle"
-                    if actor.substate:
-                        if actor.substate.startswith("action_"):
-                            current_action = actor.substate[7:].replace("_", " ").title()
-                        else:
-                            current_action = actor.substate.replace("_", " ").title()
-                    else:
-                        current_action = actor.state.name
+                    rows.append(
+                        f"{_csv_field(actor.id)},{_csv_field(actor.name)},{actor.state.name},"
+                        f"{_csv_field(actor.substate)},{_csv_field(actor.current_action)},"
+                        f"{_csv_field(actor.location_id)},{actor.hunger!r},{actor.fatigue!r},"
+                        f"{actor.mood!r},{actor.cash!r},{actor.energy!r},{actor.battery!r},"
+                        f"{actor.current_ticks_left},{_csv_field(actor.world_id)}\r\n"
+                    )
+                    if len(rows) >= batch_size:
+                        f.write(''.join(rows))
+                        rows.clear()
                     
-                    writer.writerow([
-                        actor.id, actor.name, actor.state.name, actor.substate,
-                        current_action, actor.location_id, actor.hunger, actor.fatigue, actor.mood,
-                        actor.cash, actor.energy, actor.battery, actor.current_ticks_left,
-                        actor.world_id
-                    ])
-                
+                f.write(''.join(rows))
                 f.flush()
             logger.info(f"Exported CSV data to {csv_file}")
         except (OSError, PermissionError) as e:
             logger.error(f"Cannot write CSV file {csv_file}: {e}")
+            _ready_dirs.discard(log_dir)
 
 
 def create_run_directory(base_dir: Path = None) -> Path:
@@ -350,6 +674,7 @@ def create_run_directory(base_dir: Path = None) -> Path:
     
     try:
         run_dir.mkdir(exist_ok=True)
+        _ready_dirs.add(run_dir)
         logger.info(f"Created run directory: {run_dir}")
     except (OSError, PermissionError) as e:
         logger.error(f"Cannot create run directory {run_dir}: {e}")
@@ -432,26 +757,30 @@ def get_log_file_stats(log_dir: Path) -> Dict[str, Any]:
         return stats
     
     try:
-        for file_path in log_dir.iterdir():
-            if file_path.is_file():
+        # One stat per file; DirEntry caches it and is_file() often needs no syscall
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
                 stats["total_files"] += 1
-                file_size = file_path.stat().st_size
+                file_size = st.st_size
                 stats["total_size_bytes"] += file_size
                 
                 # File type counting
-                suffix = file_path.suffix
+                suffix = PurePath(entry.name).suffix
                 stats["file_types"][suffix] = stats["file_types"].get(suffix, 0) + 1
                 
                 # Track largest file
                 if stats["largest_file"] is None or file_size > stats["largest_file"][1]:
-                    stats["largest_file"] = (str(file_path), file_size)
+                    stats["largest_file"] = (entry.path, file_size)
                 
                 # Track oldest and newest files
-                mtime = file_path.stat().st_mtime
+                mtime = st.st_mtime
                 if stats["oldest_file"] is None or mtime < stats["oldest_file"][1]:
-                    stats["oldest_file"] = (str(file_path), mtime)
+                    stats["oldest_file"] = (entry.path, mtime)
                 if stats["newest_file"] is None or mtime > stats["newest_file"][1]:
-                    stats["newest_file"] = (str(file_path), mtime)
+                    stats["newest_file"] = (entry.path, mtime)
     
     except (OSError, PermissionError) as e:
         logger.error(f"Error analyzing log directory {log_dir}: {e}")
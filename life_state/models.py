@@ -5,25 +5,32 @@ Defines all the fundamental data structures used throughout the system.
 Built with Pydantic for validation and serialization support.
 """
 
+import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from operator import attrgetter
+from typing import Any, List, Dict, Optional, Set, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, ConfigDict
 from uuid import uuid4
 
+from .interval_tree import IntervalTree
 from .states import State
 
 
 class TimeBlock(BaseModel):
-    """A calendar entry representing a scheduled time period."""
+    """
+    A calendar entry representing a scheduled time period.
+    
+    Blocks are frozen: calendars cache a view sorted by start_dt, which
+    stays valid only while the blocks themselves cannot change.
+    """
     
     start_dt: datetime = Field(description="Start datetime for this time block")
     end_dt: datetime = Field(description="End datetime for this time block")
     required_state: State = Field(description="State the actor should be in during this time")
     description: Optional[str] = Field(default=None, description="Optional description of the activity")
     
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True
-    )
+    model_config = ConfigDict(frozen=True)
     
     @field_validator('end_dt')
     @classmethod
@@ -42,18 +49,192 @@ class TimeBlock(BaseModel):
         return (self.start_dt < other.end_dt) and (self.end_dt > other.start_dt)
 
 
+class Calendar(list):
+    """
+    List of TimeBlocks that caches a start-sorted view of itself.
+    
+    Every list mutator bumps a version counter; the sorted view and an
+    interval tree over it are rebuilt lazily the first time they are read
+    after a change. Editing a block's times in place is not a list
+    mutation, so replace the block instead.
+    """
+    
+    # Bumped by every change to any Calendar, so world-level indexes over
+    # many calendars can tell when they are stale
+    mutations = 0
+    
+    def __init__(self, *args):
+        super().__init__(*args)
+        Calendar.mutations += 1
+        self._version = 0
+        self._sorted_version = -1
+        self._sorted: List[TimeBlock] = []
+        self._positions: List[int] = []
+        self._starts: List[datetime] = []
+        self._tree = IntervalTree([], [])
+        self._upcoming_key: Optional[Tuple[int, datetime, datetime]] = None
+        self._upcoming: List[TimeBlock] = []
+    
+    def __reduce__(self):
+        # Copies and pickles carry only the blocks; the cache is rebuilt on demand
+        return (self.__class__, (list(self),))
+    
+    def _changed(self) -> None:
+        self._version += 1
+        Calendar.mutations += 1
+    
+    def _refresh(self) -> None:
+        if self._sorted_version == self._version:
+            return
+        self._positions = sorted(range(len(self)), key=lambda i: self[i].start_dt)
+        self._sorted = [self[i] for i in self._positions]
+        self._starts = [block.start_dt for block in self._sorted]
+        self._tree = IntervalTree(self._starts, [block.end_dt for block in self._sorted])
+        self._sorted_version = self._version
+    
+    def sorted_blocks(self) -> List[TimeBlock]:
+        """Get the blocks in start order (stable for equal starts)."""
+        self._refresh()
+        return self._sorted
+    
+    def block_at(self, when: datetime) -> Optional[TimeBlock]:
+        """
+        Get the block active at a given time.
+        
+        Args:
+            when: Time to look up
+        
+        Returns:
+            The first block in calendar order with start_dt <= when < end_dt,
+            or None if no block is active
+        """
+        self._refresh()
+        active = self._tree.stab(when)
+        if not active:
+            return None
+        return self[min(self._positions[i] for i in active)]
+    
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Check whether any block overlaps the half-open period [start, end)."""
+        self._refresh()
+        return bool(self._tree.overlapping(start, end))
+    
+    def upcoming(self, start: datetime, end: datetime) -> List[TimeBlock]:
+        """
+        Get blocks active at start or starting within [start, end].
+        
+        Args:
+            start: Start of the window (usually the current time)
+            end: End of the window
+        
+        Returns:
+            Matching blocks in start order (a fresh list)
+        """
+        # Repeat queries for the same window, as several scheduler calls in
+        # one tick make, reuse the last answer until the calendar changes
+        key = (self._version, start, end)
+        if key != self._upcoming_key:
+            self._refresh()
+            starts = self._starts
+            # Blocks already running at start, then blocks starting in the window
+            running = [self._sorted[i] for i in self._tree.stab(start) if starts[i] < start]
+            self._upcoming = running + self._sorted[bisect_left(starts, start):bisect_right(starts, end)]
+            self._upcoming_key = key
+        return list(self._upcoming)
+    
+    def overlapping_pairs(self) -> List[Tuple[int, int]]:
+        """
+        Find every pair of overlapping blocks.
+        
+        Returns:
+            Sorted (i, j) calendar index pairs with i < j
+        """
+        self._refresh()
+        starts, positions = self._starts, self._positions
+        pairs = []
+        # Blocks starting after block s but before it ends are exactly the
+        # later-starting blocks that overlap it, so they form one slice
+        for s, block in enumerate(self._sorted):
+            i = positions[s]
+            for t in range(s + 1, bisect_left(starts, block.end_dt, s + 1)):
+                j = positions[t]
+                pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
+        return pairs
+    
+    def append(self, block):
+        super().append(block)
+        self._changed()
+    
+    def extend(self, blocks):
+        super().extend(blocks)
+        self._changed()
+    
+    def insert(self, index, block):
+        super().insert(index, block)
+        self._changed()
+    
+    def remove(self, block):
+        super().remove(block)
+        self._changed()
+    
+    def pop(self, index=-1):
+        block = super().pop(index)
+        self._changed()
+        return block
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+    
+    def reverse(self):
+        super().reverse()
+        self._changed()
+    
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+    
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+    
+    def __iadd__(self, blocks):
+        result = super().__iadd__(blocks)
+        self._changed()
+        return result
+    
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._changed()
+        return result
+
+
 class Location(BaseModel):
-    """A location where actors can be present."""
+    """
+    A location where actors can be present.
+    
+    Locations are frozen, so worlds (and their forks) can share the same
+    instances.
+    """
     
     id: str = Field(description="Unique identifier for the location")
     name: str = Field(description="Human-readable name of the location")
     category: str = Field(description="Category of location (public, home, special)")
     
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
     
     @classmethod
     def create_default_locations(cls) -> List["Location"]:
-        """Create the standard set of locations for the simulation."""
+        """Get the standard set of locations for the simulation (built once, shared)."""
+        return list(_DEFAULT_LOCATIONS)
+    
+    @classmethod
+    def _build_default_locations(cls) -> List["Location"]:
         locations = []
         
         # Public locations (14)
@@ -65,7 +246,7 @@ class Location(BaseModel):
         
         for name in public_locations:
             locations.append(cls(
-                id=f"public_{name.lower().replace(' ', '_').replace('-', '_')}",
+                id=sys.intern(f"public_{name.lower().replace(' ', '_').replace('-', '_')}"),
                 name=name,
                 category="public"
             ))
@@ -73,7 +254,7 @@ class Location(BaseModel):
         # Home locations (12)
         for letter in "ABCDEFGHIJKL":
             locations.append(cls(
-                id=f"home_{letter.lower()}",
+                id=sys.intern(f"home_{letter.lower()}"),
                 name=f"Home-{letter}",
                 category="home"
             ))
@@ -88,6 +269,26 @@ class Location(BaseModel):
         return locations
 
 
+_DEFAULT_LOCATIONS: Tuple[Location, ...] = tuple(Location._build_default_locations())
+
+
+# Stable small-integer handles for the default locations. Hot paths index
+# per-location tables with these instead of comparing id strings; any id that
+# is not part of the default set maps to UNKNOWN_LOCATION_INDEX.
+LOCATION_IDS: Tuple[str, ...] = tuple(location.id for location in _DEFAULT_LOCATIONS)
+LOCATION_INDEX: Dict[str, int] = {location_id: i for i, location_id in enumerate(LOCATION_IDS)}
+UNKNOWN_LOCATION_INDEX: int = len(LOCATION_IDS)
+
+
+def location_index(location_id: str) -> int:
+    """Get the integer handle for a location id (UNKNOWN_LOCATION_INDEX if not registered)."""
+    return LOCATION_INDEX.get(location_id, UNKNOWN_LOCATION_INDEX)
+
+
+# Every valid tick duration, so advancing a clock allocates no timedelta
+_TICK_DELTAS: Dict[int, timedelta] = {minutes: timedelta(minutes=minutes) for minutes in range(1, 61)}
+
+
 class WorldClock(BaseModel):
     """Global time management for the simulation."""
     
@@ -97,9 +298,15 @@ class WorldClock(BaseModel):
     
     model_config = ConfigDict()
     
+    @property
+    def tick_delta(self) -> timedelta:
+        """Duration of one tick."""
+        minutes = self.tick_duration_minutes
+        return _TICK_DELTAS.get(minutes) or timedelta(minutes=minutes)
+    
     def advance_tick(self) -> None:
         """Advance the world clock by one tick."""
-        self.current_time += timedelta(minutes=self.tick_duration_minutes)
+        self.current_time += self.tick_delta
         self.tick_count += 1
     
     def get_tick_start_time(self) -> datetime:
@@ -108,7 +315,30 @@ class WorldClock(BaseModel):
     
     def get_tick_end_time(self) -> datetime:
         """Get the end time of the current tick."""
-        return self.current_time + timedelta(minutes=self.tick_duration_minutes)
+        return self.current_time + self.tick_delta
+
+
+# Fetches every field a snapshot record needs in one C call
+_SNAPSHOT_FIELDS = attrgetter(
+    "id", "name", "state", "substate", "location_id", "hunger", "fatigue", "mood",
+    "cash", "energy", "battery", "current_ticks_left", "world_id"
+)
+_round = round
+
+# Snapshot records store each resource r as the integer round(r, 2) * SNAPSHOT_SCALE
+SNAPSHOT_SCALE = 100
+SNAPSHOT_RESOURCES = ("hunger", "fatigue", "mood", "cash", "energy", "battery")
+
+# Substate tag -> display name; substates come from a small fixed set of
+# action and transition tags, so this fills on first use and then only hits
+_ACTION_DISPLAY: Dict[str, str] = {}
+
+
+def _render_substate(substate: str) -> str:
+    """Render a substate tag such as "action_grab_a_snack" as "Grab A Snack"."""
+    if substate.startswith("action_"):
+        substate = substate[7:]
+    return substate.replace("_", " ").title()
 
 
 class Actor(BaseModel):
@@ -121,7 +351,7 @@ class Actor(BaseModel):
     world_id: str = Field(description="Identifies which forked world this actor belongs to")
     
     # Scheduling (used by Prompt 2 scheduler)
-    calendar: List[TimeBlock] = Field(default_factory=list, description="Scheduled time blocks")
+    calendar: List[TimeBlock] = Field(default_factory=Calendar, description="Scheduled time blocks")
     
     # Current state
     state: State = Field(default=State.Idle, description="Current state of the actor")
@@ -141,43 +371,111 @@ class Actor(BaseModel):
     # Action duration tracking (added for Prompt 2)
     current_ticks_left: int = Field(default=0, ge=0, description="Remaining ticks for current action")
     
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True
-    )
+    # (tick, field values, record) from the last to_snapshot_dict call
+    _snapshot: Optional[Tuple[int, tuple, Dict[str, Any]]] = PrivateAttr(default=None)
     
-    @field_validator('hunger', 'fatigue', 'energy', 'battery')
+    @field_validator('calendar')
     @classmethod
-    def validate_percentage_resources(cls, v):
-        """Validate that percentage resources are within 0-100 range."""
-        if not (0.0 <= v <= 100.0):
-            raise ValueError(f'Resource value must be between 0 and 100, got {v}')
-        return v
-    
-    @field_validator('mood')
-    @classmethod
-    def validate_mood_range(cls, v):
-        """Validate that mood is within -2 to +2 range."""
-        if not (-2.0 <= v <= 2.0):
-            raise ValueError(f'Mood must be between -2 and +2, got {v}')
-        return v
+    def wrap_calendar(cls, v):
+        """Store the calendar as a Calendar so its sorted view can be cached."""
+        return v if isinstance(v, Calendar) else Calendar(v)
     
     def update_resources(self, hunger_delta: float, fatigue_delta: float, mood_delta: float) -> None:
         """Update actor resources, clamping to valid ranges."""
-        self.hunger = max(0.0, min(100.0, self.hunger + hunger_delta))
-        self.fatigue = max(0.0, min(100.0, self.fatigue + fatigue_delta))
-        self.mood = max(-2.0, min(2.0, self.mood + mood_delta))
+        # Inline comparisons rather than max/min calls; <= maps -0.0 to 0.0 as max() did
+        hunger = self.hunger + hunger_delta
+        self.hunger = 0.0 if hunger <= 0.0 else 100.0 if hunger >= 100.0 else hunger
+        fatigue = self.fatigue + fatigue_delta
+        self.fatigue = 0.0 if fatigue <= 0.0 else 100.0 if fatigue >= 100.0 else fatigue
+        mood = self.mood + mood_delta
+        self.mood = -2.0 if mood <= -2.0 else 2.0 if mood >= 2.0 else mood
+    
+    @property
+    def current_action(self) -> str:
+        """Human-readable action derived from the substate, or the state name."""
+        if self.substate:
+            display = _ACTION_DISPLAY.get(self.substate)
+            if display is None:
+                display = _ACTION_DISPLAY[self.substate] = _render_substate(self.substate)
+            return display
+        return self.state.name
+    
+    def to_snapshot_dict(self, tick: int) -> Dict[str, Any]:
+        """
+        Get the actor's log record, with resources in fixed point.
+        
+        Each resource is stored as an integer, its value rounded to 2 places
+        times SNAPSHOT_SCALE, which encodes more compactly than the float.
+        The record is cached and shared by every writer emitting the same
+        tick while the fields it is built from are unchanged (so copies and
+        same-tick edits, such as a time jump, are never served a stale
+        record). Callers must not modify it.
+        
+        Args:
+            tick: World tick count the record describes
+        
+        Returns:
+            Dict of identity, state, location and quantized resources
+        """
+        # Read private attributes through the private dict: plain attribute
+        # access only reaches them via BaseModel.__getattr__ after a failed
+        # lookup, which costs more than rebuilding the record
+        private = self.__pydantic_private__
+        fields = _SNAPSHOT_FIELDS(self)
+        cached = private['_snapshot']
+        if cached is not None and cached[0] == tick and cached[1] == fields:
+            return cached[2]
+        
+        (actor_id, name, state, substate, location_id, hunger, fatigue, mood,
+         cash, energy, battery, ticks_left, world_id) = fields
+        record = {
+            "id": actor_id,
+            "name": name,
+            "state": state.name,
+            "substate": substate,
+            "current_action": self.current_action,
+            "location_id": location_id,
+            # Rounding to 2 places first keeps q / SNAPSHOT_SCALE == round(x, 2)
+            "hunger": _round(_round(hunger, 2) * SNAPSHOT_SCALE),
+            "fatigue": _round(_round(fatigue, 2) * SNAPSHOT_SCALE),
+            "mood": _round(_round(mood, 2) * SNAPSHOT_SCALE),
+            "cash": _round(_round(cash, 2) * SNAPSHOT_SCALE),
+            "energy": _round(_round(energy, 2) * SNAPSHOT_SCALE),
+            "battery": _round(_round(battery, 2) * SNAPSHOT_SCALE),
+            "current_ticks_left": ticks_left,
+            "world_id": world_id
+        }
+        private['_snapshot'] = (tick, fields, record)
+        return record
+    
+    def _indexed_calendar(self) -> Calendar:
+        if not isinstance(self.calendar, Calendar):
+            # A plain list was assigned directly; adopt it so the cache applies
+            self.calendar = Calendar(self.calendar)
+        return self.calendar
+    
+    @property
+    def sorted_calendar(self) -> List[TimeBlock]:
+        """Calendar blocks in start order, cached until the calendar is modified."""
+        return self._indexed_calendar().sorted_blocks()
     
     def get_current_time_block(self, current_time: datetime) -> Optional[TimeBlock]:
         """Get the time block that should be active at the current time."""
-        for block in self.calendar:
-            if block.start_dt <= current_time < block.end_dt:
-                return block
-        return None
+        return self._indexed_calendar().block_at(current_time)
+    
+    def get_upcoming_time_blocks(self, current_time: datetime, end_time: datetime) -> List[TimeBlock]:
+        """Get blocks active at current_time or starting by end_time, in start order."""
+        return self._indexed_calendar().upcoming(current_time, end_time)
+    
+    def get_overlapping_block_pairs(self) -> List[Tuple[int, int]]:
+        """Get sorted (i, j) calendar index pairs of overlapping blocks, i < j."""
+        return self._indexed_calendar().overlapping_pairs()
     
     def is_available_at(self, start_time: datetime, end_time: datetime) -> bool:
         """Check if the actor is available during a given time period."""
-        test_block = TimeBlock(start_dt=start_time, end_dt=end_time, required_state=State.Idle)
-        return not any(block.overlaps_with(test_block) for block in self.calendar)
+        if end_time <= start_time:
+            raise ValueError('end_dt must be after start_dt')
+        return not self._indexed_calendar().overlaps(start_time, end_time)
 
 
 class WorldState(BaseModel):
@@ -189,13 +487,19 @@ class WorldState(BaseModel):
     world_id: str = Field(default="main", description="Unique identifier for this world instance")
     prob_mass: Optional[float] = Field(default=None, description="Probability mass for timeline forking")
     
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True
-    )
+    # (staleness key, interval tree over every actor's blocks, owner id per block)
+    _calendar_index: Optional[Tuple[tuple, IntervalTree, List[str]]] = PrivateAttr(default=None)
     
     def add_actor(self, actor: Actor) -> None:
-        """Add an actor to the world."""
-        actor.world_id = self.world_id
+        """
+        Add an actor to the world.
+        
+        Id strings are interned so the equality checks in location filters
+        usually succeed on identity alone.
+        """
+        actor.world_id = sys.intern(self.world_id)
+        actor.location_id = sys.intern(actor.location_id)
+        actor.home_id = sys.intern(actor.home_id)
         self.actors[actor.id] = actor
     
     def remove_actor(self, actor_id: str) -> bool:
@@ -218,14 +522,82 @@ class WorldState(BaseModel):
         """Get a location by ID."""
         return self.locations.get(location_id)
     
+    def _calendar_key(self) -> tuple:
+        return (Calendar.mutations, [id(actor.calendar) for actor in self.actors.values()])
+    
+    def actors_with_active_blocks(self, when: datetime) -> Set[str]:
+        """
+        Get the ids of actors with any calendar block active at a given time.
+        
+        Answered with one stabbing query over a tree of every actor's blocks,
+        rebuilt only after a calendar changes or is replaced.
+        
+        Args:
+            when: Time to look up
+        
+        Returns:
+            Set of actor ids
+        """
+        index = self._calendar_index
+        if index is None or index[0] != self._calendar_key():
+            entries = sorted(
+                (block.start_dt, block.end_dt, actor.id)
+                for actor in self.actors.values()
+                for block in actor._indexed_calendar()
+            )
+            tree = IntervalTree([entry[0] for entry in entries], [entry[1] for entry in entries])
+            # Key after building, since building adopts plain-list calendars
+            index = self._calendar_index = (self._calendar_key(), tree, [entry[2] for entry in entries])
+        
+        _, tree, owners = index
+        return {owners[i] for i in tree.stab(when)}
+    
     def get_actors_at_location(self, location_id: str) -> List[Actor]:
         """Get all actors currently at a specific location."""
         return [actor for actor in self.actors.values() if actor.location_id == location_id]
     
+    def count_actors_at_location(self, location_id: str, exclude_id: Optional[str] = None) -> int:
+        """Count actors currently at a location, optionally leaving one actor out."""
+        return sum(1 for actor in self.actors.values()
+                   if actor.location_id == location_id and actor.id != exclude_id)
+    
     def get_actors_in_state(self, state: State) -> List[Actor]:
         """Get all actors currently in a specific state."""
         return [actor for actor in self.actors.values() if actor.state == state]
     
+    def count_actors_by_state(self) -> Dict[State, int]:
+        """Count actors in each state in a single pass, omitting empty states."""
+        counts: Dict[State, int] = {}
+        for actor in self.actors.values():
+            counts[actor.state] = counts.get(actor.state, 0) + 1
+        return counts
+    
+    def get_resource_totals(self) -> Dict[str, float]:
+        """
+        Sum actor resources and count sleepers in a single pass.
+        
+        Returns:
+            Dict with n_actors, hunger, fatigue, mood and cash sums, and sleeping count
+        """
+        sum_hunger = sum_fatigue = sum_mood = sum_cash = 0.0
+        sleeping = 0
+        for actor in self.actors.values():
+            sum_hunger += actor.hunger
+            sum_fatigue += actor.fatigue
+            sum_mood += actor.mood
+            sum_cash += actor.cash
+            if actor.state == State.Sleeping:
+                sleeping += 1
+        
+        return {
+            'n_actors': len(self.actors),
+            'hunger': sum_hunger,
+            'fatigue': sum_fatigue,
+            'mood': sum_mood,
+            'cash': sum_cash,
+            'sleeping': sleeping,
+        }
+    
     # TODO: Prompt 2 will add methods for:
     # - World forking/cloning for time-jump scenarios
     # - Action execution and probability calculations
@@ -10,12 +10,18 @@ from typing import Dict, Any, List, Tuple, Optional
 from enum import Enum, auto
 import logging
 
-from .actions import Action, get_available_actions, TIME_JUMP
+from .actions import Action, Presence, get_available_actions, TIME_JUMP
 from .states import State
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Hours at which eating is more likely
+_MEAL_HOURS = frozenset([7, 8, 12, 13, 18, 19])
+
+# Resulting states whose probability depends on the hour of day
+_HOUR_DEPENDENT_STATES = frozenset([State.Sleeping, State.Eating, State.Focused_Work])
+
 
 def mood_factor(mood: float) -> float:
     """
@@ -89,7 +95,9 @@ def presence_boost(n_present: int) -> float:
     return min(n_present, 3) * 0.2
 
 
-def calculate_action_probability(action: Action, actor, world_state) -> float:
+def calculate_action_probability(action: Action, actor, world_state,
+                                 n_present: Optional[int] = None,
+                                 hour: Optional[int] = None) -> float:
     """
     Calculate the probability of an actor choosing a specific action.
     
@@ -97,6 +105,10 @@ def calculate_action_probability(action: Action, actor, world_state) -> float:
         action: The action being considered
         actor: The actor considering the action
         world_state: Current world state
+        n_present: Number of other actors at the actor's location, if the
+            caller already counted them; counted here when needed otherwise
+        hour: Current hour of the world clock, if the caller already read it;
+            read here when needed otherwise
         
     Returns:
         float: Calculated probability weight (always >= 0)
@@ -124,42 +136,43 @@ def calculate_action_probability(action: Action, actor, world_state) -> float:
         prob *= fatigue_factor(actor.fatigue)
     
     # Apply presence boost for social actions
-    if action.requires_presence == "Any":
-        actors_at_location = world_state.get_actors_at_location(actor.location_id)
-        n_present = len([a for a in actors_at_location if a.id != actor.id])
+    if action.requires_presence is Presence.Any:
+        if n_present is None:
+            n_present = world_state.count_actors_at_location(actor.location_id, exclude_id=actor.id)
         prob *= (1.0 + presence_boost(n_present))
     
     # Special modifiers for specific action types
-    if action.resulting_state == State.Sleeping:
-        # More likely to sleep when very tired or at night
+    resulting_state = action.resulting_state
+    if hour is None and resulting_state in _HOUR_DEPENDENT_STATES:
         hour = world_state.clock.current_time.hour
+    
+    if resulting_state == State.Sleeping:
+        # More likely to sleep when very tired or at night
         if hour >= 22 or hour <= 6:
             prob *= 2.0
         if actor.fatigue > 80:
             prob *= 3.0
     
-    elif action.resulting_state == State.Eating:
+    elif resulting_state == State.Eating:
         # More likely to eat when very hungry or at meal times
-        hour = world_state.clock.current_time.hour
-        if hour in [7, 8, 12, 13, 18, 19]:  # Meal times
+        if hour in _MEAL_HOURS:
             prob *= 1.5
         if actor.hunger > 70:
             prob *= 2.5
     
-    elif action.resulting_state == State.Focused_Work:
+    elif resulting_state == State.Focused_Work:
         # More likely to work during business hours
-        hour = world_state.clock.current_time.hour
         if 9 <= hour <= 17:
             prob *= 2.0
         else:
             prob *= 0.3
     
-    elif action.resulting_state == State.Exercising:
+    elif resulting_state == State.Exercising:
         # Less likely to exercise when very tired
         if actor.fatigue > 70:
             prob *= 0.5
     
-    elif action.resulting_state == State.Socialising:
+    elif resulting_state == State.Socialising:
         # More likely to socialize with good mood
         if actor.mood > 1.0:
             prob *= 1.5
@@ -170,7 +183,8 @@ def calculate_action_probability(action: Action, actor, world_state) -> float:
     return max(0.0, prob)
 
 
-def choose_action(actor, world_state, core_only: bool = True) -> Optional[Action]:
+def choose_action(actor, world_state, core_only: bool = True,
+                  available_actions: Optional[List[Action]] = None) -> Optional[Action]:
     """
     Choose an action for an actor using weighted probability selection.
     
@@ -178,22 +192,32 @@ def choose_action(actor, world_state, core_only: bool = True) -> Optional[Action
         actor: The actor choosing an action
         world_state: Current world state
         core_only: If True, only consider core actions (Prompt 1 states)
+        available_actions: Actions already computed for this actor (e.g. by
+            get_available_actions_batch); looked up when omitted
         
     Returns:
         Selected action or None if no valid actions
     """
     try:
         # Get available actions
-        available_actions = get_available_actions(actor, world_state, core_only=core_only)
+        if available_actions is None:
+            available_actions = get_available_actions(actor, world_state, core_only=core_only)
+        else:
+            available_actions = list(available_actions)
         
         if not available_actions:
             logger.debug(f"No available actions for actor {actor.name}")
             return None
         
-        # Calculate probabilities for each action
+        # Calculate probabilities for each action, counting company at most once
+        # and reading the clock once per decision
         action_probs = []
+        n_present = None
+        hour = world_state.clock.current_time.hour
         for action in available_actions:
-            prob = calculate_action_probability(action, actor, world_state)
+            if n_present is None and action.requires_presence is Presence.Any:
+                n_present = world_state.count_actors_at_location(actor.location_id, exclude_id=actor.id)
+            prob = calculate_action_probability(action, actor, world_state, n_present, hour)
             action_probs.append(prob)
         
         # Check if time jump should be inserted (only if not core_only)
@@ -285,9 +309,9 @@ def apply_need_modifiers(base_prob: float, actor, action: Action) -> float:
         modified_prob *= 0.3  # Not tired, resting action
     
     # Mood-based modifiers
-    if actor.mood < -1.5 and action.requires_presence == "Any":
+    if actor.mood < -1.5 and action.requires_presence is Presence.Any:
         modified_prob *= 0.3  # Very sad, avoid social actions
-    elif actor.mood > 1.5 and action.requires_presence == "Any":
+    elif actor.mood > 1.5 and action.requires_presence is Presence.Any:
         modified_prob *= 1.8  # Very happy, prefer social actions
     
     return max(0.0, modified_prob)
@@ -317,7 +341,7 @@ def apply_environmental_modifiers(base_prob: float, actor, action: Action, world
                 modified_prob *= 1.3
         elif current_location.category == "public":
             # In public - more likely to do public activities
-            if action.requires_presence == "Any":
+            if action.requires_presence is Presence.Any:
                 modified_prob *= 1.2
     
     # Time-based modifiers
@@ -367,8 +391,10 @@ def apply_schedule_modifiers(base_prob: float, actor, action: Action, world_stat
     """
     modified_prob = base_prob
     
+    current_time = world_state.clock.current_time
+    
     # Check if there's a current time block
-    current_block = actor.get_current_time_block(world_state.clock.current_time)
+    current_block = actor.get_current_time_block(current_time)
     if current_block:
         # If action matches scheduled state, boost probability
         if action.resulting_state == current_block.required_state:
@@ -379,8 +405,8 @@ def apply_schedule_modifiers(base_prob: float, actor, action: Action, world_stat
     
     # Check upcoming schedule (next hour)
     try:
-        next_hour = world_state.clock.current_time.replace(
-            hour=(world_state.clock.current_time.hour + 1) % 24,
+        next_hour = current_time.replace(
+            hour=(current_time.hour + 1) % 24,
             minute=0
         )
         
@@ -7,9 +7,12 @@ multi-world simulation coordination, performance monitoring, and event logging.
 TODO: integrate live WebSocket broadcasting in Prompt 3
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+import multiprocessing
+import os
+import random
 import time
 import json
 import logging
@@ -27,7 +30,7 @@ logger = logging.getLogger(__name__)
 def run(worlds: Dict[str, WorldState], 
         end_dt: datetime, 
         log_dir: Path,
-        tick_callback: Optional[Callable[[Dict[str, WorldState]], None]] = None) -> None:
+        tick_callback: Optional[Callable[[Dict[str, WorldState]], None]] = None) -> 'SimulationMetrics':
     """
     Run the main simulation loop across multiple worlds.
     
@@ -36,6 +39,9 @@ def run(worlds: Dict[str, WorldState],
         end_dt: End datetime for simulation
         log_dir: Directory to write log files
         tick_callback: Optional callback function called after each tick
+    
+    Returns:
+        SimulationMetrics: Metrics collected during the run
     """
     from . import io_utils
     
@@ -50,70 +56,152 @@ def run(worlds: Dict[str, WorldState],
     
     logger.info(f"Starting simulation with {len(worlds)} worlds until {end_dt}")
     
-    # Main simulation loop
+    # Main simulation loop; snapshot files stay open (buffered) for the whole run
     tick_count = 0
-    while worlds:  # Continue while there are active worlds
-        tick_start = time.time()
-        
-        # Process each world
-        finished_worlds = []
-        for world_id, world in worlds.items():
-            if world.clock.current_time >= end_dt:
-                finished_worlds.append(world_id)
-                continue
+    with io_utils.SnapshotWriter(log_dir, background=True) as snapshots:
+        while worlds:  # Continue while there are active worlds
+            tick_start = time.time()
             
-            logger.debug(f"Processing world {world_id} at tick {world.clock.tick_count}")
+            # Process each world
+            finished_worlds = []
+            for world_id, world in worlds.items():
+                if world.clock.current_time >= end_dt:
+                    finished_worlds.append(world_id)
+                    continue
+                
+                logger.debug(f"Processing world {world_id} at tick {world.clock.tick_count}")
+                
+                # Check calendars and filter actions for every ready actor in one batch;
+                # only actors with an active block can be overridden
+                world_actors = list(world.actors.values())
+                ready = [actor for actor in world_actors if actor.current_ticks_left <= 0]
+                scheduled = world.actors_with_active_blocks(world.clock.current_time)
+                forced = calendar_scheduler.batch_override_states(
+                    [actor for actor in ready if actor.id in scheduled], world.clock
+                ) if scheduled else {}
+                available = actions.get_available_actions_batch(ready, core_only=True)
+                
+                # Process each actor in the world
+                for actor in world_actors:
+                    if actor.current_ticks_left > 0:
+                        # Actor is still busy with previous action
+                        actor.current_ticks_left -= 1
+                        logger.debug(f"Actor {actor.name} busy for {actor.current_ticks_left} more ticks")
+                    else:
+                        # Actor is ready for a new action
+                        process_actor_action(actor, world, logger_sim, available.get(actor.id), forced)
+                
+                # Advance world clock
+                world.clock.advance_tick()
+                
+                # Record metrics
+                metrics.record_tick(world)
             
-            # Process each actor in the world
-            for actor in list(world.actors.values()):
-                if actor.current_ticks_left > 0:
-                    # Actor is still busy with previous action
-                    actor.current_ticks_left -= 1
-                    logger.debug(f"Actor {actor.name} busy for {actor.current_ticks_left} more ticks")
-                else:
-                    # Actor is ready for a new action
-                    process_actor_action(actor, world, logger_sim)
+            # Remove finished worlds
+            for world_id in finished_worlds:
+                logger.info(f"World {world_id} finished at {worlds[world_id].clock.current_time}")
+                del worlds[world_id]
             
-            # Advance world clock
-            world.clock.advance_tick()
+            # Write snapshot for remaining worlds
+            if worlds:
+                snapshots.write(worlds)
             
-            # Record metrics
-            metrics.record_tick(world)
-        
-        # Remove finished worlds
-        for world_id in finished_worlds:
-            logger.info(f"World {world_id} finished at {worlds[world_id].clock.current_time}")
-            del worlds[world_id]
-        
-        # Write snapshot for remaining worlds
-        if worlds:
-            io_utils.write_snapshot(worlds, log_dir)
-        
-        # Call tick callback if provided
-        if tick_callback:
-            tick_callback(worlds)
-        
-        # Performance tracking
-        tick_duration = time.time() - tick_start
-        metrics.performance_samples.append(tick_duration)
-        
-        # Prune old performance samples (keep last 100)
-        if len(metrics.performance_samples) > 100:
-            metrics.performance_samples = metrics.performance_samples[-100:]
-        
-        tick_count += 1
-        
-        # Log progress periodically
-        if tick_count % 50 == 0:
-            logger.info(f"Completed {tick_count} ticks, {len(worlds)} worlds remaining")
+            # Call tick callback if provided
+            if tick_callback:
+                tick_callback(worlds)
+            
+            # Performance tracking
+            tick_duration = time.time() - tick_start
+            metrics.performance_samples.append(tick_duration)
+            
+            # Prune old performance samples (keep last 100)
+            if len(metrics.performance_samples) > 100:
+                metrics.performance_samples = metrics.performance_samples[-100:]
+            
+            tick_count += 1
+            
+            # Log progress periodically
+            if tick_count % 50 == 0:
+                logger.info(f"Completed {tick_count} ticks, {len(worlds)} worlds remaining")
     
     logger.info(f"Simulation completed after {tick_count} ticks")
     
     # Write final summary
     io_utils.write_simulation_summary(worlds, metrics, log_dir)
+    
+    return metrics
 
 
-def process_actor_action(actor, world: WorldState, logger_sim: 'SimulationLogger') -> None:
+def _run_world_worker(task: Tuple[str, WorldState, datetime, Path, Optional[int]]
+                      ) -> Tuple[str, WorldState, 'SimulationMetrics']:
+    """
+    Pool worker: run one world to completion in its own process.
+    
+    Args:
+        task: (world_id, world, end_dt, log_dir, seed)
+    
+    Returns:
+        Tuple of world_id, the final world state and its metrics
+    """
+    world_id, world, end_dt, log_dir, seed = task
+    if seed is not None:
+        random.seed(seed)
+    
+    metrics = run({world_id: world}, end_dt, log_dir)
+    return world_id, world, metrics
+
+
+def run_independent_worlds(worlds: Dict[str, WorldState],
+                           end_dt: datetime,
+                           log_dir: Path,
+                           n_procs: Optional[int] = None,
+                           seed: Optional[int] = None) -> Dict[str, Tuple[WorldState, 'SimulationMetrics']]:
+    """
+    Run independent worlds in parallel, one worker process per world.
+    
+    Each world runs the regular simulation loop in isolation and writes its
+    logs to log_dir/<world_id>. On platforms with fork the workers inherit
+    the prebuilt action tables instead of rebuilding them. Worlds must not
+    interact; use run_parallel_simulation for forking timelines.
+    
+    Args:
+        worlds: Dictionary of world_id -> WorldState
+        end_dt: End datetime for simulation
+        log_dir: Directory to write per-world log subdirectories
+        n_procs: Number of worker processes (defaults to os.cpu_count())
+        seed: Optional base random seed; world i is seeded with seed + i
+    
+    Returns:
+        Dict mapping world_id to (final world state, metrics)
+    """
+    if not worlds:
+        return {}
+    
+    n_procs = min(n_procs or os.cpu_count() or 1, len(worlds))
+    tasks = [
+        (world_id, world, end_dt, log_dir / world_id, None if seed is None else seed + i)
+        for i, (world_id, world) in enumerate(worlds.items())
+    ]
+    
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    
+    logger.info(f"Running {len(tasks)} independent worlds on {n_procs} processes")
+    
+    results = {}
+    with context.Pool(processes=n_procs) as pool:
+        for world_id, world, metrics in pool.imap_unordered(_run_world_worker, tasks):
+            results[world_id] = (world, metrics)
+            logger.info(f"World {world_id} finished after {metrics.tick_count} ticks")
+    
+    return results
+
+
+def process_actor_action(actor, world: WorldState, logger_sim: 'SimulationLogger',
+                         available_actions: Optional[List[actions.Action]] = None,
+                         forced_states: Optional[Dict[str, State]] = None) -> None:
     """
     Process action selection and execution for a single actor.
     
@@ -121,9 +209,15 @@ def process_actor_action(actor, world: WorldState, logger_sim: 'SimulationLogger
         actor: The actor to process
         world: The world state
         logger_sim: Event logger
+        available_actions: Precomputed core actions for this actor, if any
+        forced_states: Precomputed calendar overrides from
+            calendar_scheduler.batch_override_states, if any
     """
     # Check for calendar override first
-    forced_state = calendar_scheduler.override_state(actor, world.clock)
+    if forced_states is not None:
+        forced_state = forced_states.get(actor.id)
+    else:
+        forced_state = calendar_scheduler.override_state(actor, world.clock)
     
     if forced_state:
         # Calendar requires a specific state
@@ -141,7 +235,8 @@ def process_actor_action(actor, world: WorldState, logger_sim: 'SimulationLogger
             logger_sim.log_state_change(actor, old_state, State.Idle, "calendar_conflict")
     else:
         # Normal probability-based action selection
-        chosen_action = probability.choose_action(actor, world, core_only=True)
+        chosen_action = probability.choose_action(actor, world, core_only=True,
+                                                  available_actions=available_actions)
         
         if chosen_action:
             # Handle special time jump action
@@ -234,19 +329,22 @@ def run_parallel_simulation(world_manager: WorldManager,
         num_ticks: Number of ticks to simulate
         tick_callback: Optional callback after each tick
     """
-    import random
-    
     logger.info(f"Starting parallel simulation for {num_ticks} ticks")
     
     for tick in range(num_ticks):
         # Process all worlds
         for world in world_manager.worlds.values():
-            for actor in list(world.actors.values()):
+            world_actors = list(world.actors.values())
+            available = actions.get_available_actions_batch(
+                [actor for actor in world_actors if actor.current_ticks_left <= 0], core_only=False
+            )
+            for actor in world_actors:
                 if actor.current_ticks_left > 0:
                     actor.current_ticks_left -= 1
                 else:
                     # Process actor action (simplified version)
-                    chosen_action = probability.choose_action(actor, world, core_only=False)
+                    chosen_action = probability.choose_action(actor, world, core_only=False,
+                                                              available_actions=available.get(actor.id))
                     if chosen_action:
                         if chosen_action == TIME_JUMP:
                             # Create actual world fork
@@ -300,11 +398,16 @@ def simulate_until_condition(world_state: WorldState,
             break
         
         # Process one tick
-        for actor in list(world_state.actors.values()):
+        world_actors = list(world_state.actors.values())
+        available = actions.get_available_actions_batch(
+            [actor for actor in world_actors if actor.current_ticks_left <= 0], core_only=True
+        )
+        for actor in world_actors:
             if actor.current_ticks_left > 0:
                 actor.current_ticks_left -= 1
             else:
-                chosen_action = probability.choose_action(actor, world_state, core_only=True)
+                chosen_action = probability.choose_action(actor, world_state, core_only=True,
+                                                          available_actions=available.get(actor.id))
                 if chosen_action and chosen_action != TIME_JUMP:
                     actions.apply_action(chosen_action, actor, world_state)
         
@@ -356,11 +459,8 @@ class SimulationMetrics:
         self.tick_count += 1
         
         # Record state distribution
-        state_counts = {}
-        for state in State:
-            count = len(world_state.get_actors_in_state(state))
-            if count > 0:
-                state_counts[state.name] = count
+        counts = world_state.count_actors_by_state()
+        state_counts = {state.name: counts[state] for state in State if state in counts}
         
         self.state_history.append({
             'tick': self.tick_count,
@@ -371,18 +471,16 @@ class SimulationMetrics:
         
         # Record average resources
         if world_state.actors:
-            avg_hunger = sum(a.hunger for a in world_state.actors.values()) / len(world_state.actors)
-            avg_fatigue = sum(a.fatigue for a in world_state.actors.values()) / len(world_state.actors)
-            avg_mood = sum(a.mood for a in world_state.actors.values()) / len(world_state.actors)
-            avg_cash = sum(a.cash for a in world_state.actors.values()) / len(world_state.actors)
+            totals = world_state.get_resource_totals()
+            n_actors = totals['n_actors']
             
             self.resource_history.append({
                 'tick': self.tick_count,
                 'world_id': world_state.world_id,
-                'hunger': avg_hunger,
-                'fatigue': avg_fatigue,
-                'mood': avg_mood,
-                'cash': avg_cash
+                'hunger': totals['hunger'] / n_actors,
+                'fatigue': totals['fatigue'] / n_actors,
+                'mood': totals['mood'] / n_actors,
+                'cash': totals['cash'] / n_actors
             })
         
         # Record world-specific metrics
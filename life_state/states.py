@@ -5,15 +5,20 @@ Defines all possible actor states and basic transition logic.
 Core states are implemented in Prompt 1, extended states reserved for Prompt 2.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from .models import Actor
 
 
-class State(Enum):
-    """All possible actor states in the simulation."""
+class State(IntEnum):
+    """
+    All possible actor states in the simulation.
+    
+    An IntEnum so hashing and comparisons (dict keys, set membership) run
+    as plain int operations; str() and format() still give the name.
+    """
     
     # Core states implemented in Prompt 1
     Sleeping = auto()
@@ -38,6 +43,10 @@ class State(Enum):
     def __str__(self) -> str:
         """Return clean string representation for serialization."""
         return self.name
+    
+    def __format__(self, format_spec: str) -> str:
+        """Format the name, as str() does, whatever the format spec."""
+        return format(self.name, format_spec)
 
 
 def can_transition(actor: "Actor", new_state: State) -> bool:
@@ -7,9 +7,12 @@ Basic tests covering REST endpoints and WebSocket connections.
 import pytest
 import asyncio
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
-from life_state.api import app, sim_manager
+import orjson
+
+from life_state import initialize_world
+from life_state.api import app, sim_manager, diff_tick_data, compact_message, WorldWorker
 
 
 @pytest.fixture
@@ -102,6 +105,21 @@ class TestSimulationManager:
         assert world.world_id == world_id
         assert world_id in manager.worlds
     
+    def test_worlds_payload_refreshes_on_new_world(self):
+        """Test that the cached world list is rebuilt when a world is added."""
+        manager = sim_manager
+        world_id = "payload_world"
+        manager.worlds.pop(world_id, None)
+        
+        before = orjson.loads(manager.get_worlds_payload())
+        assert manager.get_worlds_payload() is manager.get_worlds_payload()
+        
+        manager.get_world(world_id)
+        after = orjson.loads(manager.get_worlds_payload())
+        
+        assert world_id not in [world["world_id"] for world in before]
+        assert {"world_id": world_id, "prob_mass": 1.0} in after
+    
     def test_get_world_stats_empty(self):
         """Test world stats calculation with no actors."""
         manager = sim_manager
@@ -154,6 +172,124 @@ class TestSimulationManager:
             assert hasattr(actor, 'hunger')
             assert hasattr(actor, 'fatigue')
             assert hasattr(actor, 'mood')
+    
+    def test_get_tick_dict_matches_response(self):
+        """Test that the raw WebSocket payload has the same shape as TickResponse."""
+        manager = sim_manager
+        world_id = "main"
+        
+        tick_dict = manager.get_tick_dict(world_id)
+        
+        assert tick_dict == manager.get_tick_data(world_id, 0).model_dump()
+        assert isinstance(tick_dict["world_stats"]["avg_hunger"], float)
+    
+    def test_world_worker_runs_in_child_process(self):
+        """Test that a worker ticks its world in another process and hands it back."""
+        world = initialize_world("worker_world")
+        worker = WorldWorker("worker_world", world, tick_interval=0.01)
+        worker.start()
+        
+        world_id, kind, payload = worker.poll(timeout=30)
+        assert (world_id, kind) == ("worker_world", "tick")
+        assert "actors" in orjson.loads(payload)
+        
+        worker.stop()
+        message = worker.poll(timeout=30)
+        while message is not None and message[1] != "stopped":
+            message = worker.poll(timeout=30)
+        worker.process.join(timeout=10)
+        
+        assert message is not None
+        assert message[2].clock.tick_count >= 1
+        assert world.clock.tick_count == 0  # The parent's copy is untouched
+    
+    def test_tick_snapshot_reused_until_tick(self):
+        """Test that subscribers share one tick payload until the world advances."""
+        manager = sim_manager
+        world = manager.get_world("snapshot_world")
+        
+        first = manager.get_tick_snapshot("snapshot_world")
+        assert manager.get_tick_snapshot("snapshot_world") is first
+        
+        world.clock.advance_tick()
+        second = manager.get_tick_snapshot("snapshot_world")
+        
+        assert second is not first
+        assert second["clock"] != first["clock"]
+    
+    def test_broadcast_drops_failed_connections(self):
+        """Test that a broadcast sends one payload to all and prunes failed sockets."""
+        manager = sim_manager
+        world_id = "broadcast_world"
+        
+        healthy = MagicMock(send_text=AsyncMock())
+        broken = MagicMock(send_text=AsyncMock(side_effect=RuntimeError("closed")))
+        manager.active_connections[world_id] = {healthy, broken}
+        
+        asyncio.run(manager.broadcast_to_world(world_id, {"clock": "now"}))
+        
+        healthy.send_text.assert_awaited_once_with('{"clock":"now"}')
+        assert manager.active_connections[world_id] == {healthy}
+        del manager.active_connections[world_id]
+    
+    def test_diff_tick_data(self):
+        """Test that tick deltas only carry changed and removed actors."""
+        data = sim_manager.get_tick_data("main", 0).model_dump()
+        
+        full, snapshot = diff_tick_data(data, None)
+        assert full["full"] is True
+        assert len(full["actors"]) == len(data["actors"])
+        
+        unchanged, snapshot = diff_tick_data(data, snapshot)
+        assert unchanged["full"] is False
+        assert unchanged["actors"] == []
+        assert unchanged["removed"] == []
+        
+        if data["actors"]:
+            data["actors"][0]["hunger"] += 1.0
+            dropped = data["actors"].pop()
+            delta, _ = diff_tick_data(data, snapshot)
+            assert [a["id"] for a in delta["actors"]] == ([data["actors"][0]["id"]] if data["actors"] else [])
+            assert delta["removed"] == [dropped["id"]]
+    
+    def test_compact_message_round_trip(self):
+        """Test that the compact schema carries the same tick data."""
+        data = sim_manager.get_tick_dict("main")
+        message, _ = diff_tick_data(data, None)
+        
+        compact = compact_message(message)
+        
+        assert compact["t"] == message["clock"]
+        assert compact["f"] is True
+        assert compact["r"] == []
+        expanded = [
+            {"id": row[0], "name": row[1], "state": compact["k"][row[2]],
+             "location": compact["l"][row[3]], "hunger": row[4],
+             "fatigue": row[5], "mood": row[6]}
+            for row in compact["a"]
+        ]
+        assert expanded == message["actors"]
+        stats = message["world_stats"]
+        assert compact["s"] == [stats["avg_hunger"], stats["avg_fatigue"], stats["avg_mood"],
+                                stats["sleeping_cnt"], stats["worlds_alive"]]
+    
+    def test_broadcast_sends_compact_schema_on_request(self):
+        """Test that compact subscribers get the compact payload and others the full one."""
+        manager = sim_manager
+        world_id = "compact_world"
+        message, _ = diff_tick_data(manager.get_tick_dict("main"), None)
+        
+        plain = MagicMock(send_text=AsyncMock())
+        compact = MagicMock(send_text=AsyncMock())
+        manager.active_connections[world_id] = {plain, compact}
+        manager.compact_connections.add(compact)
+        
+        asyncio.run(manager.broadcast_to_world(world_id, message))
+        
+        assert orjson.loads(plain.send_text.await_args.args[0]) == message
+        assert orjson.loads(compact.send_text.await_args.args[0]) == compact_message(message)
+        manager.compact_connections.discard(compact)
+        del manager.active_connections[world_id]
 
 
 class TestWebSocketConnection:
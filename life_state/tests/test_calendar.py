@@ -2,12 +2,16 @@
 Tests for calendar scheduling functionality.
 """
 
+import logging
+import random
+
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from life_state.calendar_scheduler import (
     override_state, get_upcoming_commitments, should_prepare_for_commitment,
-    get_schedule_conflicts, suggest_schedule_optimization, is_valid_schedule_time
+    get_schedule_conflicts, suggest_schedule_optimization, is_valid_schedule_time,
+    is_weekend, is_business_hours, batch_override_states
 )
 from life_state.models import TimeBlock
 from life_state.states import State
@@ -105,6 +109,66 @@ class TestCalendarOverride:
         result = override_state(actor, world.clock)
         
         assert result == State.Focused_Work
+    
+    def test_location_constraint_unregistered_locations(self):
+        """Test location rules for ids outside the default location set."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 10, 0))
+        actor = create_sample_actor(world, "Test Actor", "A")
+        meeting_block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 9, 0),
+            end_dt=datetime(2024, 1, 1, 17, 0),
+            required_state=State.In_Meeting
+        )
+        actor.calendar.append(meeting_block)
+        
+        # Meetings need the office or a restaurant, wherever the actor lives
+        actor.location_id = "home_custom"
+        assert override_state(actor, world.clock) == State.Transitioning
+        
+        actor.location_id = "public_restaurant"
+        assert override_state(actor, world.clock) == State.In_Meeting
+        
+        # Any home_* id still counts as a place to work
+        actor.calendar[0] = meeting_block.model_copy(update={'required_state': State.Focused_Work})
+        actor.location_id = "home_custom"
+        assert override_state(actor, world.clock) == State.Focused_Work
+    
+    def test_batch_override_matches_override_state(self, caplog):
+        """Test that batched overrides agree with per-actor override_state, reasons logged included."""
+        rng = random.Random(3)
+        world = initialize_world(start_time=datetime(2024, 1, 1, 10, 0))
+        locations = list(world.locations) + ["home_custom"]
+        states = [State.Focused_Work, State.In_Meeting, State.Exercising, State.Shopping,
+                  State.Socialising, State.Leisure, State.Eating, State.Sleeping]
+        
+        actors = []
+        for i in range(60):
+            actor = create_sample_actor(world, f"Actor {i}", "A")
+            actor.location_id = rng.choice(locations)
+            actor.fatigue = rng.choice([10.0, 95.0])
+            actor.hunger = rng.choice([10.0, 90.0])
+            actor.mood = rng.choice([0.0, -1.8])
+            actor.cash = rng.choice([0.0, 100.0])
+            if rng.random() < 0.8:
+                actor.calendar.append(TimeBlock(
+                    start_dt=datetime(2024, 1, 1, 9, 0),
+                    end_dt=datetime(2024, 1, 1, 11, 0),
+                    required_state=rng.choice(states)
+                ))
+            actors.append(actor)
+        
+        caplog.set_level(logging.DEBUG, logger="life_state.calendar_scheduler")
+        expected = {}
+        for actor in actors:
+            state = override_state(actor, world.clock)
+            if state is not None:
+                expected[actor.id] = state
+        expected_messages = caplog.messages
+        caplog.clear()
+        
+        assert batch_override_states(actors, world.clock) == expected
+        assert caplog.messages == expected_messages
+        assert batch_override_states([], world.clock) == {}
 
 
 class TestUpcomingCommitments:
@@ -119,6 +183,28 @@ class TestUpcomingCommitments:
         
         assert len(upcoming) == 0
     
+    def test_repeat_queries_see_calendar_changes(self):
+        """Test that reused same-tick answers are refreshed by calendar edits."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 10, 0))
+        actor = create_sample_actor(world, "Test Actor", "A")
+        actor.calendar.append(TimeBlock(
+            start_dt=datetime(2024, 1, 1, 11, 0),
+            end_dt=datetime(2024, 1, 1, 12, 0),
+            required_state=State.In_Meeting
+        ))
+        
+        first = get_upcoming_commitments(actor, world.clock)
+        first.clear()  # Callers get their own list
+        assert len(get_upcoming_commitments(actor, world.clock)) == 1
+        
+        actor.calendar.append(TimeBlock(
+            start_dt=datetime(2024, 1, 1, 10, 30),
+            end_dt=datetime(2024, 1, 1, 11, 0),
+            required_state=State.Eating
+        ))
+        upcoming = get_upcoming_commitments(actor, world.clock)
+        assert [block.required_state for block in upcoming] == [State.Eating, State.In_Meeting]
+    
     def test_get_upcoming_commitments_within_window(self):
         """Test getting commitments within time window."""
         world = initialize_world(start_time=datetime(2024, 1, 1, 10, 0))
@@ -169,6 +255,56 @@ class TestUpcomingCommitments:
         assert len(upcoming) == 2
         assert upcoming[0] == first_block
         assert upcoming[1] == second_block
+    
+    def test_sorted_calendar_tracks_mutation(self):
+        """Test that the cached sorted calendar is refreshed after the calendar changes."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 10, 0))
+        actor = create_sample_actor(world, "Test Actor", "A")
+        
+        late_block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 14, 0),
+            end_dt=datetime(2024, 1, 1, 15, 0),
+            required_state=State.In_Meeting
+        )
+        early_block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 11, 0),
+            end_dt=datetime(2024, 1, 1, 12, 0),
+            required_state=State.Focused_Work
+        )
+        
+        actor.calendar.append(late_block)
+        assert actor.sorted_calendar == [late_block]
+        
+        actor.calendar.append(early_block)
+        assert actor.sorted_calendar == [early_block, late_block]
+        
+        actor.calendar.remove(early_block)
+        assert actor.sorted_calendar == [late_block]
+        
+        # A plain list assigned directly is adopted on first use
+        actor.calendar = [late_block, early_block]
+        assert actor.sorted_calendar == [early_block, late_block]
+    
+    def test_get_upcoming_commitments_long_active_block(self):
+        """Test that a long block that started well before now is still reported."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 10, 0))
+        actor = create_sample_actor(world, "Test Actor", "A")
+        
+        long_block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 2, 0),
+            end_dt=datetime(2024, 1, 1, 18, 0),
+            required_state=State.Focused_Work
+        )
+        short_past_block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 8, 0),
+            end_dt=datetime(2024, 1, 1, 9, 0),
+            required_state=State.In_Meeting
+        )
+        actor.calendar.extend([short_past_block, long_block])
+        
+        upcoming = get_upcoming_commitments(actor, world.clock)
+        
+        assert upcoming == [long_block]
 
 
 class TestPreparationSuggestions:
@@ -258,6 +394,30 @@ class TestScheduleConflicts:
         assert len(conflicts) == 1
         assert (block1, block2) in conflicts or (block2, block1) in conflicts
     
+    def test_conflicts_match_pairwise_scan(self):
+        """Test that every overlapping pair is reported once, in calendar order."""
+        rng = random.Random(5)
+        world = initialize_world()
+        actor = create_sample_actor(world, "Test Actor", "A")
+        for _ in range(40):
+            start = datetime(2024, 1, 1, 8, 0) + timedelta(minutes=15 * rng.randint(0, 40))
+            actor.calendar.append(TimeBlock(
+                start_dt=start,
+                end_dt=start + timedelta(minutes=15 * rng.randint(1, 8)),
+                required_state=State.Focused_Work
+            ))
+        
+        calendar = actor.calendar
+        expected = [
+            (calendar[i], calendar[j])
+            for i in range(len(calendar)) for j in range(i + 1, len(calendar))
+            if calendar[i].overlaps_with(calendar[j])
+        ]
+        
+        conflicts = get_schedule_conflicts(actor)
+        
+        assert [(id(a), id(b)) for a, b in conflicts] == [(id(a), id(b)) for a, b in expected]
+    
     def test_no_conflicts_adjacent_blocks(self):
         """Test that adjacent (non-overlapping) blocks don't conflict."""
         world = initialize_world()
@@ -374,4 +534,33 @@ class TestScheduleValidation:
         start_time = datetime(2024, 1, 1, 13, 0)
         is_valid = is_valid_schedule_time(actor, start_time, 60)
         
-        assert is_valid is True
\ No newline at end of file
+        assert is_valid is True
+
+class TestClockHelpers:
+    """Test weekend and business-hours checks."""
+    
+    def test_flags_follow_clock_time(self):
+        """Test that cached answers refresh when the clock moves on or jumps."""
+        world = initialize_world(start_time=datetime(2024, 1, 5, 16, 45))  # Friday
+        clock = world.clock
+        
+        assert is_weekend(clock) is False
+        assert is_business_hours(clock) is True
+        
+        clock.advance_tick()  # Friday 17:00
+        assert is_business_hours(clock) is False
+        
+        clock.current_time = datetime(2024, 1, 6, 10, 0)  # Saturday
+        assert is_weekend(clock) is True
+        assert is_business_hours(clock) is False
+    
+    def test_flags_not_shared_across_timezones(self):
+        """Test that clocks showing the same instant in different timezones get their own flags."""
+        utc_clock = initialize_world(start_time=datetime(2024, 1, 5, 20, 0, tzinfo=timezone.utc)).clock  # Friday
+        tokyo = timezone(timedelta(hours=9))
+        tokyo_clock = initialize_world(start_time=datetime(2024, 1, 6, 5, 0, tzinfo=tokyo)).clock  # Saturday
+        assert utc_clock.current_time == tokyo_clock.current_time
+        
+        assert is_weekend(utc_clock) is False
+        assert is_weekend(tokyo_clock) is True
+        assert is_weekend(utc_clock) is False
@@ -5,9 +5,10 @@ Tests for action selection and probability system.
 import pytest
 from datetime import datetime
 
-from life_state.models import Actor, WorldState, WorldClock
+from life_state import actions as actions_module
+from life_state.models import Actor, WorldState, WorldClock, location_index
 from life_state.states import State
-from life_state.actions import get_available_actions, apply_action, GO_TO_SLEEP, EAT_MEAL
+from life_state.actions import get_available_actions, get_available_actions_batch, ACTIONS_BY_NAME, apply_action, GO_TO_SLEEP, EAT_MEAL
 from life_state.probability import choose_action, mood_factor, hunger_factor, fatigue_factor
 from life_state.world import initialize_world, create_sample_actor
 
@@ -39,6 +40,53 @@ class TestActionSelection:
         gym_only_actions = [a for a in gym_actions if len(a.location_req) == 1 and a.location_req[0] == "public_gym"]
         assert len(gym_only_actions) == 0
     
+    def test_action_allowed_at(self):
+        """Test location bitmask checks for restricted and unrestricted actions."""
+        registry = ACTIONS_BY_NAME.values()
+        unrestricted = next(a for a in registry if a.location_req is None)
+        assert unrestricted.allowed_at("public_office")
+        assert unrestricted.allowed_at("not_a_real_place")
+        
+        restricted = next(a for a in registry if a.location_req)
+        for location_id in restricted.location_req:
+            assert restricted.allowed_at(location_id)
+        assert not restricted.allowed_at("not_a_real_place")
+    
+    def test_filter_kernel_matches_available_actions(self):
+        """Test that the action filter kernel agrees with the table-driven path."""
+        world = initialize_world()
+        actor = create_sample_actor(world, "Test Actor", "A")
+        
+        for location_id in ["home_a", "public_gym", "public_office", "not_a_real_place"]:
+            for mood in [-2.0, -0.5, 0.0, 1.0, 2.0]:
+                actor.location_id = location_id
+                actor.mood = mood
+                indices = actions_module._filter_actions(
+                    actor.mood, actor.hunger, actor.fatigue, actor.cash,
+                    location_index(location_id),
+                    actions_module._mood_lo, actions_module._mood_hi,
+                    actions_module._min_hunger_arr, actions_module._max_hunger_arr,
+                    actions_module._min_fatigue_arr, actions_module._max_fatigue_arr,
+                    actions_module._min_cash_arr, actions_module._allowed_loc_mask
+                )
+                expected = get_available_actions(actor, world, core_only=False)
+                assert [actions_module.ALL_ACTIONS[i] for i in indices] == expected
+    
+    def test_batch_matches_per_actor(self):
+        """Test that batched filtering matches per-actor filtering."""
+        world = initialize_world()
+        actors = [create_sample_actor(world, f"Actor {i}", "ABCDEFGHIJKL"[i]) for i in range(6)]
+        actors[1].location_id = "public_gym"
+        actors[2].mood = -2.0
+        actors[3].hunger = 100.0
+        actors[4].cash = 0.0
+        actors[5].fatigue = 0.0
+        
+        for core_only in (True, False):
+            batch = get_available_actions_batch(actors, core_only=core_only)
+            for actor in actors:
+                assert batch[actor.id] == get_available_actions(actor, world, core_only=core_only)
+    
     def test_action_mood_filtering(self):
         """Test that actions are filtered by mood requirements."""
         world = initialize_world()
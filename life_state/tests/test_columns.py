@@ -0,0 +1,84 @@
+"""
+Tests for the structure-of-arrays actor columns.
+"""
+
+import pytest
+from datetime import datetime
+
+from life_state.columns import ActorColumns
+from life_state.models import Actor, WorldState, WorldClock
+from life_state.states import State
+
+
+@pytest.fixture
+def world():
+    """Create a small world with actors near the resource bounds."""
+    world = WorldState(clock=WorldClock(current_time=datetime(2024, 1, 1, 9, 0)), world_id="test_world")
+    world.add_actor(Actor(name="A", home_id="home_a", location_id="home_a", world_id="test_world",
+                          hunger=99.5, fatigue=0.2, mood=1.9, state=State.Sleeping))
+    world.add_actor(Actor(name="B", home_id="home_b", location_id="home_b", world_id="test_world",
+                          hunger=10.0, fatigue=50.0, mood=-1.0, state=State.Idle))
+    return world
+
+
+class TestActorColumns:
+    """Test vectorized resource updates."""
+    
+    def test_apply_deltas_matches_update_resources(self, world):
+        """Test that clamped vectorized updates match per-actor updates."""
+        expected = [actor.model_copy() for actor in world.actors.values()]
+        for actor in expected:
+            actor.update_resources(1.0, -0.5, 0.3)
+        
+        columns = ActorColumns.from_world(world)
+        columns.apply_deltas(1.0, -0.5, 0.3)
+        columns.write_back()
+        
+        for actor, reference in zip(world.actors.values(), expected):
+            assert actor.hunger == reference.hunger
+            assert actor.fatigue == reference.fatigue
+            assert actor.mood == reference.mood
+    
+    def test_aggregates(self, world):
+        """Test means, state counts and membership checks."""
+        columns = ActorColumns.from_world(world)
+        
+        assert len(columns) == 2
+        assert columns.means()['hunger'] == pytest.approx(54.75)
+        assert columns.count_in_state(State.Sleeping) == 1
+        assert columns.matches(world)
+        
+        world.remove_actor(columns.actor_ids[0])
+        assert not columns.matches(world)
+    
+    def test_apply_deltas_to_selected_rows(self, world):
+        """Test that row-restricted updates clamp the chosen rows and leave the rest alone."""
+        columns = ActorColumns.from_world(world)
+        
+        columns.apply_deltas(1.0, -0.5, 0.3, rows=columns.rows_in_state(State.Sleeping))
+        
+        assert columns.hunger.tolist() == [100.0, 10.0]
+        assert columns.fatigue.tolist() == [0.0, 50.0]
+        assert columns.mood.tolist() == [2.0, -1.0]
+    
+    def test_row_selection(self, world):
+        """Test selecting rows by state and by location."""
+        columns = ActorColumns.from_world(world)
+        
+        assert columns.rows_in_state(State.Idle).tolist() == [1]
+        assert columns.rows_at_location("home_a").tolist() == [0]
+        assert columns.rows_at_location("office").tolist() == []
+        assert columns.actors_at_rows(columns.rows_at_location("home_b")) == [world.actors[columns.actor_ids[1]]]
+    
+    def test_energy_and_battery_deltas(self, world):
+        """Test that optional energy and battery deltas clamp to 0-100, for all or selected rows."""
+        for actor, energy in zip(world.actors.values(), [5.0, 60.0]):
+            actor.energy = energy
+        columns = ActorColumns.from_world(world)
+        
+        columns.apply_deltas(0.0, 0.0, 0.0, energy_delta=-10.0, battery_delta=-1.5)
+        assert columns.energy.tolist() == [0.0, 50.0]
+        assert columns.battery.tolist() == [98.5, 98.5]
+        
+        columns.apply_deltas(0.0, 0.0, 0.0, rows=columns.rows_in_state(State.Idle), energy_delta=80.0)
+        assert columns.energy.tolist() == [0.0, 100.0]
@@ -0,0 +1,50 @@
+"""
+Tests for the static interval tree.
+"""
+
+import random
+
+from life_state.interval_tree import IntervalTree
+
+
+def _random_intervals(rng, count):
+    intervals = []
+    for _ in range(count):
+        start = rng.randint(0, 100)
+        intervals.append((start, start + rng.randint(1, 30)))
+    intervals.sort()
+    return [s for s, _ in intervals], [e for _, e in intervals]
+
+
+class TestIntervalTree:
+    """Test interval tree queries against brute force."""
+    
+    def test_empty_tree(self):
+        """Test that an empty tree reports nothing."""
+        tree = IntervalTree([], [])
+        
+        assert len(tree) == 0
+        assert tree.stab(5) == []
+        assert tree.overlapping(0, 10) == []
+    
+    def test_stab_matches_brute_force(self):
+        """Test stabbing queries, including points on interval boundaries."""
+        rng = random.Random(7)
+        for count in range(0, 40):
+            starts, ends = _random_intervals(rng, count)
+            tree = IntervalTree(starts, ends)
+            for point in range(-1, 135):
+                expected = [i for i in range(count) if starts[i] <= point < ends[i]]
+                assert tree.stab(point) == expected
+    
+    def test_overlapping_matches_brute_force(self):
+        """Test half-open overlap queries."""
+        rng = random.Random(11)
+        for count in range(0, 40):
+            starts, ends = _random_intervals(rng, count)
+            tree = IntervalTree(starts, ends)
+            for _ in range(50):
+                start = rng.randint(-5, 130)
+                end = start + rng.randint(0, 20)
+                expected = [i for i in range(count) if starts[i] < end and ends[i] > start]
+                assert tree.overlapping(start, end) == expected
@@ -0,0 +1,232 @@
+"""
+Tests for simulation log writing and loading.
+"""
+
+import csv
+import json
+import os
+import shutil
+from datetime import datetime
+
+import pytest
+
+from life_state.columns import ActorColumns
+from life_state.io_utils import (
+    CSV_HEADER, SnapshotWriter, ensure_log_dir, export_csv, get_log_file_stats, load_snapshot, load_snapshot_binary,
+    write_daily_summary, write_simulation_summary, write_snapshot, write_snapshot_binary
+)
+from life_state.simulator import SimulationMetrics
+from life_state.states import State
+from life_state.world import initialize_world
+
+
+class TestSnapshots:
+    """Test JSON Lines snapshot writing."""
+    
+    def test_snapshot_writer_buffers_until_flush(self, tmp_path):
+        """Test that buffered snapshots all reach the file by close()."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        snapshot_file = tmp_path / "w_snapshots.jsonl"
+        
+        with SnapshotWriter(tmp_path, flush_every=3) as writer:
+            for _ in range(4):
+                writer.write({"w": world})
+                world.clock.advance_tick()
+            # Three writes were flushed; the fourth is still buffered
+            assert len(load_snapshot(snapshot_file)) == 3
+        
+        snapshots = load_snapshot(snapshot_file)
+        assert [snapshot["tick"] for snapshot in snapshots] == [0, 1, 2, 3]
+        assert len(snapshots[0]["actors"]) == len(world.actors)
+    
+    def test_full_buffer_is_written_before_flush(self, tmp_path):
+        """Test that a world's buffer goes out as soon as it reaches buffer_size."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        snapshot_file = tmp_path / "w_snapshots.jsonl"
+        
+        with SnapshotWriter(tmp_path, flush_every=1000, buffer_size=1) as writer:
+            writer.write({"w": world})
+            assert len(load_snapshot(snapshot_file)) == 1
+    
+    def test_background_writer_keeps_tick_order(self, tmp_path):
+        """Test that snapshots written on the worker thread arrive complete and in order."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        snapshot_file = tmp_path / "w_snapshots.jsonl"
+        
+        with SnapshotWriter(tmp_path, flush_every=1000, background=True, queue_size=2) as writer:
+            for _ in range(20):
+                writer.write({"w": world})
+                world.clock.advance_tick()
+            writer.flush()
+            assert len(load_snapshot(snapshot_file)) == 20
+            writer.write({"w": world})
+        
+        snapshots = load_snapshot(snapshot_file)
+        assert [snapshot["tick"] for snapshot in snapshots] == list(range(21))
+    
+    @pytest.mark.parametrize("background", [False, True])
+    def test_multiple_worlds_written_concurrently(self, tmp_path, background):
+        """Test that each world's file gets every tick, in order, when worlds are written in parallel."""
+        worlds = {
+            f"w{i}": initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id=f"w{i}")
+            for i in range(5)
+        }
+        
+        with SnapshotWriter(tmp_path, flush_every=2, background=background, max_threads=3) as writer:
+            for _ in range(6):
+                writer.write(worlds)
+                for world in worlds.values():
+                    world.clock.advance_tick()
+        
+        for world_id in worlds:
+            snapshots = load_snapshot(tmp_path / f"{world_id}_snapshots.jsonl")
+            assert [snapshot["tick"] for snapshot in snapshots] == list(range(6))
+            assert {snapshot["world_id"] for snapshot in snapshots} == {world_id}
+    
+    def test_fixed_point_resources_load_as_rounded_floats(self, tmp_path):
+        """Test that quantized resources come back equal to the 2-place rounded values."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        for i, actor in enumerate(world.actors.values()):
+            actor.hunger = 31.885 + i
+            actor.mood = -1 / 3
+            actor.cash = 1234.5678 * i
+        
+        write_snapshot({"w": world}, tmp_path)
+        snapshot = load_snapshot(tmp_path / "w_snapshots.jsonl")[0]
+        
+        assert "resource_scale" not in snapshot
+        for loaded, actor in zip(snapshot["actors"], world.actors.values()):
+            assert loaded["hunger"] == round(actor.hunger, 2)
+            assert loaded["mood"] == round(actor.mood, 2)
+            assert loaded["cash"] == round(actor.cash, 2)
+    
+    def test_write_snapshot_appends(self, tmp_path):
+        """Test that one-off snapshot writes append to the same file."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        
+        write_snapshot({"w": world}, tmp_path)
+        write_snapshot({"w": world}, tmp_path)
+        
+        assert len(load_snapshot(tmp_path / "w_snapshots.jsonl")) == 2
+    
+    def test_binary_snapshots_round_trip(self, tmp_path):
+        """Test that MessagePack snapshots load back equal to the JSON Lines ones."""
+        pytest.importorskip("msgpack")
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        
+        for _ in range(3):
+            write_snapshot({"w": world}, tmp_path)
+            write_snapshot_binary({"w": world}, tmp_path)
+            world.clock.advance_tick()
+        
+        binary = load_snapshot_binary(tmp_path / "w_snapshots.msgpack")
+        text = load_snapshot(tmp_path / "w_snapshots.jsonl")
+        # Wall-clock timestamps differ between the two writes
+        for snapshot in binary + text:
+            del snapshot["timestamp"]
+        assert binary == text
+        assert [snapshot["tick"] for snapshot in binary] == [0, 1, 2]
+
+
+class TestLogDirectory:
+    """Test once-per-process log directory setup."""
+    
+    def test_removed_directory_is_recreated_after_failed_write(self, tmp_path):
+        """Test that a write failure makes the next write create the directory again."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        log_dir = tmp_path / "logs"
+        assert ensure_log_dir(log_dir)
+        
+        shutil.rmtree(log_dir)
+        write_daily_summary(world, log_dir)  # Fails: the directory is cached as ready
+        assert not log_dir.exists()
+        
+        write_daily_summary(world, log_dir)
+        assert (log_dir / "w_daily_2024-01-01.json").exists()
+
+
+class TestDailySummary:
+    """Test daily summary aggregation."""
+    
+    def test_columns_match_actor_pass(self, tmp_path):
+        """Test that summaries from resource columns match the per-actor pass."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        for i, actor in enumerate(world.actors.values()):
+            actor.hunger = 10.0 + i
+            actor.battery = 50.0 - i
+            actor.state = State.Sleeping if i % 3 == 0 else State.Idle
+        summary_file = tmp_path / "w_daily_2024-01-01.json"
+        
+        write_daily_summary(world, tmp_path)
+        expected = json.loads(summary_file.read_text())
+        write_daily_summary(world, tmp_path, columns=ActorColumns.from_world(world))
+        summary = json.loads(summary_file.read_text())
+        
+        assert summary["state_distribution"] == expected["state_distribution"]
+        assert summary["location_distribution"] == expected["location_distribution"]
+        assert summary["average_resources"] == pytest.approx(expected["average_resources"])
+
+
+
+class TestSimulationSummary:
+    """Test the streamed final summary."""
+    
+    @pytest.mark.parametrize("world_count", [0, 1, 3])
+    def test_streamed_summary_is_valid_json(self, tmp_path, world_count):
+        """Test that streaming worlds one at a time still yields one JSON document."""
+        worlds = {
+            f"w{i}": initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id=f"w{i}")
+            for i in range(world_count)
+        }
+        
+        write_simulation_summary(worlds, SimulationMetrics(), tmp_path)
+        summary = json.loads((tmp_path / "simulation_summary.json").read_text())
+        
+        assert summary["total_worlds"] == world_count
+        assert list(summary["worlds"]) == list(worlds)
+        for world_id, world in worlds.items():
+            assert len(summary["worlds"][world_id]["actors"]) == len(world.actors)
+
+
+class TestExportCsv:
+    """Test the hand-formatted CSV export."""
+    
+    def test_matches_csv_module(self, tmp_path):
+        """Test that awkward text fields are quoted exactly like csv.writer."""
+        world = initialize_world(start_time=datetime(2024, 1, 1, 9, 0), world_id="w")
+        names = ['Smith, Jo', 'Jo "JJ" Smith', 'two\nlines', 'plain']
+        for actor, name in zip(world.actors.values(), names):
+            actor.name = name
+            actor.mood = 1 / 3
+        
+        export_csv({"w": world}, tmp_path, batch_size=2)
+        
+        with open(tmp_path / "w_actors.csv", newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert tuple(rows[0]) == CSV_HEADER
+        assert len(rows) == len(world.actors) + 1
+        for row, actor in zip(rows[1:], world.actors.values()):
+            assert row[1] == actor.name
+            assert row[3] == (actor.substate or '')
+            assert float(row[8]) == actor.mood
+
+
+
+class TestLogFileStats:
+    """Test log directory statistics."""
+    
+    def test_stats_count_files_only(self, tmp_path):
+        """Test sizes, suffixes and age extremes, ignoring subdirectories."""
+        for i, name in enumerate(["a.json", "b.jsonl", "c.jsonl"]):
+            (tmp_path / name).write_bytes(b"x" * (i + 1))
+            os.utime(tmp_path / name, (1000 + i, 1000 + i))
+        (tmp_path / "nested").mkdir()
+        
+        stats = get_log_file_stats(tmp_path)
+        
+        assert stats["total_files"] == 3
+        assert stats["total_size_bytes"] == 6
+        assert stats["file_types"] == {".json": 1, ".jsonl": 2}
+        assert stats["largest_file"] == (str(tmp_path / "c.jsonl"), 3)
+        assert stats["oldest_file"] == (str(tmp_path / "a.json"), 1000)
+        assert stats["newest_file"] == (str(tmp_path / "c.jsonl"), 1002)
@@ -4,6 +4,8 @@ Tests for core data models.
 Tests model validation, resource bounds, and world state management.
 """
 
+import sys
+
 import pytest
 from datetime import datetime, timedelta
 from pydantic import ValidationError
@@ -145,6 +147,58 @@ class TestActor:
             world_id="test_world"
         )
         assert actor.world_id == "test_world"
+    
+    def test_actor_get_current_time_block(self):
+        """Test active block lookup, including long and overlapping blocks."""
+        actor = Actor(
+            name="Test Actor",
+            home_id="home_a",
+            location_id="home_a",
+            world_id="test_world"
+        )
+        long_block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 8, 0),
+            end_dt=datetime(2024, 1, 1, 18, 0),
+            required_state=State.Focused_Work
+        )
+        meeting = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 10, 0),
+            end_dt=datetime(2024, 1, 1, 11, 0),
+            required_state=State.In_Meeting
+        )
+        actor.calendar.extend([meeting, long_block])
+        
+        assert actor.get_current_time_block(datetime(2024, 1, 1, 7, 0)) is None
+        assert actor.get_current_time_block(datetime(2024, 1, 1, 9, 0)) is long_block
+        # Overlaps resolve to the block listed first in the calendar
+        assert actor.get_current_time_block(datetime(2024, 1, 1, 10, 30)) is meeting
+        assert actor.get_current_time_block(datetime(2024, 1, 1, 17, 0)) is long_block
+        assert actor.get_current_time_block(datetime(2024, 1, 1, 18, 0)) is None
+        
+        assert not actor.is_available_at(datetime(2024, 1, 1, 17, 0), datetime(2024, 1, 1, 19, 0))
+        assert actor.is_available_at(datetime(2024, 1, 1, 18, 0), datetime(2024, 1, 1, 19, 0))
+    
+    def test_actor_snapshot_dict_cached_per_tick(self):
+        """Test that snapshot records are rounded and rebuilt only for a new tick."""
+        actor = Actor(
+            name="Test Actor",
+            home_id="home_a",
+            location_id="home_a",
+            world_id="test_world",
+            hunger=12.3456,
+            substate="action_grab_a_snack"
+        )
+        
+        record = actor.to_snapshot_dict(3)
+        assert record["hunger"] == 1235
+        assert record["current_action"] == "Grab A Snack"
+        assert actor.to_snapshot_dict(3) is record
+        
+        actor.hunger = 50.0
+        actor.substate = None
+        refreshed = actor.to_snapshot_dict(4)
+        assert refreshed["hunger"] == 5000
+        assert refreshed["current_action"] == actor.state.name
 
 
 class TestTimeBlock:
@@ -180,6 +234,18 @@ class TestTimeBlock:
                 required_state=State.Focused_Work
             )
     
+    def test_timeblock_is_frozen(self):
+        """Test that a time block cannot be changed after construction."""
+        block = TimeBlock(
+            start_dt=datetime(2024, 1, 1, 9, 0),
+            end_dt=datetime(2024, 1, 1, 17, 0),
+            required_state=State.Focused_Work
+        )
+        
+        with pytest.raises(ValidationError):
+            block.end_dt = datetime(2024, 1, 1, 18, 0)
+        assert len({block, block.model_copy()}) == 1
+    
     def test_timeblock_overlaps_with(self):
         """Test time block overlap detection."""
         block1 = TimeBlock(
@@ -282,6 +348,19 @@ class TestWorldState:
         assert actor.id in world.actors
         assert actor.world_id == "test_world"  # Should be updated
     
+    def test_worldstate_add_actor_interns_ids(self):
+        """Test that adding an actor interns its id strings."""
+        clock = WorldClock(current_time=datetime(2024, 1, 1, 9, 0))
+        world = WorldState(clock=clock, world_id="".join(["test", "_world"]))
+        
+        home_id = "".join(["home", "_a"])
+        actor = Actor(name="Test Actor", home_id=home_id, location_id=home_id, world_id="test_world")
+        world.add_actor(actor)
+        
+        assert actor.location_id is sys.intern("home_a")
+        assert actor.home_id is sys.intern("home_a")
+        assert actor.world_id is sys.intern("test_world")
+    
     def test_worldstate_remove_actor(self):
         """Test removing an actor from the world."""
         clock = WorldClock(current_time=datetime(2024, 1, 1, 9, 0))
@@ -352,6 +431,75 @@ class TestWorldState:
         sleeping_actors = world.get_actors_in_state(State.Sleeping)
         assert len(sleeping_actors) == 1
         assert actor2 in sleeping_actors
+    
+    def test_worldstate_counts_by_state_and_location(self):
+        """Test single-pass state counts and location head counts."""
+        clock = WorldClock(current_time=datetime(2024, 1, 1, 9, 0))
+        world = WorldState(clock=clock, world_id="test_world")
+        
+        actor1 = Actor(name="Actor1", home_id="home_a", location_id="park",
+                      world_id="test_world", state=State.Idle)
+        actor2 = Actor(name="Actor2", home_id="home_b", location_id="park",
+                      world_id="test_world", state=State.Sleeping)
+        actor3 = Actor(name="Actor3", home_id="home_c", location_id="home_c",
+                      world_id="test_world", state=State.Idle)
+        for actor in (actor1, actor2, actor3):
+            world.add_actor(actor)
+        
+        assert world.count_actors_by_state() == {State.Idle: 2, State.Sleeping: 1}
+        assert world.count_actors_at_location("park") == 2
+        assert world.count_actors_at_location("park", exclude_id=actor1.id) == 1
+        assert world.count_actors_at_location("office") == 0
+    
+    def test_worldstate_get_resource_totals(self):
+        """Test single-pass resource totals."""
+        clock = WorldClock(current_time=datetime(2024, 1, 1, 9, 0))
+        world = WorldState(clock=clock, world_id="test_world")
+        
+        empty = world.get_resource_totals()
+        assert empty['n_actors'] == 0
+        assert empty['hunger'] == 0
+        
+        world.add_actor(Actor(name="Actor1", home_id="home_a", location_id="home_a", world_id="test_world",
+                              hunger=20.0, fatigue=10.0, mood=1.0, cash=50.0, state=State.Sleeping))
+        world.add_actor(Actor(name="Actor2", home_id="home_b", location_id="home_b", world_id="test_world",
+                              hunger=40.0, fatigue=30.0, mood=-0.5, cash=25.0, state=State.Idle))
+        
+        totals = world.get_resource_totals()
+        assert totals['n_actors'] == 2
+        assert totals['hunger'] == 60.0
+        assert totals['fatigue'] == 40.0
+        assert totals['mood'] == 0.5
+        assert totals['cash'] == 75.0
+        assert totals['sleeping'] == 1
+    
+    def test_worldstate_actors_with_active_blocks(self):
+        """Test the world-level calendar index follows calendar changes."""
+        clock = WorldClock(current_time=datetime(2024, 1, 1, 9, 0))
+        world = WorldState(clock=clock, world_id="test_world")
+        actor1 = Actor(name="Actor1", home_id="home_a", location_id="home_a", world_id="test_world")
+        actor2 = Actor(name="Actor2", home_id="home_b", location_id="home_b", world_id="test_world")
+        world.add_actor(actor1)
+        world.add_actor(actor2)
+        
+        def block(start_hour, end_hour):
+            return TimeBlock(start_dt=datetime(2024, 1, 1, start_hour, 0),
+                             end_dt=datetime(2024, 1, 1, end_hour, 0),
+                             required_state=State.Focused_Work)
+        
+        at_ten = datetime(2024, 1, 1, 10, 0)
+        assert world.actors_with_active_blocks(at_ten) == set()
+        
+        actor1.calendar.append(block(9, 11))
+        assert world.actors_with_active_blocks(at_ten) == {actor1.id}
+        assert world.actors_with_active_blocks(datetime(2024, 1, 1, 11, 0)) == set()
+        
+        # Replacing a calendar outright is picked up too
+        actor2.calendar = [block(8, 12)]
+        assert world.actors_with_active_blocks(at_ten) == {actor1.id, actor2.id}
+        
+        actor1.calendar[0] = block(12, 13)
+        assert world.actors_with_active_blocks(at_ten) == {actor2.id}
 
 
 class TestLocation:
@@ -389,4 +537,15 @@ class TestLocation:
         location_ids = [loc.id for loc in locations]
         assert "public_office" in location_ids
         assert "home_a" in location_ids
-        assert "time_machine_gateway" in location_ids
\ No newline at end of file
+        assert "time_machine_gateway" in location_ids
+    
+    def test_default_locations_are_shared_and_frozen(self):
+        """Test that default locations are built once and cannot be mutated."""
+        first = Location.create_default_locations()
+        second = Location.create_default_locations()
+        
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        
+        with pytest.raises(ValidationError):
+            first[0].name = "Renamed"
\ No newline at end of file
@@ -158,6 +158,14 @@ class TestProbabilityCalculation:
         
         prob = calculate_action_probability(STAY_IDLE, self.actor, self.world)
         assert prob >= 0.0
+    
+    def test_calculate_action_probability_given_hour(self):
+        """Test that a caller-supplied hour replaces reading the clock."""
+        # 12:00 is a meal time, 15:00 is not
+        at_noon = calculate_action_probability(EAT_MEAL, self.actor, self.world)
+        
+        assert calculate_action_probability(EAT_MEAL, self.actor, self.world, hour=12) == at_noon
+        assert calculate_action_probability(EAT_MEAL, self.actor, self.world, hour=15) < at_noon
 
 
 class TestActionSelection:
@@ -0,0 +1,69 @@
+"""
+Tests for the simulation entry points.
+"""
+
+from datetime import datetime
+
+from life_state.simulator import run_independent_worlds
+from life_state.world import initialize_world, create_sample_actor
+
+
+START = datetime(2024, 1, 1, 9, 0)
+END = datetime(2024, 1, 1, 12, 0)
+
+
+def make_worlds():
+    """Build three small independent worlds."""
+    worlds = {}
+    for world_id in ("w0", "w1", "w2"):
+        world = initialize_world(world_id=world_id, start_time=START)
+        for letter in "AB":
+            create_sample_actor(world, f"{world_id} Actor {letter}", letter)
+        worlds[world_id] = world
+    return worlds
+
+
+def outcome(results):
+    """Summarize results by world and actor name, which are stable across runs."""
+    return {
+        world_id: sorted(
+            (actor.name, actor.state.name, actor.location_id, actor.hunger, actor.fatigue, actor.mood)
+            for actor in world.actors.values()
+        )
+        for world_id, (world, _) in results.items()
+    }
+
+
+class TestRunIndependentWorlds:
+    """Test running independent worlds in worker processes."""
+    
+    def test_runs_every_world_to_end(self, tmp_path):
+        """Test that every world is returned with its metrics, run to end_dt."""
+        results = run_independent_worlds(make_worlds(), END, tmp_path, n_procs=2, seed=7)
+        
+        assert set(results) == {"w0", "w1", "w2"}
+        for world_id, (world, metrics) in results.items():
+            assert world.world_id == world_id
+            assert world.clock.current_time == END
+            assert world.clock.tick_count == 12  # 3 hours of 15-minute ticks
+            assert metrics.tick_count == 12
+    
+    def test_writes_logs_per_world(self, tmp_path):
+        """Test that each world logs into its own subdirectory."""
+        run_independent_worlds(make_worlds(), END, tmp_path, n_procs=2, seed=7)
+        
+        for world_id in ("w0", "w1", "w2"):
+            world_dir = tmp_path / world_id
+            assert world_dir.is_dir()
+            assert (world_dir / f"{world_id}_snapshots.jsonl").exists()
+    
+    def test_same_seed_same_results(self, tmp_path):
+        """Test that runs with the same seed produce the same worlds."""
+        first = run_independent_worlds(make_worlds(), END, tmp_path / "a", n_procs=2, seed=7)
+        second = run_independent_worlds(make_worlds(), END, tmp_path / "b", n_procs=2, seed=7)
+        
+        assert outcome(first) == outcome(second)
+    
+    def test_no_worlds(self, tmp_path):
+        """Test that an empty worlds dict returns no results."""
+        assert run_independent_worlds({}, END, tmp_path) == {}
@@ -5,7 +5,8 @@ Tests for time jump and world forking functionality.
 import pytest
 from datetime import datetime, timedelta
 
-from life_state.models import WorldState
+from life_state.models import WorldState, TimeBlock
+from life_state.states import State
 from life_state.time_jump import (
     gateway_open, fork_world, calculate_time_jump_effects, 
     get_timeline_divergence, WorldManager
@@ -160,6 +161,62 @@ class TestWorldForking:
         
         # Original actor should be marked as jumped away
         assert actor.substate == "time_jumped_away"
+    
+    def test_fork_world_shares_read_only_data(self):
+        """Test that forks share locations and time blocks but not mutable actor state."""
+        world = initialize_world()
+        actor = create_sample_actor(world, "Test Actor", "A")
+        block = TimeBlock(
+            start_dt=world.clock.current_time + timedelta(hours=1),
+            end_dt=world.clock.current_time + timedelta(hours=2),
+            required_state=State.Focused_Work
+        )
+        actor.calendar.append(block)
+        
+        forked_world = fork_world(world, actor, world.clock.current_time + timedelta(hours=6))
+        forked_actor = forked_world.actors[actor.id]
+        
+        # Read-only data is shared rather than copied
+        location_id = next(iter(world.locations))
+        assert forked_world.locations[location_id] is world.locations[location_id]
+        assert forked_actor.calendar[0] is block
+        
+        # Mutable state diverges independently
+        assert forked_actor is not actor
+        assert forked_world.clock is not world.clock
+        forked_actor.calendar.clear()
+        forked_actor.hunger = 99.0
+        assert actor.calendar == [block]
+        assert actor.hunger != 99.0
+        assert actor.world_id == world.world_id
+    
+    def test_fork_snapshot_records_are_not_stale(self):
+        """Test that forked actors never reuse a snapshot record cached in the source world."""
+        from life_state.models import SNAPSHOT_SCALE
+        
+        for jump, ticks in ((timedelta(minutes=10), 0), (timedelta(hours=-1), 4)):
+            world = initialize_world()
+            actor = create_sample_actor(world, "Test Actor", "A")
+            world.clock.tick_count = 10
+            
+            before = actor.to_snapshot_dict(10)
+            assert before["world_id"] == world.world_id
+            
+            forked_world = fork_world(world, actor, world.clock.current_time + jump)
+            for _ in range(ticks):
+                forked_world.clock.advance_tick()
+            assert forked_world.clock.tick_count == 10
+            
+            forked_actor = forked_world.actors[actor.id]
+            record = forked_actor.to_snapshot_dict(forked_world.clock.tick_count)
+            assert record["world_id"] == forked_world.world_id
+            assert record["substate"] == "post_time_jump"
+            assert record["hunger"] == round(round(forked_actor.hunger, 2) * SNAPSHOT_SCALE)
+            
+            # The source actor was edited in the same tick and must not reuse its record either
+            after = actor.to_snapshot_dict(10)
+            assert after["substate"] == "time_jumped_away"
+            assert after is not before
 
 
 class TestTimelineDivergence:
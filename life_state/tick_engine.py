@@ -260,16 +260,17 @@ def get_world_summary(world: WorldState) -> Dict[str, Any]:
     total_actors = len(world.actors)
     
     # Count actors by state
+    counts = world.count_actors_by_state()
     for state in State:
         if is_core_state(state):
-            count = len(world.get_actors_in_state(state))
-            state_counts[state.name] = count
+            state_counts[state.name] = counts.get(state, 0)
     
     # Calculate average resources
     if total_actors > 0:
-        avg_hunger = sum(actor.hunger for actor in world.actors.values()) / total_actors
-        avg_fatigue = sum(actor.fatigue for actor in world.actors.values()) / total_actors
-        avg_mood = sum(actor.mood for actor in world.actors.values()) / total_actors
+        totals = world.get_resource_totals()
+        avg_hunger = totals['hunger'] / total_actors
+        avg_fatigue = totals['fatigue'] / total_actors
+        avg_mood = totals['mood'] / total_actors
     else:
         avg_hunger = avg_fatigue = avg_mood = 0.0
     
@@ -7,10 +7,11 @@ multi-world synchronization, and timeline management.
 
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
-from copy import deepcopy
 import uuid
 import logging
 
+from .models import Calendar
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -139,6 +140,44 @@ def calculate_time_jump_effects(actor, time_delta: timedelta) -> Dict[str, float
     return effects
 
 
+def share_world(src_world: 'WorldState', world_id: str) -> 'WorldState':
+    """
+    Copy a world, sharing everything the simulation treats as read-only.
+    
+    Actors are mutated field by field, so each one is copied shallowly (its
+    fields are immutable values) with a calendar list of its own. Locations
+    and the TimeBlocks inside calendars are never edited in place and are
+    shared with the source world instead of duplicated, so a fork costs one
+    record per actor rather than a deep copy of the whole world.
+    
+    Args:
+        src_world: The world to copy
+        world_id: ID for the copy; also set on every copied actor
+    
+    Returns:
+        New WorldState that can diverge from src_world independently
+    """
+    actors = {
+        actor_id: actor.model_copy(update={
+            'world_id': world_id,
+            'calendar': Calendar(actor.calendar),
+        })
+        for actor_id, actor in src_world.actors.items()
+    }
+    
+    # model_copy copies private attributes and bypasses __setattr__, so drop
+    # the snapshot record cached for the source world
+    for actor in actors.values():
+        actor.__pydantic_private__['_snapshot'] = None
+    
+    return src_world.model_copy(update={
+        'actors': actors,
+        'locations': dict(src_world.locations),
+        'clock': src_world.clock.model_copy(),
+        'world_id': world_id,
+    })
+
+
 def fork_world(src_world: 'WorldState', actor: 'Actor', target_time: datetime) -> 'WorldState':
     """
     Create a forked copy of the world for time-jumping.
@@ -154,19 +193,11 @@ def fork_world(src_world: 'WorldState', actor: 'Actor', target_time: datetime) -
     logger.info(f"Forking world {src_world.world_id} for actor {actor.name} jumping to {target_time}")
     
     try:
-        # Create a deep copy of the world (this is expensive but necessary)
         fork_id = f"{src_world.world_id}_fork_{uuid.uuid4().hex[:8]}"
         
-        # Pre-fork isolation: ensure we don't modify the original during copy
-        logger.debug("Creating deep copy of world state...")
-        forked_world = deepcopy(src_world)
-        
-        # Update world ID
-        forked_world.world_id = fork_id
-        
-        # Update all actors' world_id to maintain consistency
-        for forked_actor in forked_world.actors.values():
-            forked_actor.world_id = fork_id
+        # Pre-fork isolation: the fork gets its own actors, calendars and clock
+        logger.debug("Creating structurally shared copy of world state...")
+        forked_world = share_world(src_world, fork_id)
         
         # Adjust world clock to target time
         time_delta = target_time - src_world.clock.current_time
@@ -1,5 +1,27 @@
 import { useEffect, useRef, useState, useCallback } from 'react';
-import type { TickData, WebSocketMessage } from '../types';
+import type { Actor, CompactTickMessage, TickData, TickMessage, WebSocketMessage } from '../types';
+
+const expandTickMessage = (message: CompactTickMessage): TickMessage => ({
+  clock: message.t,
+  actors: message.a.map(([id, name, state, location, hunger, fatigue, mood]) => ({
+    id,
+    name,
+    state: message.k[state],
+    location: message.l[location],
+    hunger,
+    fatigue,
+    mood,
+  })),
+  world_stats: {
+    avg_hunger: message.s[0],
+    avg_fatigue: message.s[1],
+    avg_mood: message.s[2],
+    sleeping_cnt: message.s[3],
+    worlds_alive: message.s[4],
+  },
+  full: message.f,
+  removed: message.r,
+});
 
 interface UseWebSocketOptions {
   onMessage?: (data: TickData) => void;
@@ -41,6 +63,8 @@ export const useWebSocket = (
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
   const shouldReconnect = useRef(true);
+  // Latest known actors, merged from full ticks and deltas
+  const actorsRef = useRef<Map<string, Actor>>(new Map());
 
   const connect = useCallback(() => {
     if (wsRef.current?.readyState === WebSocket.OPEN) {
@@ -49,7 +73,7 @@ export const useWebSocket = (
 
     try {
       const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-      const wsUrl = `${protocol}//${window.location.host}/ws/worlds/${worldId}`;
+      const wsUrl = `${protocol}//${window.location.host}/ws/worlds/${worldId}?compact=1`;
       
       wsRef.current = new WebSocket(wsUrl);
 
@@ -63,7 +87,21 @@ export const useWebSocket = (
 
       wsRef.current.onmessage = (event) => {
         try {
-          const tickData: TickData = JSON.parse(event.data);
+          const message = expandTickMessage(JSON.parse(event.data) as CompactTickMessage);
+          if (message.full) {
+            actorsRef.current = new Map();
+          }
+          for (const actorId of message.removed ?? []) {
+            actorsRef.current.delete(actorId);
+          }
+          for (const actor of message.actors) {
+            actorsRef.current.set(actor.id, actor);
+          }
+          const tickData: TickData = {
+            clock: message.clock,
+            actors: Array.from(actorsRef.current.values()),
+            world_stats: message.world_stats,
+          };
           setData(tickData);
           onMessage?.(tickData);
         } catch (err) {
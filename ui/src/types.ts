@@ -22,6 +22,27 @@ export interface TickData {
   world_stats: WorldStats;
 }
 
+// WebSocket payload: a full tick, or a delta carrying only changed actors
+export interface TickMessage extends TickData {
+  full: boolean;
+  removed: string[];
+}
+
+// Compact WebSocket schema (requested with ?compact=1). Actor rows are
+// [id, name, stateIndex, locationIndex, hunger, fatigue, mood], indexing
+// the message's own k (state names) and l (location names) tables.
+export type CompactActorRow = [string, string, number, number, number, number, number];
+
+export interface CompactTickMessage {
+  t: string;
+  a: CompactActorRow[];
+  s: [number, number, number, number, number];
+  k: string[];
+  l: string[];
+  f: boolean;
+  r: string[];
+}
+
 export interface World {
   world_id: string;
   prob_mass: number;